@@ -22,10 +22,13 @@ Environment Variables Required:
 import asyncio
 import json
 import os
+import secrets
+import time
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 import httpx
+import numpy as np
 from dotenv import load_dotenv
 
 from livekit import agents, rtc
@@ -35,12 +38,33 @@ from livekit.agents import (
     AgentServer,
     ChatContext,
     ChatMessage,
+    JobProcess,
     RunContext,
     function_tool,
     room_io,
 )
-from livekit.plugins import noise_cancellation, silero
-from livekit.plugins.turn_detector.multilingual import MultilingualModel
+
+from compaction import ContextCompactor, context_tokens
+from gazetteer import DEFAULT_GAZETTEER_PATH, DEFAULT_LOCALITIES_PATH, Gazetteer, LocationMatch
+from health import JobReporter, JobReports, StatusServer, json_response, worker_health
+from listings import DEFAULT_LISTINGS_PATH, ListingIndex, normalize_property_type
+from memory_context import add_memory_block, build_memory_block
+from ranking import ListingRanker, RankingProfile
+from recall_cache import RecallCache
+from resilience import CortexGuard, CortexUnavailable
+from snapshot import load_listing_index, load_text_index
+from shared_models import shared_models
+from pipeline import FULL, PipelinePolicy, PipelineTier, noise_cancellation_filter
+from scraper import SITES, ListingCrawler, SiteUnavailable, filter_listings
+from spatial import DEFAULT_PLACES_PATH, GridIndex, NearTarget, PlaceIndex
+from prefetch import DetailPrefetcher, PropertyDetails
+from speculative import SpeculativeRecall
+from startup import import_voice_plugins, plugin_import_ms, profile_imports
+from streaming import narrate_tool_stream, run_with_filler
+from text_index import TextIndex, tokenize
+from tool_cache import ToolResultCache, make_key
+from tracing import SessionTrace, traced, worker_metrics
+from write_queue import WriteBehindQueue
 
 load_dotenv()
 
@@ -71,6 +95,102 @@ class HausConfig:
     tts: str = "cartesia/sonic-3:9626c31c-bec5-4cca-baa8-f8ba9e84c8bc"
     tts_voice: str = "coral"
 
+    # Cortex HTTP transport (one pool per worker process)
+    http2: bool = True
+    http_max_connections: int = 10
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 120.0
+    http_prewarm_connections: int = 2
+    # Longest a session's first Cortex calls wait for those connections
+    http_prewarm_wait: float = 0.5
+
+    # Cortex call deadlines (adaptive below these ceilings) and circuit breaker
+    cortex_timeout: float = 10.0
+    cortex_recall_budget: float = 1.0
+    cortex_breaker_failures: int = 5
+    cortex_breaker_reset: float = 15.0
+    cortex_hedge_recall: bool = True
+
+    # Speculative recall (start Cortex recall from interim transcripts)
+    speculative_recall: bool = True
+    speculative_reuse_threshold: float = 0.8
+
+    # Per-session recall cache
+    recall_cache_stable_ttl: float = 300.0
+    recall_cache_volatile_ttl: float = 60.0
+
+    # Token budget for the memory block injected each turn
+    memory_token_budget: int = 160
+
+    # Chat context compaction: once the context passes this many tokens (0
+    # disables), older turns are replaced by a rolling summary of at most
+    # context_summary_budget tokens, keeping the last context_keep_turns
+    context_token_threshold: int = 1500
+    context_keep_turns: int = 2
+    context_summary_budget: int = 250
+
+    # How long the greeting waits for the session-start profile recall
+    greeting_recall_timeout: float = 1.0
+
+    # Property catalogue (loaded into the listing index at prewarm)
+    listings_path: str = str(DEFAULT_LISTINGS_PATH)
+    listings_cache_dir: str | None = None
+    search_result_limit: int = 5
+    # Filter matches scored by the preference ranker before the top results are kept
+    search_candidate_limit: int = 5000
+
+    # Speak search results as they arrive, and a filler when a tool is
+    # slower than tool_filler_after seconds (0 disables the filler)
+    stream_tool_results: bool = False
+    tool_filler_after: float = 0.7
+
+    # Live listing crawler behind scrape_listings: connection pool, requests
+    # per second per host, result pages per suburb, crawl cache TTL, and a
+    # base URL overriding every site's (e.g. the local fixture site)
+    scrape_max_connections: int = 4
+    scrape_rate_per_host: float = 1.0
+    scrape_max_pages: int = 3
+    scrape_timeout: float = 8.0
+    scrape_cache_ttl: float = 900.0
+    scrape_site_url: str = ""
+
+    # Background detail prefetch for this many top search results (0 disables)
+    prefetch_top_k: int = 3
+
+    # Worker-level cache for search/detail tool lookups
+    tool_cache_max_entries: int = 512
+    tool_cache_ttl: float = 300.0
+
+    # Suburb gazetteer used to normalize spoken locations, and the full
+    # list of Australian localities merged into it
+    gazetteer_path: str = str(DEFAULT_GAZETTEER_PATH)
+    localities_path: str = str(DEFAULT_LOCALITIES_PATH)
+
+    # Points of interest for "near X" searches, the default radius, and
+    # how far a nearest-k search looks
+    places_path: str = str(DEFAULT_PLACES_PATH)
+    near_radius_km: float = 3.0
+    nearest_max_km: float = 50.0
+    default_state: str = "NSW"
+
+    # Worker status server (metrics/health), 0 disables it. It runs in the
+    # main worker process; job processes report to it every interval seconds
+    status_port: int = 8080
+    status_report_interval: float = 2.0
+    # Shared secret job processes send with their reports
+    status_report_token: str = ""
+
+    # Dispatch load: sessions per worker process counted as full load, and
+    # event-loop lag (ms) counted as full load
+    max_sessions_per_worker: int = 8
+    loop_lag_budget_ms: float = 100.0
+
+    # Pipeline tiers for new sessions under load: worker pressure (the
+    # dispatch load, 0-1) at which to drop to the reduced/minimal tier
+    pipeline_tiering: bool = True
+    pipeline_reduced_at: float = 0.6
+    pipeline_minimal_at: float = 0.85
+
     @classmethod
     def from_env(cls) -> "HausConfig":
         """Load configuration from environment variables"""
@@ -81,6 +201,52 @@ class HausConfig:
             convex_url=os.getenv("CONVEX_URL", os.getenv("NEXT_PUBLIC_CONVEX_URL", "")),
             openai_api_key=os.getenv("OPENAI_API_KEY", ""),
             elevenlabs_api_key=os.getenv("ELEVENLABS_API_KEY", ""),
+            http2=os.getenv("CORTEX_HTTP2", "1") != "0",
+            http_max_connections=int(os.getenv("CORTEX_MAX_CONNECTIONS", "10")),
+            http_prewarm_connections=int(os.getenv("CORTEX_PREWARM_CONNECTIONS", "2")),
+            http_prewarm_wait=float(os.getenv("CORTEX_PREWARM_WAIT", "0.5")),
+            cortex_timeout=float(os.getenv("CORTEX_TIMEOUT", "10")),
+            cortex_recall_budget=float(os.getenv("CORTEX_RECALL_BUDGET", "1.0")),
+            cortex_breaker_failures=int(os.getenv("CORTEX_BREAKER_FAILURES", "5")),
+            cortex_breaker_reset=float(os.getenv("CORTEX_BREAKER_RESET", "15")),
+            cortex_hedge_recall=os.getenv("CORTEX_HEDGE_RECALL", "1") != "0",
+            speculative_recall=os.getenv("HAUS_SPECULATIVE_RECALL", "1") != "0",
+            speculative_reuse_threshold=float(os.getenv("HAUS_SPECULATIVE_REUSE_THRESHOLD", "0.8")),
+            recall_cache_stable_ttl=float(os.getenv("HAUS_RECALL_CACHE_STABLE_TTL", "300")),
+            recall_cache_volatile_ttl=float(os.getenv("HAUS_RECALL_CACHE_VOLATILE_TTL", "60")),
+            memory_token_budget=int(os.getenv("HAUS_MEMORY_TOKEN_BUDGET", "160")),
+            context_token_threshold=int(os.getenv("HAUS_CONTEXT_TOKEN_THRESHOLD", "1500")),
+            context_keep_turns=int(os.getenv("HAUS_CONTEXT_KEEP_TURNS", "2")),
+            context_summary_budget=int(os.getenv("HAUS_CONTEXT_SUMMARY_BUDGET", "250")),
+            greeting_recall_timeout=float(os.getenv("HAUS_GREETING_RECALL_TIMEOUT", "1.0")),
+            listings_path=os.getenv("HAUS_LISTINGS_PATH", str(DEFAULT_LISTINGS_PATH)),
+            listings_cache_dir=os.getenv("HAUS_LISTINGS_CACHE_DIR") or None,
+            search_candidate_limit=int(os.getenv("HAUS_SEARCH_CANDIDATES", "5000")),
+            stream_tool_results=os.getenv("HAUS_STREAM_TOOL_RESULTS", "0") != "0",
+            tool_filler_after=float(os.getenv("HAUS_TOOL_FILLER_AFTER", "0.7")),
+            scrape_max_connections=int(os.getenv("HAUS_SCRAPE_MAX_CONNECTIONS", "4")),
+            scrape_rate_per_host=float(os.getenv("HAUS_SCRAPE_RATE", "1.0")),
+            scrape_max_pages=int(os.getenv("HAUS_SCRAPE_MAX_PAGES", "3")),
+            scrape_timeout=float(os.getenv("HAUS_SCRAPE_TIMEOUT", "8")),
+            scrape_cache_ttl=float(os.getenv("HAUS_SCRAPE_CACHE_TTL", "900")),
+            scrape_site_url=os.getenv("HAUS_SCRAPE_SITE_URL", ""),
+            prefetch_top_k=int(os.getenv("HAUS_PREFETCH_TOP_K", "3")),
+            tool_cache_max_entries=int(os.getenv("HAUS_TOOL_CACHE_SIZE", "512")),
+            tool_cache_ttl=float(os.getenv("HAUS_TOOL_CACHE_TTL", "300")),
+            gazetteer_path=os.getenv("HAUS_GAZETTEER_PATH", str(DEFAULT_GAZETTEER_PATH)),
+            localities_path=os.getenv("HAUS_LOCALITIES_PATH") or str(DEFAULT_LOCALITIES_PATH),
+            places_path=os.getenv("HAUS_PLACES_PATH", str(DEFAULT_PLACES_PATH)),
+            near_radius_km=float(os.getenv("HAUS_NEAR_RADIUS_KM", "3")),
+            nearest_max_km=float(os.getenv("HAUS_NEAREST_MAX_KM", "50")),
+            default_state=os.getenv("HAUS_DEFAULT_STATE", "NSW"),
+            status_port=int(os.getenv("HAUS_STATUS_PORT", "8080")),
+            status_report_interval=float(os.getenv("HAUS_STATUS_REPORT_INTERVAL", "2")),
+            status_report_token=os.getenv("HAUS_STATUS_REPORT_TOKEN", ""),
+            max_sessions_per_worker=int(os.getenv("HAUS_MAX_SESSIONS_PER_WORKER", "8")),
+            loop_lag_budget_ms=float(os.getenv("HAUS_LOOP_LAG_BUDGET_MS", "100")),
+            pipeline_tiering=os.getenv("HAUS_PIPELINE_TIERING", "1") != "0",
+            pipeline_reduced_at=float(os.getenv("HAUS_PIPELINE_REDUCED_AT", "0.6")),
+            pipeline_minimal_at=float(os.getenv("HAUS_PIPELINE_MINIMAL_AT", "0.85")),
         )
 
 
@@ -88,21 +254,200 @@ class HausConfig:
 # Convex/Cortex Client
 # =============================================================================
 
+def create_http_client(config: HausConfig) -> httpx.AsyncClient:
+    """Create the pooled HTTP/2 client shared by every session in a worker process"""
+    return httpx.AsyncClient(
+        http2=config.http2,
+        timeout=config.cortex_timeout,
+        limits=httpx.Limits(
+            max_connections=config.http_max_connections,
+            max_keepalive_connections=config.http_max_keepalive_connections,
+            keepalive_expiry=config.http_keepalive_expiry,
+        ),
+    )
+
+
+async def warm_http_client(http_client: httpx.AsyncClient, config: HausConfig) -> int:
+    """Open connections to Convex ahead of a session's first calls, return how many succeeded"""
+    base_url = config.convex_url.rstrip("/")
+    if not base_url or config.http_prewarm_connections <= 0:
+        return 0
+
+    async def _touch() -> bool:
+        try:
+            # Any response means the TCP+TLS handshake is done and the
+            # connection is parked in the keep-alive pool
+            await http_client.head(base_url, timeout=5.0)
+            return True
+        except Exception as e:
+            print(f"[ConvexClient] Failed to pre-open connection: {e}")
+            return False
+
+    results = await asyncio.gather(
+        *(_touch() for _ in range(config.http_prewarm_connections))
+    )
+    return sum(results)
+
+
+# Cortex deployments (base URLs) that lack the bulk remember endpoint,
+# shared by every ConvexClient in the process. prewarm probes for it, so
+# sessions don't each find out from a 404
+_no_bulk_remember: set[str] = set()
+
+
+def probe_bulk_remember(config: HausConfig, timeout: float = 2.0) -> bool | None:
+    """
+    Check (blocking, for prewarm) whether Cortex has the bulk remember
+    endpoint, with an empty batch that writes nothing. None when Cortex
+    can't be reached, in which case the first batch finds out.
+    """
+    base_url = config.convex_url.rstrip("/")
+    if not base_url:
+        return None
+    try:
+        response = httpx.post(f"{base_url}/api/cortex/remember-batch", json={"items": []}, timeout=timeout)
+    except httpx.HTTPError:
+        return None
+    if response.status_code == 404:
+        _no_bulk_remember.add(base_url)
+        return False
+    return True
+
+
+def create_cortex_guard(config: HausConfig) -> CortexGuard:
+    """Create the Cortex breaker/deadline state shared by every session in a worker process"""
+    return CortexGuard(
+        timeout=config.cortex_timeout,
+        recall_budget=config.cortex_recall_budget,
+        failure_threshold=config.cortex_breaker_failures,
+        reset_timeout=config.cortex_breaker_reset,
+        hedge_recall=config.cortex_hedge_recall,
+    )
+
+
+def empty_recall() -> dict[str, list]:
+    """Recall response used when Cortex is skipped or fails"""
+    return {
+        "memories": [],
+        "facts": [],
+        "propertyInteractions": [],
+        "suburbPreferences": [],
+    }
+
+
 class ConvexClient:
     """Client for calling Convex Cortex functions from the agent"""
 
-    def __init__(self, config: HausConfig):
+    def __init__(
+        self,
+        config: HausConfig,
+        http_client: httpx.AsyncClient | None = None,
+        trace: SessionTrace | None = None,
+        guard: CortexGuard | None = None,
+        gazetteer: Gazetteer | None = None,
+    ):
         self.config = config
         self.base_url = config.convex_url.rstrip("/")
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        self.trace = trace or SessionTrace("detached")
+        self.guard = guard or create_cortex_guard(config)
+        # Sessions borrow the worker's pooled client; only a client we
+        # created ourselves is closed in close()
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or create_http_client(config)
+        self.recall_cache = RecallCache(
+            stable_ttl=config.recall_cache_stable_ttl,
+            volatile_ttl=config.recall_cache_volatile_ttl,
+            locations=gazetteer.mentions if gazetteer is not None else None,
+        )
+        # Conversation writes go out in the background, batched
+        self.write_queue = WriteBehindQueue(self._send_remember_batch)
+
+    async def _post(
+        self, endpoint: str, payload: dict[str, Any], deadline: float | None = None
+    ) -> httpx.Response:
+        """
+        POST to a Cortex endpoint, timed as a cortex.<endpoint> span.
+
+        Raises CortexUnavailable when the circuit is open or the endpoint's
+        adaptive deadline passes; timeouts, transport errors and 5xx count
+        against the circuit breaker. Any other error gives back a half-open
+        probe without counting.
+        """
+        if not self.guard.breaker.allow():
+            raise CortexUnavailable(f"circuit open, skipped {endpoint}")
+        if deadline is None:
+            deadline = self.guard.deadline(endpoint)
+
+        start = time.perf_counter()
+        worker_health.cortex_inflight += 1
+        try:
+            response = await asyncio.wait_for(
+                self.http_client.post(f"{self.base_url}/api/cortex/{endpoint}", json=payload),
+                deadline,
+            )
+        except asyncio.TimeoutError:
+            self.guard.record_failure(endpoint, deadline)
+            raise CortexUnavailable(f"{endpoint} timed out after {deadline:.2f}s") from None
+        except httpx.TransportError:
+            self.guard.record_failure(endpoint)
+            raise
+        except asyncio.CancelledError:
+            self.guard.breaker.release()
+            raise
+        except Exception:
+            # Not a Cortex failure (e.g. a request that couldn't be built),
+            # but a half-open probe must not stay claimed
+            self.guard.breaker.release()
+            raise
+        finally:
+            worker_health.cortex_inflight -= 1
+            self.trace.record(f"cortex.{endpoint}", (time.perf_counter() - start) * 1000.0)
+
+        if response.status_code >= 500:
+            self.guard.record_failure(endpoint)
+        else:
+            self.guard.record_success(endpoint, time.perf_counter() - start)
+        return response
+
+    async def _hedged_post(self, endpoint: str, payload: dict[str, Any]) -> httpx.Response:
+        """
+        POST an idempotent request, sending a duplicate if the first is slower
+        than the endpoint's p95. The first good response wins; both requests
+        share the endpoint deadline.
+        """
+        deadline = self.guard.deadline(endpoint)
+        hedge_after = self.guard.hedge_delay(endpoint)
+        primary = asyncio.create_task(self._post(endpoint, payload, deadline))
+        if hedge_after is None or hedge_after >= deadline:
+            return await primary
+
+        # Whatever ends this call (a winner, an error or the caller being
+        # cancelled, even before the hedge), no request is left running
+        pending = {primary}
+        last_error: BaseException | None = None
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge_after)
+            if done:
+                return primary.result()
+
+            self.trace.record(f"cortex.{endpoint}.hedged", hedge_after * 1000.0)
+            pending.add(asyncio.create_task(self._post(endpoint, payload, deadline - hedge_after)))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                    elif not task.result().is_error or not pending:
+                        return task.result()
+            raise last_error or CortexUnavailable(f"{endpoint} failed")
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def ensure_memory_space(self, user_id: str) -> str | None:
         """Ensure user has a memory space, return the ID"""
         try:
-            response = await self.http_client.post(
-                f"{self.base_url}/api/cortex/ensure-memory-space",
-                json={"userId": user_id},
-            )
+            response = await self._post("ensure-memory-space", {"userId": user_id})
             response.raise_for_status()
             data = response.json()
             return data.get("memorySpaceId")
@@ -114,25 +459,30 @@ class ConvexClient:
         self, user_id: str, query: str, limit: int = 10
     ) -> dict[str, Any]:
         """Recall relevant context from Cortex memory"""
+        cached = self.recall_cache.get(user_id, query, limit)
+        if cached is not None:
+            return cached
+
+        # Don't spend the turn waiting on a Cortex that is known to be down
+        if self.guard.breaker.is_open:
+            return empty_recall()
+
         try:
-            response = await self.http_client.post(
-                f"{self.base_url}/api/cortex/recall",
-                json={
+            response = await self._hedged_post(
+                "recall",
+                {
                     "userId": user_id,
                     "query": query,
                     "limit": limit,
                 },
             )
             response.raise_for_status()
-            return response.json()
+            result = response.json()
+            self.recall_cache.put(user_id, query, limit, result)
+            return result
         except Exception as e:
             print(f"[ConvexClient] Failed to recall context: {e}")
-            return {
-                "memories": [],
-                "facts": [],
-                "propertyInteractions": [],
-                "suburbPreferences": [],
-            }
+            return empty_recall()
 
     async def remember_conversation(
         self,
@@ -143,10 +493,12 @@ class ConvexClient:
         property_context: dict[str, Any] | None = None,
     ) -> bool:
         """Store conversation in Cortex memory"""
+        # New memories and interactions make cached volatile recall stale
+        self.recall_cache.invalidate(user_id, stable=False)
         try:
-            response = await self.http_client.post(
-                f"{self.base_url}/api/cortex/remember",
-                json={
+            response = await self._post(
+                "remember",
+                {
                     "userId": user_id,
                     "userQuery": user_query,
                     "agentResponse": agent_response,
@@ -160,6 +512,46 @@ class ConvexClient:
             print(f"[ConvexClient] Failed to remember conversation: {e}")
             return False
 
+    def queue_conversation(
+        self,
+        user_id: str,
+        user_query: str,
+        agent_response: str,
+        property_id: str | None = None,
+        property_context: dict[str, Any] | None = None,
+    ) -> None:
+        """Store conversation in Cortex memory without waiting for the write"""
+        self.recall_cache.invalidate(user_id, stable=False)
+        self.write_queue.enqueue({
+            "userId": user_id,
+            "userQuery": user_query,
+            "agentResponse": agent_response,
+            "propertyId": property_id,
+            "propertyContext": property_context,
+        })
+
+    async def _send_remember_batch(
+        self, items: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Send queued conversation writes, return the ones that failed"""
+        if self.base_url not in _no_bulk_remember:
+            response = await self._post("remember-batch", {"items": items})
+            if response.status_code != 404:
+                response.raise_for_status()
+                return []
+            # Older deployments only expose the single-item endpoint
+            _no_bulk_remember.add(self.base_url)
+
+        responses = await asyncio.gather(
+            *(self._post("remember", item) for item in items),
+            return_exceptions=True,
+        )
+        return [
+            item
+            for item, response in zip(items, responses)
+            if isinstance(response, BaseException) or response.is_error
+        ]
+
     async def store_preference(
         self,
         user_id: str,
@@ -169,10 +561,12 @@ class ConvexClient:
         metadata: dict[str, Any] | None = None,
     ) -> bool:
         """Store a user preference in Cortex"""
+        # Preferences feed facts and suburb scores
+        self.recall_cache.invalidate(user_id, volatile=False)
         try:
-            response = await self.http_client.post(
-                f"{self.base_url}/api/cortex/store-preference",
-                json={
+            response = await self._post(
+                "store-preference",
+                {
                     "userId": user_id,
                     "category": category,
                     "preference": preference,
@@ -187,8 +581,10 @@ class ConvexClient:
             return False
 
     async def close(self):
-        """Close the HTTP client"""
-        await self.http_client.aclose()
+        """Flush queued writes and close the HTTP client (a shared worker client stays open)"""
+        await self.write_queue.drain()
+        if self._owns_http_client:
+            await self.http_client.aclose()
 
 
 # =============================================================================
@@ -202,12 +598,70 @@ class HausAgent(Agent):
         self,
         config: HausConfig,
         convex: ConvexClient,
+        listings: ListingIndex,
+        gazetteer: Gazetteer,
         user_id: str,
         initial_ctx: ChatContext | None = None,
+        tool_cache: ToolResultCache | None = None,
+        tier: PipelineTier = FULL,
+        crawler: ListingCrawler | None = None,
+        text_index: TextIndex | None = None,
+        geo: GridIndex | None = None,
+        places: PlaceIndex | None = None,
     ):
         self.config = config
         self.convex = convex
+        self.listings = listings
+        self.gazetteer = gazetteer
         self.user_id = user_id
+        self.tool_cache = tool_cache or ToolResultCache(
+            max_entries=config.tool_cache_max_entries,
+            ttl=config.tool_cache_ttl,
+        )
+        self.ranker = ListingRanker(listings)
+        # Full-text index over listing descriptions and features
+        self.text_index = text_index or load_text_index(listings)
+        # Spatial grid over listing coordinates, and points of interest
+        self.geo = geo or GridIndex(listings.lat, listings.lon)
+        self.places = places or PlaceIndex.load(config.places_path)
+        # Worker's live listing crawler (scrape_listings is unavailable without one)
+        self.crawler = crawler
+        # Pipeline tier assigned at session start (recall limit, memory budget)
+        self.tier = tier
+        # Latest Cortex recall, used to rank search results for this user
+        self.recalled_context: dict[str, Any] = {}
+        self.trace = convex.trace
+
+        # Details of the top search results, loaded before the user asks
+        self.prefetcher = (
+            DetailPrefetcher(self._load_details, generation=lambda: self.tool_cache.generation)
+            if config.prefetch_top_k > 0
+            else None
+        )
+
+        # Rolling summary replacing older turns once the context grows
+        self.compactor = (
+            ContextCompactor(
+                token_threshold=config.context_token_threshold,
+                keep_turns=config.context_keep_turns,
+                summary_token_budget=config.context_summary_budget,
+                pinned_ids=[item.id for item in initial_ctx.items] if initial_ctx else (),
+            )
+            if config.context_token_threshold > 0
+            else None
+        )
+        self._compaction_task: asyncio.Task | None = None
+
+        # Recall started from interim transcripts, resolved at end of turn
+        self.speculative_recall = (
+            SpeculativeRecall(
+                self._recall,
+                reuse_threshold=config.speculative_reuse_threshold,
+                locations=gazetteer.mentions,
+            )
+            if config.speculative_recall
+            else None
+        )
 
         # Build initial instructions with memory context
         instructions = self._build_instructions()
@@ -235,116 +689,435 @@ Key Guidelines:
 6. Keep responses concise - voice conversations should be brief
 
 Property Search Parameters to Collect:
-- Location (suburbs, regions)
+- Location (suburbs, regions), or a landmark to be near ("near the beach", "within 5 km of the CBD")
 - Budget/price range
 - Property type (house, apartment, townhouse)
 - Bedrooms/bathrooms
 - Parking requirements
-- Special requirements (pets, pool, etc.)
+- Special requirements (pets, pool, etc.) - pass these to search_properties as keywords
 
 When you find a property that might interest them, mention the key details clearly.
 If you don't have enough information to search, ask for more details. Use scrape_listings(query, site='domain') to scrape live listings from websites like domain.com.au when internal search is insufficient."""
 
+    async def _recall(self, query: str) -> dict[str, Any]:
+        """Recall Cortex context for a query on behalf of this session's user"""
+        return await self.convex.recall_context(
+            user_id=self.user_id,
+            query=query,
+            limit=self.tier.recall_limit,
+        )
+
     async def on_user_turn_completed(
         self, turn_ctx: ChatContext, new_message: ChatMessage
     ) -> None:
         """Called after user finishes speaking - inject memory context before LLM response"""
-        # Recall relevant context from Cortex based on user's query
-        context = await self.convex.recall_context(
-            user_id=self.user_id,
-            query=new_message.text_content or "",
-            limit=10,
+        # Recall relevant context from Cortex based on user's query, reusing
+        # the speculative recall started during end-of-turn detection
+        query = new_message.text_content or ""
+        with self.trace.span("turn.recall"):
+            if self.speculative_recall is not None:
+                context = await self.speculative_recall.resolve(query)
+            else:
+                context = await self._recall(query)
+        self.recalled_context = context
+
+        # Merge preferences, facts and interactions into one ranked block
+        # under the token budget. turn_ctx is this turn's copy of the chat
+        # context, so the block goes out with this reply only
+        block = build_memory_block(
+            context, query, self.tier.memory_token_budget(self.config.memory_token_budget)
+        )
+        add_memory_block(turn_ctx, block)
+
+    def schedule_compaction(self) -> None:
+        """Compact the chat context in the background, between turns, if it has grown too large"""
+        if self.compactor is None:
+            return
+        if self._compaction_task is not None and not self._compaction_task.done():
+            return
+        self._compaction_task = asyncio.create_task(self._compact_context())
+
+    def cancel_compaction(self) -> None:
+        if self._compaction_task is not None:
+            self._compaction_task.cancel()
+
+    async def _compact_context(self) -> None:
+        # Built synchronously from one snapshot, so no turn interleaves
+        started = time.perf_counter()
+        chat_ctx = self.chat_ctx
+        compacted = self.compactor.compact(chat_ctx)
+        if compacted is None:
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        await self.update_chat_ctx(compacted)
+        self.trace.record("context.compaction", elapsed_ms)
+        print(
+            f"[HAUS Agent] Compacted chat context: {context_tokens(chat_ctx)} -> "
+            f"{context_tokens(compacted)} tokens in {elapsed_ms:.1f} ms"
         )
-
-        # Inject suburb preferences as context
-        if context.get("suburbPreferences"):
-            prefs = context["suburbPreferences"][:5]  # Top 5
-            pref_summary = ", ".join([
-                f"{p['suburbName']} (score: {p['preferenceScore']})"
-                for p in prefs
-            ])
-            turn_ctx.add_message(
-                role="assistant",
-                content=f"User's suburb preferences: {pref_summary}"
-            )
-
-        # Inject learned facts
-        if context.get("facts"):
-            facts = context["facts"][:5]  # Top 5 facts
-            for fact in facts:
-                turn_ctx.add_message(
-                    role="assistant",
-                    content=f"Remembered: {fact['fact']} (confidence: {fact['confidence']}%)"
-                )
-
-        # Inject recent property interactions
-        if context.get("propertyInteractions"):
-            interactions = context["propertyInteractions"][:3]
-            for interaction in interactions:
-                turn_ctx.add_message(
-                    role="assistant",
-                    content=f"User recently viewed: {interaction['propertyId']} ({interaction['interactionType']})"
-                )
 
     @function_tool()
+    @traced("tool.search_properties")
     async def search_properties(
         self,
         context: RunContext,
-        location: str,
+        location: str = "",
         budget_min: int | None = None,
         budget_max: int | None = None,
         bedrooms: int | None = None,
         property_type: str | None = None,
+        keywords: str | None = None,
+        near: str | None = None,
+        radius_km: float | None = None,
+        nearest: int | None = None,
     ) -> str:
         """
         Search for properties matching the user's criteria.
 
         Args:
-            location: Preferred suburb or region (e.g., "Bondi", "Eastern Suburbs")
+            location: Preferred suburb or region (e.g., "Bondi", "Eastern Suburbs"); empty for anywhere
             budget_min: Minimum budget in AUD
             budget_max: Maximum budget in AUD
             bedrooms: Number of bedrooms required
             property_type: Type of property (house, apartment, townhouse)
+            keywords: Features the user asked for, in their words (e.g., "ocean views, pool, north facing")
+            near: Landmark or kind of place to be close to (e.g., "the CBD", "the beach", "Central station")
+            radius_km: Maximum distance from `near` in km (walking distance is about 1)
+            nearest: Return this many listings closest to `near` instead of the best matches
 
         Returns:
             A summary of available properties matching the criteria.
         """
-        # In production, this would call the actual property search API
-        # For now, return a mock response
-        results = [
-            {
-                "id": "prop-001",
-                "address": f"{bedrooms or 3} Bedroom {property_type or 'House'} in {location}",
-                "price": budget_max or 1500000,
-                "bedrooms": bedrooms or 3,
-                "bathrooms": 2,
-                "description": "Modern property with great natural light",
-            },
-            {
-                "id": "prop-002",
-                "address": f"{bedrooms or 2} Bedroom Apartment in {location}",
-                "price": (budget_max or 1000000) - 200000,
-                "bedrooms": bedrooms or 2,
-                "bathrooms": 1,
-                "description": "Recently renovated with new kitchen",
-            },
-        ]
+        say = getattr(context.session, "say", None)
+        spoken, remaining = await narrate_tool_stream(
+            self._search_stream(
+                location,
+                budget_min,
+                budget_max,
+                bedrooms,
+                property_type,
+                keywords,
+                near,
+                radius_km,
+                nearest,
+            ),
+            say=say,
+            narrate=2 if self.config.stream_tool_results else 0,
+            filler_after=self.config.tool_filler_after,
+        )
+        if spoken:
+            return f'You have already told the user: "{spoken.strip()}" Don\'t repeat it.\n{remaining}'
+        return remaining
 
-        # Store this search as a property interaction
+    async def _search_stream(
+        self,
+        location: str,
+        budget_min: int | None,
+        budget_max: int | None,
+        bedrooms: int | None,
+        property_type: str | None,
+        keywords: str | None = None,
+        near: str | None = None,
+        radius_km: float | None = None,
+        nearest: int | None = None,
+    ) -> AsyncIterator[str]:
+        """search_properties output in speaking order: count, top match, the rest"""
+        location = (location or "").strip()
+        match = self.gazetteer.resolve(location, default_state=self.config.default_state)
+        place = match.label or location
+        # An empty location means anywhere (e.g. a keywords-only search)
+        suburbs = self._listing_suburbs(location, match) if location else None
+        property_type = normalize_property_type(property_type)
+        terms = sorted(set(tokenize(keywords or "")))
+        limit = self.config.search_candidate_limit
+
+        target = self._resolve_near(near) if near else None
+        if near and target is None:
+            yield f"I'm not sure where {near} is. Could you give me a suburb or a landmark nearby?"
+            return
+        nearest = max(1, min(int(nearest), 10)) if nearest else None
+        if target is not None and not nearest and radius_km is None:
+            radius_km = self.config.near_radius_km
+
+        def _filters(rows: np.ndarray) -> np.ndarray:
+            return self.listings.matches(rows, suburbs, budget_min, budget_max, bedrooms, property_type)
+
+        def _search() -> tuple[np.ndarray, np.ndarray | None, np.ndarray | None]:
+            distances = None
+            if target is None:
+                # With keywords, filter everything and keep the best text
+                # matches (in price order) rather than the cheapest filter matches
+                rows = self.listings.search(
+                    suburbs=suburbs,
+                    price_min=budget_min,
+                    price_max=budget_max,
+                    bedrooms=bedrooms,
+                    property_type=property_type,
+                    limit=None if terms else limit,
+                )
+            elif nearest:
+                rows, distances = self.geo.nearest(
+                    target.points,
+                    nearest if not terms else limit,
+                    max_km=self.config.nearest_max_km if radius_km is None else radius_km,
+                    where=_filters,
+                )
+            else:
+                rows, distances = self.geo.within(target.points, radius_km)
+                keep = _filters(rows)
+                rows, distances = rows[keep], distances[keep]
+
+            text_scores = None
+            if terms:
+                text_scores = self.text_index.score_rows(" ".join(terms), rows)
+                keep = np.flatnonzero(text_scores > 0)
+                if len(keep) > limit:
+                    keep = np.sort(keep[np.argpartition(-text_scores[keep], limit - 1)[:limit]])
+                rows, text_scores = rows[keep], text_scores[keep]
+                distances = None if distances is None else distances[keep]
+            elif distances is not None and len(rows) > limit:
+                # Keep the closest candidates, in row (price) order
+                keep = np.sort(np.argpartition(distances, limit - 1)[:limit])
+                rows, distances = rows[keep], distances[keep]
+            return rows, text_scores, distances
+
+        # Candidates are shared by every session (keyed on the resolved
+        # suburbs, so "paddo" and "Paddington" share an entry); ranking is
+        # per user. The search runs in a thread so the event loop stays
+        # free to speak the filler if it is slow
+        candidates, text_scores, distances = await self.tool_cache.get_or_compute(
+            make_key(
+                "search_properties",
+                suburbs=suburbs,
+                budget_min=budget_min,
+                budget_max=budget_max,
+                bedrooms=bedrooms,
+                property_type=property_type,
+                terms=terms,
+                near=target.label if target is not None else None,
+                radius_km=radius_km,
+                nearest=nearest,
+                limit=limit,
+            ),
+            lambda: asyncio.to_thread(_search),
+            tags=("search",),
+        )
+
+        where_parts = []
+        if suburbs is not None and place:
+            where_parts.append(f"in {place}")
+        if target is not None:
+            where_parts.append(target.nearest_phrase() if nearest else target.within_phrase(radius_km))
+        if keywords and terms:
+            where_parts.append(f"with {keywords.strip()}")
+        where = " ".join(where_parts)
+
+        # The count is known once the candidates are, so it can be spoken
+        # while the results are ranked and formatted
+        count = min(len(candidates), nearest or self.config.search_result_limit)
+        async for chunk in self._count_chunks(count, where):
+            yield chunk
+        if not count:
+            return
+        # Let the speech pipeline pick up the count before ranking
+        await asyncio.sleep(0)
+
+        with self.trace.span("search.rank"):
+            if nearest and distances is not None:
+                # Asked for the closest, so distance order
+                top = np.argsort(distances, kind="stable")[:nearest]
+            else:
+                proximity = None
+                if distances is not None:
+                    proximity = np.clip(1.0 - distances / max(radius_km, 1e-3), 0.0, 1.0)
+                top = self.ranker.top_positions(
+                    candidates,
+                    RankingProfile.from_recall(self.listings, self.recalled_context),
+                    k=self.config.search_result_limit,
+                    budget_min=budget_min,
+                    budget_max=budget_max,
+                    bedrooms=bedrooms,
+                    text_scores=text_scores,
+                    proximity=proximity,
+                )
+        results = []
+        for position in top:
+            summary = self.listings.summary(candidates[position])
+            if distances is not None:
+                summary["distance_km"] = round(float(distances[position]), 2)
+            results.append(summary)
+
+        async for chunk in self._detail_chunks(results, f"Search for properties {where}", target=target):
+            yield chunk
+
+    def _resolve_near(self, near: str) -> NearTarget | None:
+        """A landmark or kind of place, else the centre of a suburb's listings"""
+        target = self.places.resolve(near)
+        if target is not None:
+            return target
+        match = self.gazetteer.resolve(near, default_state=self.config.default_state)
+        rows = self.listings.search(suburbs=self._listing_suburbs(near, match))
+        centre = self.geo.centroid(rows) if len(rows) else None
+        if centre is None:
+            return None
+        return NearTarget(match.label or near, np.array([centre]))
+
+    async def _result_chunks(
+        self,
+        results: list[dict[str, Any]],
+        where: str,
+        user_query: str,
+        target: NearTarget | None = None,
+    ) -> AsyncIterator[str]:
+        """Search results in speaking order, recording each as a property interaction"""
+        async for chunk in self._count_chunks(len(results), where):
+            yield chunk
+        if results:
+            async for chunk in self._detail_chunks(results, user_query, target):
+                yield chunk
+
+    async def _count_chunks(self, count: int, where: str) -> AsyncIterator[str]:
+        """The opening of a search answer: how many results, or none"""
+        where = f" {where}" if where else ""
+        if not count:
+            yield (
+                f"I couldn't find any properties{where} matching those criteria. "
+                f"Try a nearby suburb or a wider budget."
+            )
+            return
+        yield f"Found {count} properties{where}. "
+
+    async def _detail_chunks(
+        self,
+        results: list[dict[str, Any]],
+        user_query: str,
+        target: NearTarget | None = None,
+    ) -> AsyncIterator[str]:
+        """The top match and listing lines, after the count; records each result as an interaction"""
+        # Scraped listings may not give a bedroom count
+        top = results[0]
+        if top["bedrooms"] is None:
+            yield f"The top match is at {_price_text(top['price'])}. "
+        else:
+            yield f"The top match is a {top['bedrooms']} bedroom at {_price_text(top['price'])}. "
+
+        # Store this search as a property interaction (written in the background)
+        agent_response = json.dumps({"results": results})
         for prop in results:
-            await self.convex.remember_conversation(
+            self.convex.queue_conversation(
                 user_id=self.user_id,
-                user_query=f"Search for properties in {location}",
-                agent_response=json.dumps({"results": results}),
+                user_query=user_query,
+                agent_response=agent_response,
                 property_id=prop["id"],
                 property_context=prop,
             )
+        # The next question is usually about one of these
+        if self.prefetcher is not None:
+            self.prefetcher.schedule(prop["id"] for prop in results[: self.config.prefetch_top_k])
+
+        listing_lines = "\n".join(
+            f"- {prop['id']}: {prop['address']}, {_price_text(prop['price'])}, {prop['bedrooms'] or '?'} bed"
+            + (f", {target.distance_phrase(prop['distance_km'])}" if target and "distance_km" in prop else "")
+            for prop in results
+        )
+        yield f"Would you like more details about any of these?\n{listing_lines}"
+
+    @function_tool()
+    @traced("tool.scrape_listings")
+    async def scrape_listings(
+        self,
+        context: RunContext,
+        query: str,
+        site: str = "domain",
+        budget_min: int | None = None,
+        budget_max: int | None = None,
+        bedrooms: int | None = None,
+    ) -> str:
+        """
+        Scrape live listings from a property website when internal search is insufficient.
 
-        return f"Found {len(results)} properties in {location}. "
-        f"The top match is a {results[0]['bedrooms']} bedroom at ${results[0]['price']:,}. "
-        f"Would you like more details about any of these?"
+        Args:
+            query: Suburb or region to look up (e.g., "Bondi", "Inner West")
+            site: Listing site to scrape: "domain" (domain.com.au) or "realestate" (realestate.com.au)
+            budget_min: Minimum budget in AUD
+            budget_max: Maximum budget in AUD
+            bedrooms: Number of bedrooms required
+
+        Returns:
+            A summary of live listings, in the same form as search_properties.
+        """
+        say = getattr(context.session, "say", None)
+        spoken, remaining = await narrate_tool_stream(
+            self._scrape_stream(query, site, budget_min, budget_max, bedrooms),
+            say=say,
+            narrate=2 if self.config.stream_tool_results else 0,
+            filler_after=self.config.tool_filler_after,
+        )
+        if spoken:
+            return f'You have already told the user: "{spoken.strip()}" Don\'t repeat it.\n{remaining}'
+        return remaining
+
+    async def _scrape_stream(
+        self,
+        query: str,
+        site: str,
+        budget_min: int | None,
+        budget_max: int | None,
+        bedrooms: int | None,
+    ) -> AsyncIterator[str]:
+        """scrape_listings output in speaking order, like _search_stream"""
+        site = site.strip().lower().removeprefix("www.").split(".")[0]
+        if self.crawler is None or site not in SITES:
+            yield (
+                f"Live listings aren't available from {site or 'that site'} right now. "
+                f"I can search our own listings instead."
+            )
+            return
+
+        match = self.gazetteer.resolve(query, default_state=self.config.default_state)
+        place = match.label or query
+        # A named suburb, or the first few suburbs of a region
+        targets = [match.primary] if match.primary is not None else match.suburbs[:3]
+        if not targets:
+            yield f"I couldn't work out which suburb {query} is. Could you say the suburb name?"
+            return
+
+        batches = await asyncio.gather(
+            *(
+                self.crawler.search(site, suburb.name, suburb.state, suburb.postcode)
+                for suburb in targets
+            ),
+            return_exceptions=True,
+        )
+        for batch in batches:
+            if isinstance(batch, BaseException) and not isinstance(batch, SiteUnavailable):
+                raise batch
+        if all(isinstance(batch, SiteUnavailable) for batch in batches):
+            yield (
+                f"I couldn't reach {site} just now, so I don't have live listings for {place}. "
+                f"Please try again in a minute, or I can search our own listings instead."
+            )
+            return
+        results = filter_listings(
+            [record for batch in batches if not isinstance(batch, BaseException) for record in batch],
+            budget_min,
+            budget_max,
+            bedrooms,
+        )[: self.config.search_result_limit]
+
+        async for chunk in self._result_chunks(results, f"in {place}", f"Scrape {site} listings in {place}"):
+            yield chunk
+
+    def _listing_suburbs(self, location: str, match: LocationMatch) -> list[str]:
+        """Listing-index suburb names covered by a resolved location"""
+        if match.is_region:
+            return [suburb.name for suburb in match.suburbs]
+        if match.primary is not None:
+            return self.listings.suburbs_matching(match.primary.name)
+        return self.listings.suburbs_matching(location)
 
     @function_tool()
+    @traced("tool.remember_preference")
     async def remember_preference(
         self,
         context: RunContext,
@@ -370,12 +1143,24 @@ If you don't have enough information to search, ask for more details. Use scrape
         }
 
         if category == "suburb":
-            # Parse suburb name and state
-            parts = preference.split(", ")
-            suburb = parts[0]
-            state = parts[1] if len(parts) > 1 else "NSW"
-            metadata["suburbName"] = suburb
-            metadata["state"] = state
+            # Resolve the spoken suburb/region against the gazetteer so
+            # "paddo" and "Paddington" land on the same preference
+            match = self.gazetteer.resolve(preference, default_state=self.config.default_state)
+            if match.primary is not None:
+                preference = match.primary.label
+                metadata["suburbName"] = match.primary.name
+                metadata["state"] = match.primary.state
+                if match.primary.postcode:
+                    metadata["postcode"] = match.primary.postcode
+            elif match.is_region and match.suburbs:
+                preference = match.label
+                metadata["suburbName"] = match.label
+                metadata["state"] = match.suburbs[0].state
+                metadata["suburbs"] = [suburb.name for suburb in match.suburbs]
+            else:
+                parts = preference.split(", ")
+                metadata["suburbName"] = parts[0]
+                metadata["state"] = parts[1] if len(parts) > 1 else self.config.default_state
             metadata["reason"] = "User stated this directly"
 
         success = await self.convex.store_preference(
@@ -393,6 +1178,7 @@ If you don't have enough information to search, ask for more details. Use scrape
             return "I had trouble saving that preference, but I'll keep it in mind for this conversation."
 
     @function_tool()
+    @traced("tool.get_property_details")
     async def get_property_details(
         self,
         context: RunContext,
@@ -407,87 +1193,374 @@ If you don't have enough information to search, ask for more details. Use scrape
         Returns:
             Detailed property information including address, price, features, etc.
         """
-        # Mock property details - in production, fetch from actual API
-        properties = {
-            "prop-001": {
-                "id": "prop-001",
-                "address": "42 Ocean Street, Bondi Beach NSW 2026",
-                "price": 1500000,
-                "bedrooms": 3,
-                "bathrooms": 2,
-                "parking": 1,
-                "landsize": "450m²",
-                "year": 2020,
-                "features": ["Ocean views", "Modern kitchen", "Air conditioning", "Close to beach"],
-                "description": "Stunning modern home with breathtaking ocean views. Recently renovated with premium finishes throughout.",
-            },
-            "prop-002": {
-                "id": "prop-002",
-                "address": "15 Beach Road, Bondi Beach NSW 2026",
-                "price": 800000,
-                "bedrooms": 2,
-                "bathrooms": 1,
-                "parking": 1,
-                "landsize": "120m²",
-                "year": 2019,
-                "features": ["New kitchen", "Floorboards", "North facing"],
-                "description": "Chic apartment in prime location, moments from the beach.",
-            },
-        }
-
-        prop = properties.get(property_id)
-        if not prop:
+        property_id = property_id.strip()
+
+        details = await self.prefetcher.get(property_id) if self.prefetcher is not None else None
+        if details is None:
+            details = await run_with_filler(
+                self._load_details(property_id),
+                getattr(context.session, "say", None),
+                self.config.tool_filler_after,
+            )
+        if details is None:
             return f"Sorry, I couldn't find details for property {property_id}."
 
-        # Track this property view
-        await self.convex.remember_conversation(
-            user_id=self.user_id,
-            user_query=f"Get details for {property_id}",
-            agent_response=json.dumps(prop),
-            property_id=property_id,
-            property_context=prop,
-        )
+        # Track this property view (written in the background)
+        if not details.scraped:
+            self.convex.queue_conversation(
+                user_id=self.user_id,
+                user_query=f"Get details for {property_id}",
+                agent_response=json.dumps(details.record),
+                property_id=property_id,
+                property_context=details.record,
+            )
+        return details.text
+
+    async def _load_details(self, property_id: str) -> PropertyDetails | None:
+        """Full record and detail text for a listing (indexed or scraped)"""
+
+        async def _details() -> dict[str, Any] | None:
+            # Off the event loop, so run_with_filler can time the lookup
+            return await asyncio.to_thread(self.listings.get, property_id)
+
+        # Listings found by scrape_listings come from the crawler's records
+        scraped = self.crawler.get(property_id) if self.crawler is not None else None
+        if scraped is not None:
+            return PropertyDetails(
+                scraped,
+                f"{scraped['address']}\n"
+                f"Price: {_price_text(scraped['price'])}\n"
+                f"{scraped['bedrooms'] or '?'} bed, {scraped['bathrooms'] or '?'} bath\n\n"
+                f"{scraped['description']}\n"
+                f"Listed on {scraped['source']}: {scraped['url']}",
+                scraped=True,
+            )
 
-        details = (
+        prop = await self.tool_cache.get_or_compute(
+            make_key("get_property_details", property_id=property_id),
+            _details,
+            tags=(f"property:{property_id}",),
+        )
+        if not prop:
+            return None
+        return PropertyDetails(
+            prop,
             f"{prop['address']}\n"
             f"Price: ${prop['price']:,}\n"
             f"{prop['bedrooms']} bed, {prop['bathrooms']} bath, {prop['parking']} parking\n"
             f"Built: {prop['year']}\n\n"
             f"Features: {', '.join(prop['features'][:3])}\n\n"
-            f"{prop['description']}"
+            f"{prop['description']}",
         )
-        return details
 
 
 # =============================================================================
 # Agent Server
 # =============================================================================
 
+# Recall query for the session-start profile (suburb preferences and facts)
+PROFILE_QUERY = "user profile: suburb preferences, budget, property requirements"
+
+
+async def _await_profile(task: asyncio.Task, timeout: float) -> dict[str, Any]:
+    """Wait up to timeout for the profile recall; greet generically if it's late"""
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), timeout)
+    except asyncio.TimeoutError:
+        print(f"[HAUS Agent] Profile recall not back after {timeout}s, greeting without it")
+        return {}
+
+
+def _price_text(price: int | None) -> str:
+    """Spoken price for a listing (scraped listings may not publish one)"""
+    return "price on request" if price is None else f"${price:,}"
+
+
+def greeting_instructions(profile: dict[str, Any], config: HausConfig) -> str:
+    """Greeting instructions, folding in what we remember about a returning user"""
+    instructions = (
+        "Greet the user warmly, mention you're HAUS their property assistant, "
+        "and ask what they're looking for. Keep it brief and conversational."
+    )
+    memory = build_memory_block(
+        {key: profile.get(key) for key in ("suburbPreferences", "facts")},
+        "",
+        config.memory_token_budget,
+    )
+    if not memory:
+        return instructions
+    return (
+        f"{instructions}\n\nThis is a returning user. You remember:\n{memory}\n"
+        "Welcome them back and mention one relevant preference naturally."
+    )
+
+
 server = AgentServer()
 
-# Global configuration and client (initialized in prewarm)
+# The report token is made here, as the main process imports this module
+# and before it starts any job process, so job processes inherit it
+if not os.getenv("HAUS_STATUS_REPORT_TOKEN"):
+    os.environ["HAUS_STATUS_REPORT_TOKEN"] = secrets.token_urlsafe(32)
+
+# Main worker process: configuration, status server and job reports
 _config: HausConfig | None = None
+_status_server: StatusServer | None = None
+_job_reports: JobReports | None = None
+
+# Job process: the JobProcess.userdata prewarm filled, for the hooks and
+# reports that run outside a job context
+_userdata: dict[str, Any] | None = None
+
+
+def create_crawler(config: HausConfig) -> ListingCrawler:
+    """Live listing crawler shared by every session in a worker process"""
+    return ListingCrawler(
+        max_connections=config.scrape_max_connections,
+        rate_per_host=config.scrape_rate_per_host,
+        max_pages=config.scrape_max_pages,
+        timeout=config.scrape_timeout,
+        cache_ttl=config.scrape_cache_ttl,
+        site_url=config.scrape_site_url or None,
+    )
+
+
+def create_pipeline_policy(config: HausConfig, reporter: JobReporter | None = None) -> PipelinePolicy:
+    """Tier policy for new sessions, driven by the worker load the main process replies to reports with"""
+    return PipelinePolicy(
+        worker_health,
+        reduced_at=config.pipeline_reduced_at,
+        minimal_at=config.pipeline_minimal_at,
+        enabled=config.pipeline_tiering,
+        worker_load=reporter.current_worker_load if reporter is not None else None,
+    )
+
+
+def invalidate_listings(property_ids: list[str] | None = None) -> int:
+    """
+    Listing-update hook: drop cached tool results a catalogue change affects.
+
+    With property_ids, drops those properties' details and every cached
+    search (a changed price or new listing can move any result set);
+    without, drops everything. Returns the number of entries dropped.
+    """
+    tool_cache: ToolResultCache | None = (_userdata or {}).get("tool_cache")
+    if tool_cache is None:
+        return 0
+    if property_ids is None:
+        return tool_cache.invalidate()
+    return tool_cache.invalidate(["search", *(f"property:{pid}" for pid in property_ids)])
+
+
+def reindex_listing_text(records: list[dict[str, Any]]) -> int:
+    """
+    Listing-update hook for the full-text index: re-index the description
+    and features of changed listings already in the listing index, and
+    drop cached results they affect. Returns the number re-indexed.
+    """
+    text_index: TextIndex | None = (_userdata or {}).get("text_index")
+    listings: ListingIndex | None = (_userdata or {}).get("listings")
+    if text_index is None or listings is None:
+        return 0
+    updated = []
+    for record in records:
+        row = listings.row_for_id(record["id"])
+        if row is not None:
+            text_index.update(row, record)
+            updated.append(record["id"])
+    if updated:
+        invalidate_listings(updated)
+    return len(updated)
+
+
+def configure_worker_health(config: HausConfig) -> None:
+    """Apply the dispatch load budgets to this process's health state"""
+    worker_health.max_sessions = config.max_sessions_per_worker
+    worker_health.lag_budget_ms = config.loop_lag_budget_ms
+    worker_health.inflight_budget = config.http_max_connections
+
+
+def _worker_load(worker: AgentServer) -> float:
+    """
+    Load reported to LiveKit for job dispatch.
+
+    Runs in the main worker process, which owns the job list; once this
+    crosses the server's load_threshold the worker stops accepting jobs.
+    In-flight Cortex requests and event-loop lag come from the job
+    processes' reports, with the main process's own loop lag.
+    """
+    global _config
+    if _config is None:
+        _config = HausConfig.from_env()
+    configure_worker_health(_config)
+    if _job_reports is None:
+        return worker_health.load(active_sessions=len(worker.active_jobs))
+    return _job_reports.load(active_sessions=len(worker.active_jobs))
+
+
+server.load_fnc = _worker_load
+
+
+def _job_pids(worker: AgentServer) -> set[int]:
+    """
+    PIDs of the worker's job processes (spawning, idle or running a job),
+    the only processes whose reports are accepted. Thread executors run
+    jobs in this process.
+    """
+    pool = getattr(worker, "_proc_pool", None)
+    executors = pool.processes if pool is not None else []
+    return {getattr(proc, "pid", None) or os.getpid() for proc in executors}
+
+
+@server.on("worker_started")
+def start_status_server() -> None:
+    """
+    Serve worker status from the main process, which outlives every job,
+    and start its loop-lag monitor for the dispatch load.
+
+    Job processes report to POST /report (see create_job_reporter), which
+    only takes loopback reports carrying the worker's report token from
+    its own job processes; the per-component routes return each live job
+    process's snapshot by PID.
+    """
+    global _config, _status_server, _job_reports
+    if _config is None:
+        _config = HausConfig.from_env()
+    # The main process's own loop lag feeds the dispatch load
+    configure_worker_health(_config)
+    worker_health.loop_lag.start()
+    if _status_server is not None or not _config.status_port:
+        return
+    _job_reports = JobReports(
+        worker_health,
+        stale_after=max(3 * _config.status_report_interval, 5.0),
+        token=_config.status_report_token,
+        job_pids=lambda: _job_pids(server),
+    )
+    _status_server = StatusServer(port=_config.status_port)
+    _job_reports.install_routes(_status_server)
+    for component in ("cortex", "pipeline", "scraper", "models"):
+        _status_server.route(f"/{component}", lambda name=component: json_response(_job_reports.components(name)))
+    asyncio.create_task(_status_server.start())
+
+
+def _process_report() -> dict[str, Any]:
+    """This job process's counters and component snapshots, for the main process"""
+    userdata = _userdata or {}
+    return {
+        "ready": worker_health.ready,
+        "startup_ms": worker_health.startup_ms,
+        "active_sessions": worker_health.active_sessions,
+        "cortex_inflight": worker_health.cortex_inflight,
+        "loop_lag_ms": round(worker_health.loop_lag.lag_ms, 2),
+        "rss_mb": round(worker_health.rss_bytes() / 1e6, 1),
+        "cortex": userdata["cortex_guard"].snapshot() if "cortex_guard" in userdata else None,
+        "pipeline": userdata["pipeline_policy"].snapshot() if "pipeline_policy" in userdata else None,
+        "scraper": userdata["crawler"].stats() if "crawler" in userdata else None,
+        "models": {**shared_models.report(), "plugin_import_ms": plugin_import_ms},
+    }
+
+
+def create_job_reporter(config: HausConfig) -> JobReporter | None:
+    """Reporter from this job process to the main process's status server (None if disabled)"""
+    if not config.status_port:
+        return None
+    return JobReporter(
+        f"http://127.0.0.1:{config.status_port}/report",
+        worker_metrics,
+        _process_report,
+        interval=config.status_report_interval,
+        token=config.status_report_token,
+    )
+
+
+def prewarm(proc: JobProcess) -> None:
+    """
+    Load the shared VAD, listing index, search indexes and gazetteer, and
+    build the process's shared clients, into proc.userdata.
+
+    Runs once per job process before its event loop starts, so nothing
+    here may need a running loop; the Cortex pool is warmed by the session
+    instead, before its first Cortex calls.
+    """
+    global _userdata
+    userdata = proc.userdata
+    config = userdata["config"] = HausConfig.from_env()
+    configure_worker_health(config)
+
+    # Voice plugins are only imported in job processes, here. One VAD per
+    # process is shared by every session; the turn detector needs a job
+    # context and is built by the first session
+    print("[HAUS Agent] Loading model files...")
+    plugins_ms = import_voice_plugins()
+    shared_models.load_vad()
+    print(f"[HAUS Agent] Model files loaded (plugin imports {plugins_ms:.0f} ms)")
 
+    listings = userdata["listings"] = load_listing_index(config.listings_path, config.listings_cache_dir)
+    print(f"[HAUS Agent] Listing index mapped ({len(listings)} listings)")
 
-@server.prewarm()
-async def load_model_files():
-    """Download required model files (VAD, turn detector)"""
-    from livekit.plugins import silero
-    from livekit.plugins.turn_detector.multilingual import MultilingualModel
+    started = time.perf_counter()
+    text_index = userdata["text_index"] = load_text_index(listings)
+    print(
+        f"[HAUS Agent] Full-text index loaded ({text_index.vocabulary_size} terms) "
+        f"in {(time.perf_counter() - started) * 1000.0:.0f} ms"
+    )
 
-    print("[HAUS Agent] Loading model files...")
-    await silero.VAD.load()
-    await MultilingualModel.load()
-    print("[HAUS Agent] Model files loaded")
+    geo = userdata["geo"] = GridIndex(listings.lat, listings.lon)
+    places = userdata["places"] = PlaceIndex.load(config.places_path)
+    print(f"[HAUS Agent] Spatial index built ({len(geo)} located listings, {len(places)} places)")
+
+    gazetteer = userdata["gazetteer"] = Gazetteer.load(config.gazetteer_path, config.localities_path)
+    print(f"[HAUS Agent] Gazetteer built ({len(gazetteer)} suburbs)")
+
+    userdata["http_client"] = create_http_client(config)
+    userdata["tool_cache"] = ToolResultCache(
+        max_entries=config.tool_cache_max_entries,
+        ttl=config.tool_cache_ttl,
+    )
+    userdata["cortex_guard"] = create_cortex_guard(config)
+    if probe_bulk_remember(config) is False:
+        print("[HAUS Agent] Cortex has no remember-batch endpoint; conversation writes go one at a time")
+    userdata["job_reporter"] = reporter = create_job_reporter(config)
+    userdata["pipeline_policy"] = create_pipeline_policy(config, reporter)
+    userdata["crawler"] = create_crawler(config)
+    _userdata = userdata
+
+    worker_health.mark_ready()
+    print(f"[HAUS Agent] Ready {worker_health.startup_ms:.0f} ms after process start")
+
+    # The main process reports /ready once a job process has
+    if reporter is not None and not reporter.send():
+        print("[HAUS Agent] Status server not reachable; job reports will retry")
+
+
+server.setup_fnc = prewarm
+
+
+def _log_pool_warm(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is None:
+        print(f"[HAUS Agent] Cortex connection pool ready ({task.result()} pre-opened)")
 
 
 @server.rtc_session()
 async def haus_agent(ctx: agents.JobContext):
     """Main entry point for HAUS voice agent"""
-    global _config
-
-    if _config is None:
-        _config = HausConfig.from_env()
+    userdata = ctx.proc.userdata
+    if "config" not in userdata:
+        prewarm(ctx.proc)
+    config: HausConfig = userdata["config"]
+    http_client: httpx.AsyncClient = userdata["http_client"]
+
+    # Loop-bound work prewarm can't do: the lag monitor, and pre-opening
+    # Cortex connections. A job process runs one session, so the pool is
+    # cold here; the warm-up starts first and the first Cortex calls wait
+    # for it (bounded) instead of each opening a connection of their own
+    worker_health.loop_lag.start()
+    pool_warm = asyncio.create_task(warm_http_client(http_client, config))
+    pool_warm.add_done_callback(_log_pool_warm)
+
+    async def _after_pool_warm(call: Callable[[], Awaitable[Any]]) -> Any:
+        await asyncio.wait({pool_warm}, timeout=config.http_prewarm_wait)
+        return await call()
 
     # Extract user ID from job metadata or participant identity
     job_metadata = json.loads(ctx.job.metadata) if ctx.job.metadata else {}
@@ -495,17 +1568,60 @@ async def haus_agent(ctx: agents.JobContext):
 
     print(f"[HAUS Agent] Starting session for user: {user_id}")
 
-    # Initialize Convex client
-    convex = ConvexClient(_config)
+    # Initialize Convex client on the worker's pooled transport. The session
+    # outlives this entrypoint, so the client (and its write queue) is
+    # closed on job shutdown rather than when this function returns.
+    trace = worker_metrics.session(ctx.job.id)
+    # Cheaper pipeline for new sessions while the worker is under pressure.
+    # Reporting now gets the main process's current load in reply (a local
+    # round trip), since this process's own counters have barely started
+    reporter: JobReporter | None = userdata["job_reporter"]
+    if reporter is not None:
+        await reporter.send_async()
+    tier = userdata["pipeline_policy"].select(ctx.job.id)
+    worker_health.session_started()
+    convex = ConvexClient(
+        config,
+        http_client=http_client,
+        trace=trace,
+        guard=userdata["cortex_guard"],
+        gazetteer=userdata["gazetteer"],
+    )
+    ctx.add_shutdown_callback(convex.close)
+
+    async def _end_trace() -> None:
+        worker_metrics.end_session(ctx.job.id)
+        worker_health.session_ended()
+
+    ctx.add_shutdown_callback(_end_trace)
+
+    # Report to the main process while the job runs, and once more (with
+    # this session ended) as it shuts down
+    if reporter is not None:
+        reporter.start()
+        ctx.add_shutdown_callback(reporter.stop)
+
+    # Provision the memory space and recall the user's profile while the
+    # session is built and joins the room; only the greeting waits on them
+    session_started_at = time.perf_counter()
+    space_task = asyncio.create_task(_after_pool_warm(lambda: convex.ensure_memory_space(user_id)))
+    profile_task = asyncio.create_task(
+        _after_pool_warm(
+            lambda: convex.recall_context(user_id=user_id, query=PROFILE_QUERY, limit=tier.recall_limit)
+        )
+    )
 
-    try:
-        # Ensure user has a memory space
-        memory_space_id = await convex.ensure_memory_space(user_id)
-        if memory_space_id:
-            print(f"[HAUS Agent] Using memory space: {memory_space_id}")
+    def _log_memory_space(task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        if task.result():
+            print(f"[HAUS Agent] Using memory space: {task.result()}")
         else:
             print("[HAUS Agent] Warning: Could not ensure memory space")
 
+    space_task.add_done_callback(_log_memory_space)
+
+    try:
         # Build initial context with memory
         initial_ctx = ChatContext()
         initial_ctx.add_message(
@@ -516,54 +1632,95 @@ async def haus_agent(ctx: agents.JobContext):
 
         # Create the agent
         agent = HausAgent(
-            config=_config,
+            config=config,
             convex=convex,
+            listings=userdata["listings"],
+            gazetteer=userdata["gazetteer"],
             user_id=user_id,
             initial_ctx=initial_ctx,
+            tool_cache=userdata["tool_cache"],
+            tier=tier,
+            crawler=userdata["crawler"],
+            text_index=userdata["text_index"],
+            geo=userdata["geo"],
+            places=userdata["places"],
         )
 
-        # Configure the voice pipeline
+        # Configure the voice pipeline on the process's shared models
+        vad, turn_detector = shared_models.for_session(turn_detector=tier.turn_detector)
         session = AgentSession(
-            stt=_config.stt,
-            llm=_config.llm,
-            tts=_config.tts,
-            vad=silero.VAD.load(),
-            turn_detection=MultilingualModel(),
+            stt=config.stt,
+            llm=config.llm,
+            tts=config.tts,
+            vad=vad,
+            turn_detection=turn_detector or "vad",
         )
 
+        # STT/LLM/TTS stage latencies come from the framework's metrics events
+        session.on("metrics_collected", trace.on_metrics_collected)
+
+        # Start recall from interim transcripts while the turn detector decides
+        if agent.speculative_recall is not None:
+            speculative_recall = agent.speculative_recall
+            session.on(
+                "user_input_transcribed",
+                lambda ev: speculative_recall.on_transcript(ev.transcript, ev.is_final),
+            )
+            session.on("close", lambda ev: speculative_recall.cancel())
+        if agent.prefetcher is not None:
+            prefetcher = agent.prefetcher
+            session.on("close", lambda ev: prefetcher.cancel())
+
+        # Compact the chat context once the agent has answered, while the
+        # user is still taking in the reply
+        if agent.compactor is not None:
+            session.on(
+                "agent_state_changed",
+                lambda ev: agent.schedule_compaction() if ev.new_state == "listening" else None,
+            )
+            session.on("close", lambda ev: agent.cancel_compaction())
+
         # Start the session
         await session.start(
             room=ctx.room,
             agent=agent,
             room_options=room_io.RoomOptions(
                 audio_input=room_io.AudioInputOptions(
-                    noise_cancellation=lambda params: (
-                        noise_cancellation.BVCTelephony()
-                        if params.participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP
-                        else noise_cancellation.BVC()
+                    noise_cancellation=lambda params: noise_cancellation_filter(
+                        tier,
+                        is_sip=params.participant.kind == rtc.ParticipantKind.PARTICIPANT_KIND_SIP,
                     )
                 ),
             ),
         )
 
-        # Generate initial greeting
-        await session.generate_reply(
-            instructions="Greet the user warmly, mention you're HAUS their property assistant, "
-            "and ask what they're looking for. Keep it brief and conversational."
-        )
+        # Generate initial greeting, personalized if the profile recall is in
+        profile = await _await_profile(profile_task, config.greeting_recall_timeout)
+        if profile and not agent.recalled_context:
+            agent.recalled_context = profile
+        trace.record("session.greeting_ready", (time.perf_counter() - session_started_at) * 1000.0)
+        await session.generate_reply(instructions=greeting_instructions(profile, config))
 
         print("[HAUS Agent] Session started successfully")
 
     except Exception as e:
+        space_task.cancel()
+        profile_task.cancel()
         print(f"[HAUS Agent] Error during session: {e}")
         raise
-    finally:
-        await convex.close()
 
 
 if __name__ == "__main__":
     import sys
 
+    if sys.argv[1:2] == ["profile-imports"]:
+        profile_imports(sys.argv[2:])
+        sys.exit(0)
+
+    # Model downloads are registered by the plugins on import
+    if sys.argv[1:2] == ["download-files"]:
+        import_voice_plugins()
+
     # Check required environment variables
     config = HausConfig.from_env()
     missing = []
@@ -0,0 +1,310 @@
+"""
+HAUS Voice Agent - Offline Benchmark
+
+Runs scripted HausAgent turns and tool calls headlessly against the local
+Cortex stand-in. STT is simulated by replaying interim transcripts into
+the speculative recall, the turn detector by a fixed end-of-utterance
+delay, and the LLM by a script of tool calls; TTS is not exercised. What
+is measured is the latency our code adds between the end of the user's
+turn and the LLM having its context and tool results.
+
+Usage (from packages/backend/agent-worker):
+
+    uv run python -m bench.agent_bench --sessions 20 --repeat 3
+    uv run python -m bench.agent_bench --cortex-latency-ms 150 --error-rate 0.05
+    uv run python -m bench.agent_bench --json bench_results.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from livekit.agents import ChatContext, ChatMessage  # noqa: E402
+
+from agent import (  # noqa: E402
+    ConvexClient,
+    HausAgent,
+    HausConfig,
+    create_cortex_guard,
+    create_http_client,
+)
+from resilience import CortexGuard  # noqa: E402
+from bench.fake_cortex import FakeCortexServer, FaultProfile  # noqa: E402
+from gazetteer import Gazetteer  # noqa: E402
+from snapshot import load_listing_index  # noqa: E402
+from tool_cache import ToolResultCache  # noqa: E402
+from tracing import Histogram, WorkerMetrics  # noqa: E402
+
+# (utterance, tool name or None, tool kwargs) - what the stubbed LLM does each turn
+DEFAULT_SCRIPT: list[tuple[str, str | None, dict[str, Any]]] = [
+    ("Hi, I'm looking for a place in Bondi", "search_properties", {"location": "Bondi"}),
+    (
+        "What about three bedrooms under two million",
+        "search_properties",
+        {"location": "Bondi", "bedrooms": 3, "budget_max": 2_000_000},
+    ),
+    ("Tell me more about the first one", "get_property_details", {"property_id": "prop-001"}),
+    (
+        "I really like Paddington too",
+        "remember_preference",
+        {"category": "suburb", "preference": "paddo"},
+    ),
+    (
+        "Show me apartments in paddo",
+        "search_properties",
+        {"location": "paddo", "property_type": "apartment"},
+    ),
+    (
+        "How about the eastern suburbs under one and a half million",
+        "search_properties",
+        {"location": "eastern suburbs", "budget_max": 1_500_000},
+    ),
+    (
+        "Anything there with ocean views and a pool",
+        "search_properties",
+        {"location": "eastern suburbs", "keywords": "ocean views, pool"},
+    ),
+    ("Thanks, that's all for now", None, {}),
+]
+
+
+@dataclass
+class BenchOptions:
+    """Benchmark knobs"""
+
+    sessions: int = 10
+    repeat: int = 1
+    interim_ms: float = 120.0
+    eou_ms: float = 300.0
+    speculative: bool = True
+    faults: FaultProfile = field(default_factory=FaultProfile)
+
+
+@dataclass
+class BenchResult:
+    """Aggregated benchmark results"""
+
+    turns: int = 0
+    turn_overhead: Histogram = field(default_factory=Histogram)
+    wall_seconds: float = 0.0
+    cortex_requests: int = 0
+    cortex_errors: int = 0
+    stages: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "turns": self.turns,
+            "turn_overhead_ms": self.turn_overhead.summary(),
+            "throughput_turns_per_s": round(self.turns / self.wall_seconds, 2) if self.wall_seconds else 0.0,
+            "cortex_requests": self.cortex_requests,
+            "cortex_requests_per_turn": round(self.cortex_requests / self.turns, 2) if self.turns else 0.0,
+            "cortex_errors": self.cortex_errors,
+            "wall_seconds": round(self.wall_seconds, 2),
+            "stages": self.stages,
+        }
+
+
+class SimulatedSession:
+    """One headless voice session driving a HausAgent through a script"""
+
+    def __init__(
+        self,
+        session_id: str,
+        config: HausConfig,
+        http_client: Any,
+        listings: Any,
+        gazetteer: Gazetteer,
+        metrics: WorkerMetrics,
+        options: BenchOptions,
+        tool_cache: ToolResultCache | None = None,
+        guard: CortexGuard | None = None,
+    ):
+        self.options = options
+        self.trace = metrics.session(session_id)
+        self.convex = ConvexClient(
+            config, http_client=http_client, trace=self.trace, guard=guard, gazetteer=gazetteer
+        )
+        self.agent = HausAgent(
+            config=config,
+            convex=self.convex,
+            listings=listings,
+            gazetteer=gazetteer,
+            user_id=f"bench-{session_id}",
+            tool_cache=tool_cache,
+        )
+        self.chat_ctx = ChatContext()
+        self.run_ctx = SimpleNamespace(session=SimpleNamespace(chat_context=[]))
+
+    async def start(self) -> None:
+        await self.convex.ensure_memory_space(self.agent.user_id)
+
+    async def turn(self, utterance: str, tool: str | None, kwargs: dict[str, Any]) -> float:
+        """Play one user turn, return the ms our code added after end of turn"""
+        await self._speak(utterance)
+
+        message = ChatMessage(role="user", content=[utterance])
+        self.run_ctx.session.chat_context.append(message)
+
+        start = time.perf_counter()
+        await self.agent.on_user_turn_completed(self.chat_ctx, message)
+        if tool is not None:
+            await getattr(self.agent, tool)(self.run_ctx, **kwargs)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+        self.trace.record("bench.turn_overhead", elapsed_ms)
+        return elapsed_ms
+
+    async def close(self) -> None:
+        if self.agent.prefetcher is not None:
+            self.agent.prefetcher.cancel()
+        await self.convex.close()
+
+    async def _speak(self, utterance: str) -> None:
+        """Replay interim transcripts word by word, then wait out end-of-turn detection"""
+        speculative = self.agent.speculative_recall
+        words = utterance.split()
+        for count in range(1, len(words) + 1):
+            if speculative is not None:
+                speculative.on_transcript(" ".join(words[:count]), count == len(words))
+            await asyncio.sleep(self.options.interim_ms / 1000.0)
+        await asyncio.sleep(self.options.eou_ms / 1000.0)
+
+
+def bench_config(cortex_url: str, speculative: bool = True) -> HausConfig:
+    """HausConfig for headless runs against a local Cortex stand-in"""
+    config = HausConfig.from_env()
+    config.convex_url = cortex_url
+    config.speculative_recall = speculative
+    config.status_port = 0
+    config.http_prewarm_connections = 0
+    return config
+
+
+async def run_benchmark(
+    options: BenchOptions,
+    script: list[tuple[str, str | None, dict[str, Any]]] = DEFAULT_SCRIPT,
+) -> BenchResult:
+    """Run options.sessions concurrent sessions through the script"""
+    result = BenchResult()
+    metrics = WorkerMetrics()
+
+    async with FakeCortexServer(options.faults) as cortex:
+        config = bench_config(cortex.url, options.speculative)
+        http_client = create_http_client(config)
+        listings = load_listing_index(config.listings_path, config.listings_cache_dir)
+        gazetteer = Gazetteer.load(config.gazetteer_path, config.localities_path)
+        tool_cache = ToolResultCache(config.tool_cache_max_entries, config.tool_cache_ttl)
+        guard = create_cortex_guard(config)
+
+        async def _session(index: int) -> None:
+            session = SimulatedSession(
+                f"s{index}",
+                config,
+                http_client,
+                listings,
+                gazetteer,
+                metrics,
+                options,
+                tool_cache,
+                guard,
+            )
+            try:
+                await session.start()
+                for _ in range(options.repeat):
+                    for utterance, tool, kwargs in script:
+                        result.turn_overhead.record(await session.turn(utterance, tool, kwargs))
+                        result.turns += 1
+            finally:
+                await session.close()
+                metrics.sessions.pop(session.trace.session_id, None)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(_session(i) for i in range(options.sessions)))
+        result.wall_seconds = time.perf_counter() - start
+
+        await http_client.aclose()
+        result.cortex_requests = cortex.total_requests
+        result.cortex_errors = sum(cortex.errors.values())
+        result.stages = metrics.summary()["stages"]
+
+    return result
+
+
+def print_report(result: BenchResult, options: BenchOptions) -> None:
+    data = result.to_dict()
+    overhead = data["turn_overhead_ms"]
+    print(
+        f"\nHAUS agent benchmark: {options.sessions} sessions x {options.repeat} "
+        f"script runs, speculative recall {'on' if options.speculative else 'off'}, "
+        f"Cortex {options.faults.latency_ms:.0f}±{options.faults.jitter_ms:.0f} ms, "
+        f"error rate {options.faults.error_rate:.0%}"
+    )
+    print(
+        f"  turn overhead  p50 {overhead['p50']:.1f} ms  p95 {overhead['p95']:.1f} ms  "
+        f"p99 {overhead['p99']:.1f} ms  (n={overhead['count']})"
+    )
+    print(
+        f"  cortex         {data['cortex_requests']} requests, "
+        f"{data['cortex_requests_per_turn']} per turn, {data['cortex_errors']} injected errors"
+    )
+    print(f"  throughput     {data['throughput_turns_per_s']} turns/s over {data['wall_seconds']} s")
+    print("\n  stage                              p50      p95      p99    count")
+    for stage, summary in data["stages"].items():
+        print(
+            f"  {stage:32} {summary['p50']:8.2f} {summary['p95']:8.2f} "
+            f"{summary['p99']:8.2f} {summary['count']:8d}"
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> tuple[BenchOptions, str | None]:
+    parser = argparse.ArgumentParser(description="Offline HAUS agent benchmark")
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent simulated sessions")
+    parser.add_argument("--repeat", type=int, default=1, help="script runs per session")
+    parser.add_argument("--interim-ms", type=float, default=120.0, help="gap between interim transcripts")
+    parser.add_argument("--eou-ms", type=float, default=300.0, help="simulated end-of-turn detection delay")
+    parser.add_argument("--no-speculative", action="store_true", help="disable speculative recall")
+    parser.add_argument("--cortex-latency-ms", type=float, default=40.0)
+    parser.add_argument("--cortex-jitter-ms", type=float, default=15.0)
+    parser.add_argument("--recall-latency-ms", type=float, default=None, help="override recall latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of Cortex requests that 500")
+    parser.add_argument("--json", dest="json_path", default=None, help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    faults = FaultProfile(
+        latency_ms=args.cortex_latency_ms,
+        jitter_ms=args.cortex_jitter_ms,
+        error_rate=args.error_rate,
+    )
+    if args.recall_latency_ms is not None:
+        faults.endpoint_latency_ms["recall"] = args.recall_latency_ms
+
+    options = BenchOptions(
+        sessions=args.sessions,
+        repeat=args.repeat,
+        interim_ms=args.interim_ms,
+        eou_ms=args.eou_ms,
+        speculative=not args.no_speculative,
+        faults=faults,
+    )
+    return options, args.json_path
+
+
+def main(argv: list[str] | None = None) -> None:
+    options, json_path = parse_args(argv)
+    result = asyncio.run(run_benchmark(options))
+    print_report(result, options)
+    if json_path:
+        Path(json_path).write_text(json.dumps(result.to_dict(), indent=2))
+        print(f"\nWrote {json_path}")
+
+
+if __name__ == "__main__":
+    main()
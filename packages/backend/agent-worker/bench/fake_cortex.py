@@ -0,0 +1,153 @@
+"""
+HAUS Voice Agent - Local Cortex Stand-in
+
+Asyncio HTTP/1.1 server implementing the Cortex endpoints ConvexClient
+calls, with configurable latency, jitter and error injection. Used by
+the benchmark and load-test harnesses so they run fully offline.
+"""
+
+import asyncio
+import json
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+CANNED_RECALL = {
+    "memories": [
+        {"content": "User asked about 3 bedroom houses in Bondi", "importance": 70},
+        {"content": "User mentioned a budget around $2M", "importance": 60},
+    ],
+    "facts": [
+        {"fact": "User prefers north-facing homes", "confidence": 85},
+        {"fact": "User has a dog", "confidence": 90},
+        {"fact": "User works in the CBD", "confidence": 75},
+    ],
+    "propertyInteractions": [
+        {"propertyId": "prop-001", "interactionType": "viewed"},
+        {"propertyId": "prop-002", "interactionType": "saved"},
+    ],
+    "suburbPreferences": [
+        {"suburbName": "Bondi", "state": "NSW", "preferenceScore": 85},
+        {"suburbName": "Paddington", "state": "NSW", "preferenceScore": 70},
+        {"suburbName": "Parramatta", "state": "NSW", "preferenceScore": -60},
+    ],
+}
+
+
+@dataclass
+class FaultProfile:
+    """Latency and error injection for the fake server"""
+
+    latency_ms: float = 40.0
+    jitter_ms: float = 15.0
+    error_rate: float = 0.0
+    # Per-endpoint overrides, e.g. {"recall": 120.0}
+    endpoint_latency_ms: dict[str, float] = field(default_factory=dict)
+    # Endpoints that always 404 (e.g. "remember-batch" on an old deployment)
+    missing_endpoints: set[str] = field(default_factory=set)
+
+
+class FakeCortexServer:
+    """Local Cortex HTTP stand-in"""
+
+    def __init__(self, faults: FaultProfile | None = None, host: str = "127.0.0.1", port: int = 0):
+        self.faults = faults or FaultProfile()
+        self.host = host
+        self.port = port
+        self.requests: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.remembered = 0
+        self._server: asyncio.base_events.Server | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    async def start(self) -> "FakeCortexServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "FakeCortexServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # Keep-alive loop so pooled clients reuse connections as they would
+        # against Convex
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+                content_length = 0
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        content_length = int(value.strip())
+                body = await reader.readexactly(content_length) if content_length else b""
+
+                status, payload = await self._respond(method, path, body)
+                data = json.dumps(payload).encode()
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                        "Content-Type: application/json\r\n"
+                        f"Content-Length: {len(data)}\r\n"
+                        "Connection: keep-alive\r\n\r\n"
+                    ).encode("latin-1")
+                    + data
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method: str, path: str, body: bytes) -> tuple[int, dict[str, Any]]:
+        endpoint = path.rsplit("/api/cortex/", 1)[-1] if "/api/cortex/" in path else path
+        self.requests[endpoint] += 1
+
+        latency = self.faults.endpoint_latency_ms.get(endpoint, self.faults.latency_ms)
+        jitter = random.uniform(-self.faults.jitter_ms, self.faults.jitter_ms)
+        await asyncio.sleep(max(0.0, latency + jitter) / 1000.0)
+
+        if method != "POST" or "/api/cortex/" not in path or endpoint in self.faults.missing_endpoints:
+            return 404, {"error": "not found"}
+        if random.random() < self.faults.error_rate:
+            self.errors[endpoint] += 1
+            return 500, {"error": "injected failure"}
+
+        request = json.loads(body or b"{}")
+        if endpoint == "ensure-memory-space":
+            return 200, {"memorySpaceId": f"space-{request.get('userId', 'anonymous')}"}
+        if endpoint == "recall":
+            limit = int(request.get("limit", 10))
+            return 200, {key: items[:limit] for key, items in CANNED_RECALL.items()}
+        if endpoint == "remember":
+            self.remembered += 1
+            return 200, {"success": True}
+        if endpoint == "remember-batch":
+            self.remembered += len(request.get("items", []))
+            return 200, {"success": True}
+        if endpoint == "store-preference":
+            return 200, {"success": True, "factId": "fact-bench"}
+        return 404, {"error": "unknown endpoint"}
@@ -0,0 +1,205 @@
+"""
+HAUS Voice Agent - Local Listing Site Stand-in
+
+Asyncio HTTP/1.1 server serving listing-site search pages built from the
+fixture catalogue, with schema.org JSON-LD markup the crawler parses. It
+answers both URL schemes in scraper.SITES (domain's /sale/<slug>/?page=N
+and realestate's /buy/in-<slug>/list-N) and a robots.txt, with
+configurable latency.
+
+Running the module crawls it cold and then warm, and prints fetch and
+cache counts:
+
+    uv run python -m bench.fake_listing_site --suburb "Bondi Beach" --postcode 2026
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from collections import Counter
+from html import escape
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote_plus
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scraper import SITES, ListingCrawler  # noqa: E402
+
+FIXTURE_PATH = Path(__file__).resolve().parent.parent / "fixtures" / "listings.json"
+
+ROBOTS_TXT = "User-agent: *\nDisallow: /private/\n"
+
+_SEARCH_PATHS = (
+    re.compile(r"^/sale/(?P<slug>[^/?]+)/?(?:\?page=(?P<page>\d+))?$"),
+    re.compile(r"^/buy/in-(?P<slug>[^/?]+)/list-(?P<page>\d+)$"),
+)
+
+SCHEMA_TYPES = {"house": "House", "apartment": "Apartment", "townhouse": "SingleFamilyResidence"}
+
+
+def _slug_key(slug: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", unquote_plus(slug).lower()).strip()
+
+
+def listing_json_ld(listing: dict[str, Any], base_url: str) -> dict[str, Any]:
+    street = listing["address"].split(",")[0]
+    return {
+        "@context": "https://schema.org",
+        "@type": SCHEMA_TYPES.get(listing.get("property_type") or "", "Residence"),
+        "identifier": listing["id"],
+        "url": f"{base_url}/listing/{listing['id']}",
+        "address": {
+            "@type": "PostalAddress",
+            "streetAddress": street,
+            "addressLocality": listing["suburb"],
+            "addressRegion": listing["state"],
+            "postalCode": listing["postcode"],
+        },
+        "numberOfBedrooms": listing.get("bedrooms"),
+        "numberOfBathroomsTotal": listing.get("bathrooms"),
+        "description": listing.get("description", ""),
+        "offers": {"@type": "Offer", "price": listing["price"], "priceCurrency": "AUD"},
+    }
+
+
+class FakeListingSite:
+    """Local listing-site HTTP stand-in"""
+
+    def __init__(
+        self,
+        listings: list[dict[str, Any]] | None = None,
+        page_size: int = 4,
+        latency_ms: float = 80.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        if listings is None:
+            listings = json.loads(FIXTURE_PATH.read_text())["listings"]
+        self.listings = listings
+        self.page_size = page_size
+        self.latency_ms = latency_ms
+        self.host = host
+        self.port = port
+        self.requests: Counter[str] = Counter()
+        self._server: asyncio.base_events.Server | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> "FakeListingSite":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "FakeListingSite":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                _, path, _ = request_line.decode("latin-1").split(" ", 2)
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+
+                status, content_type, body = await self._respond(path)
+                data = body.encode()
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {'OK' if status == 200 else 'Not Found'}\r\n"
+                        f"Content-Type: {content_type}\r\n"
+                        f"Content-Length: {len(data)}\r\n"
+                        "Connection: keep-alive\r\n\r\n"
+                    ).encode("latin-1")
+                    + data
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, path: str) -> tuple[int, str, str]:
+        if path == "/robots.txt":
+            self.requests["robots"] += 1
+            return 200, "text/plain", ROBOTS_TXT
+
+        await asyncio.sleep(self.latency_ms / 1000.0)
+        for pattern in _SEARCH_PATHS:
+            match = pattern.match(path)
+            if match:
+                self.requests["search"] += 1
+                page = int(match.group("page") or 1)
+                return 200, "text/html; charset=utf-8", self.search_page(match.group("slug"), page)
+        self.requests["other"] += 1
+        return 404, "text/plain", "not found"
+
+    def search_page(self, slug: str, page: int) -> str:
+        key = _slug_key(slug)
+        matches = [
+            listing
+            for listing in self.listings
+            if key.startswith(_slug_key(f"{listing['suburb']} {listing['state']}"))
+        ]
+        start = (page - 1) * self.page_size
+        scripts = "\n".join(
+            f'<article class="listing-card"><h2>{escape(listing["address"])}</h2>'
+            f'<script type="application/ld+json">{json.dumps(listing_json_ld(listing, self.url))}</script>'
+            f"</article>"
+            for listing in matches[start : start + self.page_size]
+        )
+        return (
+            f"<!doctype html><html><head><title>Property for sale in {escape(key)}</title></head>"
+            f"<body><main>{scripts or '<p>No results</p>'}</main></body></html>"
+        )
+
+
+async def run_demo(args: argparse.Namespace) -> None:
+    async with FakeListingSite(latency_ms=args.latency_ms) as site:
+        crawler = ListingCrawler(
+            rate_per_host=args.rate,
+            max_pages=args.max_pages,
+            site_url=site.url,
+        )
+        try:
+            for label in ("cold", "warm"):
+                start = time.perf_counter()
+                records = await crawler.search(args.site, args.suburb, args.state, args.postcode)
+                elapsed = (time.perf_counter() - start) * 1000.0
+                print(f"[ScrapeBench] {label}: {len(records)} listings in {elapsed:.1f} ms")
+            print(f"[ScrapeBench] Site requests: {dict(site.requests)}")
+            print(f"[ScrapeBench] Crawler: {json.dumps(crawler.stats())}")
+        finally:
+            await crawler.aclose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Crawl the local listing-site stand-in")
+    parser.add_argument("--site", default="domain", choices=sorted(SITES))
+    parser.add_argument("--suburb", default="Bondi Beach")
+    parser.add_argument("--state", default="NSW")
+    parser.add_argument("--postcode", default="2026")
+    parser.add_argument("--max-pages", type=int, default=3)
+    parser.add_argument("--rate", type=float, default=5.0, help="requests/second per host")
+    parser.add_argument("--latency-ms", type=float, default=80.0)
+    asyncio.run(run_demo(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+HAUS Voice Agent - Agent-Logic Load Test
+
+Sweeps concurrency levels of simulated sessions (bench.agent_bench's
+SimulatedSession: synthetic participant, scripted turns, stubbed STT /
+LLM / TTS) in one process against the local Cortex stand-in, sharing the
+worker-level state a real job process shares: HTTP pool, tool cache,
+Cortex guard, listing index and gazetteer. For each level it records:
+
+    turn overhead p50/p95/p99   latency our code adds after end of turn
+    event-loop lag p95/max      sampled every 50 ms
+    CPU                         process CPU time / wall time (100% = one core)
+    RSS                         peak resident set, and growth per session
+    load                        what the worker would report to LiveKit
+
+and reports the highest level that meets the latency and loop-lag SLOs.
+
+This measures agent logic only, and its result is not a worker capacity.
+Sessions never go through the `server` entrypoint or LiveKit job
+processes, and VAD and turn-detector inference aren't run, so most of a
+real session's CPU is missing. Use it to compare changes to the agent's
+own code, not to set HAUS_MAX_SESSIONS_PER_WORKER.
+
+Usage (from packages/backend/agent-worker):
+
+    uv run python -m bench.load_test --levels 1,10,25,50,100 --repeat 2
+    uv run python -m bench.load_test --levels 10,50 --cortex-latency-ms 120 --json agent-logic.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import agent  # noqa: E402
+from bench.agent_bench import DEFAULT_SCRIPT, BenchOptions, SimulatedSession, bench_config  # noqa: E402
+from bench.fake_cortex import FakeCortexServer, FaultProfile  # noqa: E402
+from gazetteer import Gazetteer  # noqa: E402
+from health import LoopLagMonitor, WorkerHealth  # noqa: E402
+from snapshot import load_listing_index  # noqa: E402
+from tool_cache import ToolResultCache  # noqa: E402
+from tracing import Histogram, WorkerMetrics  # noqa: E402
+
+
+@dataclass
+class LevelResult:
+    """Measurements for one concurrency level"""
+
+    sessions: int
+    turns: int = 0
+    wall_seconds: float = 0.0
+    turn_overhead: Histogram = field(default_factory=Histogram)
+    loop_lag: Histogram = field(default_factory=Histogram)
+    cpu_percent: float = 0.0
+    rss_peak_mb: float = 0.0
+    rss_per_session_kb: float = 0.0
+    reported_load: float = 0.0
+    cortex_requests: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sessions": self.sessions,
+            "turns": self.turns,
+            "turns_per_s": round(self.turns / self.wall_seconds, 2) if self.wall_seconds else 0.0,
+            "turn_overhead_ms": self.turn_overhead.summary(),
+            "loop_lag_ms": self.loop_lag.summary(),
+            "cpu_percent": round(self.cpu_percent, 1),
+            "rss_peak_mb": round(self.rss_peak_mb, 1),
+            "rss_per_session_kb": round(self.rss_per_session_kb, 1),
+            "reported_load": round(self.reported_load, 3),
+            "cortex_requests": self.cortex_requests,
+        }
+
+    def meets(self, slo_ms: float, lag_budget_ms: float, cpu_limit: float) -> bool:
+        return (
+            self.turn_overhead.percentile(95) <= slo_ms
+            and self.loop_lag.percentile(95) <= lag_budget_ms
+            and self.cpu_percent <= cpu_limit
+        )
+
+
+async def run_level(
+    sessions: int,
+    options: BenchOptions,
+    shared: SimpleNamespace,
+    ramp_seconds: float,
+) -> LevelResult:
+    """Run `sessions` concurrent simulated sessions through the script"""
+    result = LevelResult(sessions)
+    metrics = WorkerMetrics()
+    health = WorkerHealth(max_sessions=shared.config.max_sessions_per_worker)
+    lag = LoopLagMonitor(interval=0.05, on_sample=result.loop_lag.record)
+    rss_before = WorkerHealth.rss_bytes()
+    rss_peak = rss_before
+    requests_before = shared.cortex.total_requests
+
+    async def _session(index: int) -> None:
+        nonlocal rss_peak
+        # Spread arrivals the way a dispatcher would, not all in one tick
+        await asyncio.sleep(ramp_seconds * index / max(sessions, 1))
+        session = SimulatedSession(
+            f"load{sessions}-{index}",
+            shared.config,
+            shared.http_client,
+            shared.listings,
+            shared.gazetteer,
+            metrics,
+            options,
+            shared.tool_cache,
+            shared.guard,
+        )
+        health.session_started()
+        try:
+            await session.start()
+            for _ in range(options.repeat):
+                for utterance, tool, kwargs in DEFAULT_SCRIPT:
+                    result.turn_overhead.record(await session.turn(utterance, tool, kwargs))
+                    result.turns += 1
+                rss_peak = max(rss_peak, WorkerHealth.rss_bytes())
+        finally:
+            result.reported_load = max(result.reported_load, health.load())
+            health.session_ended()
+            await session.close()
+            metrics.sessions.pop(session.trace.session_id, None)
+
+    lag.start()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    await asyncio.gather(*(_session(i) for i in range(sessions)))
+    result.wall_seconds = time.perf_counter() - wall_start
+    result.cpu_percent = 100.0 * (time.process_time() - cpu_start) / result.wall_seconds
+    lag.stop()
+
+    result.rss_peak_mb = rss_peak / 1e6
+    result.rss_per_session_kb = max(0, rss_peak - rss_before) / 1e3 / sessions
+    result.cortex_requests = shared.cortex.total_requests - requests_before
+    return result
+
+
+async def run_sweep(
+    levels: list[int],
+    options: BenchOptions,
+    ramp_seconds: float = 2.0,
+) -> list[LevelResult]:
+    """Run each concurrency level in turn against one Cortex stand-in"""
+    results = []
+    async with FakeCortexServer(options.faults) as cortex:
+        config = bench_config(cortex.url, options.speculative)
+        shared = SimpleNamespace(
+            cortex=cortex,
+            config=config,
+            http_client=agent.create_http_client(config),
+            listings=load_listing_index(config.listings_path, config.listings_cache_dir),
+            gazetteer=Gazetteer.load(config.gazetteer_path, config.localities_path),
+            tool_cache=ToolResultCache(config.tool_cache_max_entries, config.tool_cache_ttl),
+            guard=agent.create_cortex_guard(config),
+        )
+        try:
+            for level in levels:
+                result = await run_level(level, options, shared, ramp_seconds)
+                overhead = result.turn_overhead
+                print(
+                    f"[LoadTest] {level:4d} sessions: p95 {overhead.percentile(95):.1f} ms, "
+                    f"loop lag p95 {result.loop_lag.percentile(95):.1f} ms, "
+                    f"CPU {result.cpu_percent:.0f}%"
+                )
+                results.append(result)
+        finally:
+            await shared.http_client.aclose()
+    return results
+
+
+def agent_logic_ceiling(
+    results: list[LevelResult], slo_ms: float, lag_budget_ms: float, cpu_limit: float
+) -> LevelResult | None:
+    """Highest level meeting every SLO (levels above a failing one don't count)"""
+    best = None
+    for result in sorted(results, key=lambda r: r.sessions):
+        if not result.meets(slo_ms, lag_budget_ms, cpu_limit):
+            break
+        best = result
+    return best
+
+
+def print_report(
+    results: list[LevelResult],
+    slo_ms: float,
+    lag_budget_ms: float,
+    cpu_limit: float,
+) -> None:
+    print("\nHAUS agent-logic load curve (no VAD, turn detector or job processes)")
+    print(
+        "  sessions  turns/s   p50 ms   p95 ms   p99 ms  lag p95  lag max   CPU %  "
+        "RSS MB  KB/sess   load"
+    )
+    for result in results:
+        overhead, lag = result.turn_overhead, result.loop_lag
+        print(
+            f"  {result.sessions:8d} {result.to_dict()['turns_per_s']:8.1f} "
+            f"{overhead.percentile(50):8.1f} {overhead.percentile(95):8.1f} "
+            f"{overhead.percentile(99):8.1f} {lag.percentile(95):8.1f} {lag.max:8.1f} "
+            f"{result.cpu_percent:7.0f} {result.rss_peak_mb:7.0f} "
+            f"{result.rss_per_session_kb:8.0f} {result.reported_load:6.2f}"
+        )
+
+    best = agent_logic_ceiling(results, slo_ms, lag_budget_ms, cpu_limit)
+    print(
+        f"\n  SLOs: turn overhead p95 <= {slo_ms:.0f} ms, loop lag p95 <= {lag_budget_ms:.0f} ms, "
+        f"CPU <= {cpu_limit:.0f}%"
+    )
+    if best is None:
+        print("  No level met the SLOs; lower the first level or relax the SLOs.")
+        return
+    print(f"  Agent-logic ceiling: {best.sessions} concurrent sessions in one process")
+    print("  Not a worker capacity: per-session VAD and turn-detector CPU is not included")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="HAUS agent-logic load test (excludes model inference)")
+    parser.add_argument("--levels", default="1,5,10,25,50", help="comma-separated session counts")
+    parser.add_argument("--repeat", type=int, default=1, help="script runs per session")
+    parser.add_argument("--ramp-s", type=float, default=2.0, help="spread session arrivals over this long")
+    parser.add_argument("--interim-ms", type=float, default=120.0)
+    parser.add_argument("--eou-ms", type=float, default=300.0)
+    parser.add_argument("--no-speculative", action="store_true")
+    parser.add_argument("--cortex-latency-ms", type=float, default=40.0)
+    parser.add_argument("--cortex-jitter-ms", type=float, default=15.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--slo-ms", type=float, default=150.0, help="turn overhead p95 SLO")
+    parser.add_argument("--lag-budget-ms", type=float, default=50.0, help="event-loop lag p95 SLO")
+    parser.add_argument("--cpu-limit", type=float, default=80.0, help="CPU %% of one core")
+    parser.add_argument("--json", dest="json_path", default=None, help="write the curve as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    levels = [int(level) for level in args.levels.split(",") if level.strip()]
+    options = BenchOptions(
+        repeat=args.repeat,
+        interim_ms=args.interim_ms,
+        eou_ms=args.eou_ms,
+        speculative=not args.no_speculative,
+        faults=FaultProfile(
+            latency_ms=args.cortex_latency_ms,
+            jitter_ms=args.cortex_jitter_ms,
+            error_rate=args.error_rate,
+        ),
+    )
+
+    results = asyncio.run(run_sweep(levels, options, args.ramp_s))
+    print_report(results, args.slo_ms, args.lag_budget_ms, args.cpu_limit)
+    if args.json_path:
+        best = agent_logic_ceiling(results, args.slo_ms, args.lag_budget_ms, args.cpu_limit)
+        Path(args.json_path).write_text(
+            json.dumps(
+                {
+                    "scope": "agent logic only; excludes VAD, turn detector and job processes",
+                    "levels": [result.to_dict() for result in results],
+                    "agent_logic_sessions": best.sessions if best else None,
+                },
+                indent=2,
+            )
+        )
+        print(f"\nWrote {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+HAUS Voice Agent - Chat Context Compaction
+
+Every turn adds user, assistant and tool messages to the agent's chat
+context, so a long property hunt would otherwise send an ever-growing
+prompt to the LLM. Once the context passes a token threshold, the
+ContextCompactor replaces everything but the instructions and the last
+few turns with one rolling summary message:
+
+    Earlier in this call (summarised):
+    Search: Bondi; up to $2,000,000; 3+ bedrooms; house; with ocean views.
+    Saved preferences: likes Paddington.
+    Viewed: prop-011 (103 Brunswick Street, Bondi Beach NSW 2026).
+    Last results: prop-011 103 Brunswick Street, $685,000; prop-002 ...
+    User said: "we've got a dog"; "somewhere quiet near the beach".
+
+The search criteria are taken from the arguments of the search tool
+calls being compacted, which the LLM already extracted, so they are
+structured rather than paraphrased. The summary is rolling: the state
+behind it lives in the compactor, and each compaction folds in only the
+newly compacted items and re-renders the message under a token budget.
+No extra LLM call is made.
+
+Compaction runs between turns (see HausAgent._compact_context). It is
+synchronous over a snapshot of the context, so a turn can't interleave
+with it.
+"""
+
+import json
+import re
+from collections import OrderedDict, deque
+from dataclasses import dataclass, fields
+from typing import Any, Iterable
+
+from memory_context import estimate_tokens
+
+SUMMARY_MESSAGE_ID = "haus-conversation-summary"
+
+# Roles whose messages are kept in place (agent instructions)
+_INSTRUCTION_ROLES = ("system", "developer")
+
+# "- prop-011: 103 Brunswick Street, Bondi Beach NSW 2026, $685,000, 1 bed"
+_LISTING_LINE = re.compile(r"^- (?P<id>[\w-]+): (?P<address>.+?), (?P<price>\$[\d,]+|price on request),")
+
+
+@dataclass
+class SearchCriteria:
+    """Latest value of each search criterion the user has given"""
+
+    location: str | None = None
+    budget_min: int | None = None
+    budget_max: int | None = None
+    bedrooms: int | None = None
+    property_type: str | None = None
+    keywords: str | None = None
+    near: str | None = None
+    radius_km: float | None = None
+
+    def update(self, arguments: dict[str, Any]) -> None:
+        """Fold in a search tool call's arguments (later calls win, per field)"""
+        if arguments.get("query") and not arguments.get("location"):
+            arguments = {**arguments, "location": arguments["query"]}
+        for field in fields(self):
+            value = arguments.get(field.name)
+            if value not in (None, ""):
+                setattr(self, field.name, value)
+
+    def render(self) -> str:
+        parts = []
+        if self.location:
+            parts.append(str(self.location))
+        if self.near:
+            radius = f"within {self.radius_km:g} km of" if self.radius_km else "near"
+            parts.append(f"{radius} {self.near}")
+        if self.budget_min and self.budget_max:
+            parts.append(f"${self.budget_min:,} to ${self.budget_max:,}")
+        elif self.budget_max:
+            parts.append(f"up to ${self.budget_max:,}")
+        elif self.budget_min:
+            parts.append(f"from ${self.budget_min:,}")
+        if self.bedrooms:
+            parts.append(f"{self.bedrooms}+ bedrooms")
+        if self.property_type:
+            parts.append(str(self.property_type))
+        if self.keywords:
+            parts.append(f"with {self.keywords}")
+        return "; ".join(parts)
+
+
+def item_tokens(item: Any) -> int:
+    """Approximate prompt tokens of one chat context item"""
+    if item.type == "message":
+        return estimate_tokens(item.text_content or "") + 4
+    if item.type == "function_call":
+        return estimate_tokens(item.name + item.arguments) + 4
+    if item.type == "function_call_output":
+        return estimate_tokens(item.output) + 4
+    return 0
+
+
+def context_tokens(chat_ctx: Any) -> int:
+    """Approximate prompt tokens of a chat context's items"""
+    return sum(item_tokens(item) for item in chat_ctx.items)
+
+
+class ContextCompactor:
+    """Per-session rolling summary of the compacted part of a chat context"""
+
+    def __init__(
+        self,
+        token_threshold: int = 1500,
+        keep_turns: int = 2,
+        summary_token_budget: int = 250,
+        pinned_ids: Iterable[str] = (),
+        max_quotes: int = 6,
+        max_viewed: int = 8,
+    ):
+        self.token_threshold = token_threshold
+        self.keep_turns = keep_turns
+        self.summary_token_budget = summary_token_budget
+        # Items never compacted (e.g. the session's initial context)
+        self.pinned_ids = frozenset(pinned_ids)
+        self.max_viewed = max_viewed
+
+        self.criteria = SearchCriteria()
+        self.preferences: list[str] = []
+        self.viewed: OrderedDict[str, str] = OrderedDict()  # property ID -> address
+        self._detail_calls: dict[str, str] = {}  # call ID -> property ID
+        self.last_results: list[str] = []
+        self.user_quotes: deque[str] = deque(maxlen=max_quotes)
+
+        self.compactions = 0
+        self.items_compacted = 0
+
+    def needs_compaction(self, chat_ctx: Any) -> bool:
+        return self.token_threshold > 0 and context_tokens(chat_ctx) > self.token_threshold
+
+    def compact(self, chat_ctx: Any) -> Any | None:
+        """
+        A compacted copy of chat_ctx, or None if it is under the threshold
+        or has no turns old enough to compact.
+
+        Instruction messages and pinned items are kept, the last keep_turns user turns are
+        kept verbatim, and everything in between (including the previous
+        summary) becomes one summary message.
+        """
+        if not self.needs_compaction(chat_ctx):
+            return None
+        items = list(chat_ctx.items)
+
+        # The tail starts at the keep_turns-th last user message, so it never
+        # opens with a tool output whose call was compacted
+        user_positions = [
+            i for i, item in enumerate(items) if item.type == "message" and item.role == "user"
+        ]
+        if len(user_positions) <= self.keep_turns:
+            return None
+        split = user_positions[-self.keep_turns] if self.keep_turns else len(items)
+
+        kept, compacted = [], []
+        for item in items[:split]:
+            if item.id in self.pinned_ids or (item.type == "message" and item.role in _INSTRUCTION_ROLES):
+                kept.append(item)
+            elif item.id != SUMMARY_MESSAGE_ID:
+                compacted.append(item)
+        if not compacted:
+            return None
+
+        for item in compacted:
+            self._fold(item)
+        self.compactions += 1
+        self.items_compacted += len(compacted)
+
+        compact_ctx = chat_ctx.copy()
+        compact_ctx.items = kept + items[split:]
+        summary = self.render()
+        if summary:
+            # Timestamped as the last compacted item, so it sits before the
+            # kept turns and later messages (inserted by creation time)
+            compact_ctx.add_message(
+                role="assistant",
+                content=summary,
+                id=SUMMARY_MESSAGE_ID,
+                created_at=compacted[-1].created_at,
+                extra={"is_summary": True},
+            )
+        return compact_ctx
+
+    def _fold(self, item: Any) -> None:
+        """Add one compacted item to the rolling state"""
+        if item.type == "message":
+            text = " ".join((item.text_content or "").split())
+            if item.role == "user" and text:
+                self.user_quotes.append(text if len(text) <= 120 else text[:117] + "...")
+            return
+
+        if item.type == "function_call":
+            try:
+                arguments = json.loads(item.arguments or "{}")
+            except ValueError:
+                return
+            if item.name in ("search_properties", "scrape_listings"):
+                self.criteria.update(arguments)
+            elif item.name == "remember_preference" and arguments.get("preference"):
+                verb = "likes" if arguments.get("is_positive", True) else "avoids"
+                self.preferences.append(f"{verb} {arguments['preference']}")
+            elif item.name == "get_property_details" and arguments.get("property_id"):
+                property_id = str(arguments["property_id"]).strip()
+                self.viewed[property_id] = self.viewed.pop(property_id, "")
+                self._detail_calls[item.call_id] = property_id
+                while len(self.viewed) > self.max_viewed:
+                    self.viewed.popitem(last=False)
+            return
+
+        if item.type == "function_call_output" and not item.is_error:
+            if item.name in ("search_properties", "scrape_listings"):
+                results = []
+                for line in item.output.splitlines():
+                    match = _LISTING_LINE.match(line)
+                    if match:
+                        street = match.group("address").split(",")[0]
+                        results.append(f"{match.group('id')} {street}, {match.group('price')}")
+                if results:
+                    self.last_results = results
+            elif item.name == "get_property_details":
+                property_id = self._detail_calls.pop(item.call_id, None)
+                address = item.output.split("\n", 1)[0].strip()
+                if property_id in self.viewed and not address.startswith("Sorry"):
+                    self.viewed[property_id] = address
+
+    def render(self) -> str:
+        """Summary message text within summary_token_budget (empty if nothing to say)"""
+        lines = []
+        criteria = self.criteria.render()
+        if criteria:
+            lines.append(f"Search: {criteria}.")
+        if self.preferences:
+            lines.append("Saved preferences: " + ", ".join(dict.fromkeys(self.preferences)) + ".")
+        if self.viewed:
+            lines.append(
+                "Viewed: "
+                + ", ".join(f"{pid} ({address})" if address else pid for pid, address in self.viewed.items())
+                + "."
+            )
+        if self.last_results:
+            lines.append("Last results: " + "; ".join(self.last_results) + ".")
+        if not lines and not self.user_quotes:
+            return ""
+
+        header = "Earlier in this call (summarised):"
+        # Most recent quotes first, then fit whatever the budget allows
+        quotes: list[str] = []
+        for quote in reversed(self.user_quotes):
+            candidate = [quote, *quotes]
+            text = _render(header, lines, candidate)
+            if estimate_tokens(text) > self.summary_token_budget:
+                break
+            quotes = candidate
+
+        text = _render(header, lines, quotes)
+        while estimate_tokens(text) > self.summary_token_budget and len(lines) > 1:
+            # Oldest detail goes first: last results, then viewed listings
+            lines.pop()
+            text = _render(header, lines, quotes)
+        return text
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "compactions": self.compactions,
+            "items_compacted": self.items_compacted,
+        }
+
+
+def _render(header: str, lines: list[str], quotes: list[str]) -> str:
+    said = ["User said: " + "; ".join(f'"{quote}"' for quote in quotes) + "."] if quotes else []
+    return "\n".join([header, *lines, *said])
@@ -0,0 +1,390 @@
+"""
+HAUS Voice Agent - Suburb Gazetteer
+
+Resolves spoken location strings ("bondai", "paddo", "eastern suburbs",
+"bondi nsw 2026") to Australian suburbs so tool arguments match the
+listing index and Cortex suburb preferences.
+
+Lookup order for a normalized query:
+
+1. exact suburb name, nickname alias or region name
+2. postcode
+3. fuzzy match against suburb names and aliases (never regions):
+   candidates from a character-trigram inverted index, scored by Dice
+   similarity with a bonus for an equal phonetic key. Short queries and
+   candidates with a different number of words ("brunswick north" vs
+   "brunswick") need a stricter score, and anything below the threshold
+   is no match rather than a distant guess.
+
+The curated gazetteer (postcodes, regions, nicknames) is merged with a
+list of Australian localities (fixtures/localities.json) so suburbs
+outside the curated set still resolve by name.
+
+The gazetteer is built once per worker process at prewarm; a resolve is
+a few dict lookups plus a walk over short posting lists (microseconds),
+and results are memoized.
+"""
+
+import json
+import re
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+DEFAULT_GAZETTEER_PATH = Path(__file__).parent / "fixtures" / "gazetteer.json"
+DEFAULT_LOCALITIES_PATH = Path(__file__).parent / "fixtures" / "localities.json"
+
+STATE_NAMES = {
+    "nsw": "NSW",
+    "new south wales": "NSW",
+    "vic": "VIC",
+    "victoria": "VIC",
+    "qld": "QLD",
+    "queensland": "QLD",
+    "wa": "WA",
+    "western australia": "WA",
+    "sa": "SA",
+    "south australia": "SA",
+    "tas": "TAS",
+    "tasmania": "TAS",
+    "nt": "NT",
+    "northern territory": "NT",
+    "act": "ACT",
+    "australian capital territory": "ACT",
+}
+
+# Abbreviations that appear in both spoken and written suburb names
+_TOKEN_ALIASES = {
+    "saint": "st",
+    "mt": "mount",
+    "nth": "north",
+    "sth": "south",
+    "pt": "point",
+}
+
+_LEADING_FILLER = ("in", "around", "near", "at", "about")
+
+# Fuzzy queries with fewer letters than this use the strict threshold
+_SHORT_QUERY_LETTERS = 6
+
+_PHONETIC_CLASSES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+@dataclass(frozen=True)
+class Suburb:
+    """A gazetteer suburb"""
+
+    name: str
+    state: str
+    postcode: str
+    region: str | None = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}, {self.state}"
+
+
+@dataclass
+class LocationMatch:
+    """Result of resolving a location string"""
+
+    query: str
+    kind: str  # "suburb" | "alias" | "region" | "postcode" | "fuzzy" | "none"
+    suburbs: list[Suburb] = field(default_factory=list)
+    label: str = ""
+    score: float = 0.0
+
+    @property
+    def is_region(self) -> bool:
+        """Whether the match covers an area rather than a named suburb"""
+        return self.kind in ("region", "postcode")
+
+    @property
+    def primary(self) -> Suburb | None:
+        """Best single suburb for a named-suburb match"""
+        return None if self.is_region or not self.suburbs else self.suburbs[0]
+
+
+@dataclass(frozen=True)
+class _Term:
+    text: str
+    kind: str
+    key: str  # suburb label or region name
+
+
+def normalize_location(text: str) -> str:
+    """Lower-case, drop punctuation and expand common abbreviations"""
+    cleaned = re.sub(r"[^a-z0-9& ]+", " ", text.lower().replace("'", "").replace("\u2019", ""))
+    tokens = [_TOKEN_ALIASES.get(token, token) for token in cleaned.split()]
+    return " ".join(tokens)
+
+
+def phonetic_key(text: str) -> str:
+    """Soundex-style consonant skeleton of the whole string (no truncation)"""
+    letters = [ch for ch in text.lower() if ch.isalpha()]
+    if not letters:
+        return ""
+    key = [letters[0]]
+    last = _PHONETIC_CLASSES.get(letters[0], "")
+    for ch in letters[1:]:
+        code = _PHONETIC_CLASSES.get(ch, "")
+        if code and code != last:
+            key.append(code)
+        if ch not in "hw":
+            last = code
+    return "".join(key)
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class Gazetteer:
+    """Precomputed index of suburbs, postcodes, states and region aliases"""
+
+    def __init__(
+        self,
+        suburbs: list[Suburb],
+        aliases: dict[str, str],
+        regions: dict[str, dict[str, Any]],
+        fuzzy_threshold: float = 0.75,
+        strict_fuzzy_threshold: float = 0.9,
+        cache_size: int = 4096,
+    ):
+        self.fuzzy_threshold = fuzzy_threshold
+        self.strict_fuzzy_threshold = strict_fuzzy_threshold
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str], LocationMatch] = OrderedDict()
+
+        self._by_label = {suburb.label: suburb for suburb in suburbs}
+        self._by_postcode: dict[str, list[Suburb]] = {}
+        self._by_region: dict[str, list[Suburb]] = {}
+        for suburb in suburbs:
+            if suburb.postcode:
+                self._by_postcode.setdefault(suburb.postcode, []).append(suburb)
+            if suburb.region:
+                self._by_region.setdefault(suburb.region, []).append(suburb)
+
+        # Every matchable string, for exact and fuzzy lookup
+        self._terms: list[_Term] = []
+        self._exact: dict[str, list[_Term]] = {}
+        self._max_term_words = 1
+        for suburb in suburbs:
+            self._add_term(_Term(normalize_location(suburb.name), "suburb", suburb.label))
+        for alias, label in aliases.items():
+            self._add_term(_Term(normalize_location(alias), "alias", label))
+        for region, spec in regions.items():
+            for text in (region, *spec.get("aliases", [])):
+                self._add_term(_Term(normalize_location(text), "region", region))
+
+        # Fuzzy candidates: suburb names and aliases only. A near miss on a
+        # region alias ("the beach" for "the beaches") is a guess, not a match
+        self._term_trigrams = [len(_trigrams(term.text)) for term in self._terms]
+        self._postings: dict[str, list[int]] = {}
+        self._phonetic: dict[str, list[int]] = {}
+        for term_id, term in enumerate(self._terms):
+            if term.kind == "region":
+                continue
+            for gram in _trigrams(term.text):
+                self._postings.setdefault(gram, []).append(term_id)
+            self._phonetic.setdefault(phonetic_key(term.text), []).append(term_id)
+
+    def _add_term(self, term: _Term) -> None:
+        self._terms.append(term)
+        self._exact.setdefault(term.text, []).append(term)
+        self._max_term_words = max(self._max_term_words, len(term.text.split()))
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path = DEFAULT_GAZETTEER_PATH,
+        localities_path: str | Path | None = DEFAULT_LOCALITIES_PATH,
+    ) -> "Gazetteer":
+        """
+        Load a gazetteer from JSON ({"suburbs": [...], "aliases": [...],
+        "regions": [...]}), plus the suburbs of a localities file. Curated
+        entries win: a locality is skipped when the curated file already
+        has that suburb or uses its name as an alias or region.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        suburbs = [
+            Suburb(s["name"], s["state"], str(s.get("postcode", "")), s.get("region"))
+            for s in data.get("suburbs", [])
+        ]
+        aliases = {a["alias"]: f"{a['suburb']}, {a['state']}" for a in data.get("aliases", [])}
+        regions = {r["name"]: r for r in data.get("regions", [])}
+
+        if localities_path:
+            with open(localities_path, encoding="utf-8") as f:
+                localities = json.load(f).get("suburbs", [])
+            known = {(normalize_location(suburb.name), suburb.state) for suburb in suburbs}
+            taken = {normalize_location(alias) for alias in aliases}
+            for region, spec in regions.items():
+                taken.update(normalize_location(text) for text in (region, *spec.get("aliases", [])))
+            for s in localities:
+                text = normalize_location(s["name"])
+                if (text, s["state"]) in known or text in taken:
+                    continue
+                known.add((text, s["state"]))
+                suburbs.append(Suburb(s["name"], s["state"], str(s.get("postcode", ""))))
+        return cls(suburbs, aliases, regions)
+
+    def __len__(self) -> int:
+        return len(self._by_label)
+
+    # -------------------------------------------------------------------------
+    # Resolution
+    # -------------------------------------------------------------------------
+
+    def resolve(self, text: str, default_state: str = "NSW") -> LocationMatch:
+        """Resolve a spoken location to suburbs (see module docstring for order)"""
+        cache_key = (text, default_state)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+
+        match = self._resolve(text, default_state)
+        self._cache[cache_key] = match
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return match
+
+    def mentions(self, text: str) -> frozenset[str]:
+        """
+        Suburbs and regions named anywhere in free text (a transcript), as
+        suburb and region names. Exact names and aliases only, the longest
+        match at each position, so "bondi beach" is Bondi Beach rather than
+        Bondi.
+        """
+        words = normalize_location(text).split()
+        found: set[str] = set()
+        start = 0
+        while start < len(words):
+            for size in range(min(self._max_term_words, len(words) - start), 0, -1):
+                terms = self._exact.get(" ".join(words[start:start + size]))
+                if terms:
+                    found.update(
+                        term.key if term.kind == "region" else self._by_label[term.key].name for term in terms
+                    )
+                    start += size
+                    break
+            else:
+                start += 1
+        return frozenset(found)
+
+    def _resolve(self, text: str, default_state: str) -> LocationMatch:
+        query, state, postcode = self._parse(text)
+        preferred_state = state or default_state
+
+        if query:
+            terms = self._exact.get(query)
+            if terms is None and query.split()[0] in _LEADING_FILLER:
+                query = query.split(" ", 1)[1] if " " in query else ""
+                terms = self._exact.get(query)
+            if terms:
+                return self._match_terms(text, terms, terms[0].kind, 1.0, state, preferred_state)
+
+        if postcode:
+            suburbs = self._filter_state(self._by_postcode.get(postcode, []), state)
+            if suburbs:
+                return LocationMatch(text, "postcode", suburbs, f"{postcode}", 1.0)
+
+        if query:
+            fuzzy = self._fuzzy(query)
+            if fuzzy:
+                score, terms = fuzzy
+                return self._match_terms(text, terms, "fuzzy", score, state, preferred_state)
+
+        return LocationMatch(text, "none")
+
+    def _parse(self, text: str) -> tuple[str, str | None, str | None]:
+        """Split a location into (suburb text, state, postcode)"""
+        normalized = normalize_location(text)
+        postcode = None
+        found = re.search(r"\b(\d{4})\b", normalized)
+        if found:
+            postcode = found.group(1)
+            normalized = (normalized[:found.start()] + normalized[found.end():]).strip()
+
+        state = None
+        for name in sorted(STATE_NAMES, key=len, reverse=True):
+            if normalized == name:
+                break
+            if normalized.endswith(" " + name):
+                state = STATE_NAMES[name]
+                normalized = normalized[: -len(name) - 1].strip()
+                break
+        return " ".join(normalized.split()), state, postcode
+
+    def _fuzzy(self, query: str) -> tuple[float, list[_Term]] | None:
+        grams = _trigrams(query)
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        phonetic_ids = set(self._phonetic.get(phonetic_key(query), ()))
+
+        short = sum(ch.isalpha() for ch in query) < _SHORT_QUERY_LETTERS
+        words = len(query.split())
+
+        best_score, best_ids = 0.0, []
+        for term_id in shared.keys() | phonetic_ids:
+            dice = 2.0 * shared.get(term_id, 0) / (len(grams) + self._term_trigrams[term_id])
+            score = min(dice + (0.3 if term_id in phonetic_ids else 0.0), 1.0)
+            # A partial-token candidate ("brunswick" for "brunswick north")
+            # or a short query has to be a near-exact match
+            strict = short or len(self._terms[term_id].text.split()) != words
+            if score < (self.strict_fuzzy_threshold if strict else self.fuzzy_threshold):
+                continue
+            if score > best_score + 1e-9:
+                best_score, best_ids = score, [term_id]
+            elif abs(score - best_score) <= 1e-9:
+                best_ids.append(term_id)
+
+        if not best_ids:
+            return None
+        return best_score, [self._terms[term_id] for term_id in best_ids]
+
+    def _match_terms(
+        self,
+        text: str,
+        terms: list[_Term],
+        kind: str,
+        score: float,
+        state: str | None,
+        preferred_state: str,
+    ) -> LocationMatch:
+        region_terms = [term for term in terms if term.kind == "region"]
+        if region_terms and len(region_terms) == len(terms):
+            region = region_terms[0].key
+            suburbs = self._filter_state(self._by_region.get(region, []), state)
+            return LocationMatch(text, "region", suburbs, region, score)
+
+        suburbs = []
+        for term in terms:
+            if term.kind == "region":
+                continue
+            suburb = self._by_label[term.key]
+            if suburb not in suburbs:
+                suburbs.append(suburb)
+        suburbs = self._filter_state(suburbs, state) or suburbs
+        # Same-named suburbs in several states: put the preferred state first
+        suburbs.sort(key=lambda suburb: suburb.state != preferred_state)
+        return LocationMatch(text, kind, suburbs, suburbs[0].label, score)
+
+    @staticmethod
+    def _filter_state(suburbs: list[Suburb], state: str | None) -> list[Suburb]:
+        if state is None:
+            return list(suburbs)
+        return [suburb for suburb in suburbs if suburb.state == state]
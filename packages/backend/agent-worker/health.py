@@ -0,0 +1,574 @@
+"""
+HAUS Voice Agent - Worker Health and Status Server
+
+Minimal asyncio HTTP server on the port the Dockerfile exposes (8080).
+Routes are plain callables returning (status, content type, body), so
+the server has no dependencies beyond the standard library and a scrape
+never touches the voice pipeline beyond reading counters.
+
+WorkerHealth tracks readiness (models loaded), live load (active
+sessions, in-flight Cortex requests, event-loop lag, RSS, CPU) and turns
+it into the load figure LiveKit uses for job dispatch. CPU is what the
+process and its children (in the main process: every job process and
+the inference process) use of the CPUs it may run on, not the host's
+load average. In the main process, the in-flight and lag terms come from
+the job processes' reports (the busiest process counts) as well as its
+own loop:
+
+    /health   liveness, 200 while the event loop is serving requests
+    /ready    200 once a job process has finished prewarm, 503 before
+    /load     live load snapshot as JSON
+
+The server runs in the main worker process, which lives as long as the
+worker. Job processes come and go with their jobs, so each one POSTs a
+report (its health counters, drained latency histograms and component
+snapshots) to /report every few seconds and once more when its job
+ends. JobReports merges them into worker-wide figures, and answers each
+report with the worker's current load, which job processes use to pick
+a new session's pipeline tier. Reports are only
+accepted from loopback, with the worker's report token, for the PID of
+one of the worker's job processes: the load they carry decides whether
+the worker takes jobs.
+"""
+
+import asyncio
+import hmac
+import ipaddress
+import json
+import os
+import resource
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Callable, Iterable
+
+import psutil
+
+from tracing import WorkerMetrics
+
+Handler = Callable[[], tuple[int, str, str]]
+PostHandler = Callable[[bytes, dict[str, str]], tuple[int, str, str]]
+
+# Header carrying the shared secret job processes report with
+REPORT_TOKEN_HEADER = "X-Haus-Report-Token"
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    503: "Service Unavailable",
+}
+
+
+def json_response(payload: Any, status: int = 200) -> tuple[int, str, str]:
+    """Build a JSON route response"""
+    return status, "application/json", json.dumps(payload)
+
+
+class LoopLagMonitor:
+    """Measures event-loop lag as the overshoot of a periodic sleep"""
+
+    def __init__(
+        self,
+        interval: float = 0.25,
+        smoothing: float = 0.2,
+        on_sample: Callable[[float], None] | None = None,
+    ):
+        self.interval = interval
+        self.smoothing = smoothing
+        self.on_sample = on_sample
+        self.lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (loop.time() - start - self.interval) * 1000.0)
+            self.lag_ms += self.smoothing * (lag_ms - self.lag_ms)
+            self.max_lag_ms = max(self.max_lag_ms * 0.95, lag_ms)
+            if self.on_sample is not None:
+                self.on_sample(lag_ms)
+
+
+class TreeCpu:
+    """CPU used by this process and its descendants, sampled at most every min_interval seconds"""
+
+    def __init__(self, min_interval: float = 1.0):
+        self.min_interval = min_interval
+        self.cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+        self.used = 0.0
+        self._sampled_at = 0.0
+        # Kept between samples: cpu_percent() measures since the previous call
+        # on the same Process object, and a new process reads 0 at first
+        self._processes: dict[int, psutil.Process] = {}
+
+    def load(self) -> float:
+        """Share of the available CPUs in use, 0.0-1.0"""
+        now = time.monotonic()
+        if now - self._sampled_at >= self.min_interval:
+            self._sampled_at = now
+            self.used = self._sample()
+        return min(1.0, self.used / self.cpus)
+
+    def _sample(self) -> float:
+        """CPUs in use since the last sample (1.5 = one and a half cores)"""
+        root = psutil.Process()
+        tree = {root.pid: root}
+        try:
+            tree.update((child.pid, child) for child in root.children(recursive=True))
+        except psutil.Error:
+            pass
+        self._processes = {pid: self._processes.get(pid, process) for pid, process in tree.items()}
+        used = 0.0
+        for process in self._processes.values():
+            try:
+                used += process.cpu_percent(None) / 100.0
+            except psutil.Error:
+                pass
+        return used
+
+
+class WorkerHealth:
+    """Readiness and load accounting for a worker process"""
+
+    def __init__(self, max_sessions: int = 8, lag_budget_ms: float = 100.0, inflight_budget: int = 10):
+        self.max_sessions = max_sessions
+        self.lag_budget_ms = lag_budget_ms
+        # In-flight Cortex requests counted as full load (the pool size)
+        self.inflight_budget = inflight_budget
+        self.ready = False
+        self.ready_at: float | None = None
+        self.started_at = time.time()
+        self.active_sessions = 0
+        self.cortex_inflight = 0
+        self.loop_lag = LoopLagMonitor()
+        self.cpu = TreeCpu()
+
+    def mark_ready(self) -> None:
+        self.ready = True
+        self.ready_at = time.time()
+
+    @property
+    def startup_ms(self) -> float | None:
+        """Process start (this module's import) to ready, in ms"""
+        return None if self.ready_at is None else (self.ready_at - self.started_at) * 1000.0
+
+    def session_started(self) -> None:
+        self.active_sessions += 1
+
+    def session_ended(self) -> None:
+        self.active_sessions = max(0, self.active_sessions - 1)
+
+    @staticmethod
+    def rss_bytes() -> int:
+        """Current resident set size (peak RSS where /proc is unavailable)"""
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return peak if sys.platform == "darwin" else peak * 1024
+
+    def cpu_load(self) -> float:
+        """Share of this process's CPUs used by it and its children, 0.0-1.0"""
+        return self.cpu.load()
+
+    def load(
+        self,
+        active_sessions: int | None = None,
+        cortex_inflight: int | None = None,
+        loop_lag_ms: float | None = None,
+    ) -> float:
+        """
+        Worker load for job dispatch, 0.0-1.0.
+
+        The highest of CPU, session occupancy, in-flight Cortex requests
+        relative to the pool and event-loop lag relative to its budget, so
+        a worker stops taking jobs when any of them saturates (LiveKit
+        compares this against its load_threshold). Arguments override
+        this process's own counters.
+        """
+        sessions = self.active_sessions if active_sessions is None else active_sessions
+        inflight = self.cortex_inflight if cortex_inflight is None else cortex_inflight
+        lag_ms = self.loop_lag.lag_ms if loop_lag_ms is None else loop_lag_ms
+        return min(
+            1.0,
+            max(
+                self.cpu_load(),
+                sessions / max(self.max_sessions, 1),
+                inflight / max(self.inflight_budget, 1),
+                lag_ms / self.lag_budget_ms,
+            ),
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "startup_ms": None if self.startup_ms is None else round(self.startup_ms),
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "active_sessions": self.active_sessions,
+            "max_sessions": self.max_sessions,
+            "cortex_inflight": self.cortex_inflight,
+            "loop_lag_ms": round(self.loop_lag.lag_ms, 2),
+            "loop_lag_max_ms": round(self.loop_lag.max_lag_ms, 2),
+            "rss_mb": round(self.rss_bytes() / 1e6, 1),
+            "cpu_load": round(self.cpu_load(), 3),
+            "load": round(self.load(), 3),
+        }
+
+    def install_routes(self, server: "StatusServer") -> None:
+        """Register /health, /ready and /load on a status server"""
+        server.route("/health", lambda: json_response({"status": "ok", "ready": self.ready}))
+        server.route(
+            "/ready",
+            lambda: json_response({"ready": self.ready}, status=200 if self.ready else 503),
+        )
+        server.route("/load", lambda: json_response(self.snapshot()))
+
+
+class JobReports:
+    """Main-process view of the job processes, built from their reports"""
+
+    def __init__(
+        self,
+        health: WorkerHealth,
+        stale_after: float = 10.0,
+        token: str = "",
+        job_pids: Callable[[], Iterable[int]] | None = None,
+    ):
+        self.health = health
+        # A process that stops reporting without a final report has exited
+        self.stale_after = stale_after
+        # Shared secret reports must carry, and the PIDs they may come from
+        self.token = token
+        self.job_pids = job_pids
+        # Worker-wide histograms, merged from every report's drained metrics
+        self.metrics = WorkerMetrics()
+        self._latest: dict[int, dict[str, Any]] = {}
+        self.reports_total = 0
+        self.rejected_total = 0
+
+    def receive(self, body: bytes, headers: dict[str, str]) -> tuple[int, str, str]:
+        """POST /report handler"""
+        if self.token and not hmac.compare_digest(
+            headers.get(REPORT_TOKEN_HEADER.lower(), "").encode(), self.token.encode()
+        ):
+            self.rejected_total += 1
+            return json_response({"error": "bad report token"}, status=403)
+        try:
+            report = json.loads(body)
+            pid = int(report["pid"])
+        except (ValueError, KeyError, TypeError):
+            return json_response({"error": "malformed report"}, status=400)
+        if self.job_pids is not None and pid not in set(self.job_pids()):
+            self.rejected_total += 1
+            return json_response({"error": f"pid {pid} is not a job process"}, status=403)
+
+        self.metrics.merge(report.pop("metrics", None) or {})
+        self.reports_total += 1
+        if report.get("ready") and not self.health.ready:
+            self.health.mark_ready()
+        if report.get("final"):
+            self._latest.pop(pid, None)
+        else:
+            report["received_at"] = time.time()
+            self._latest[pid] = report
+
+        cutoff = time.time() - self.stale_after
+        for stale in [p for p, r in self._latest.items() if r["received_at"] < cutoff]:
+            del self._latest[stale]
+        return json_response({"ok": True, "load": round(self.load(), 3)})
+
+    def live(self) -> list[dict[str, Any]]:
+        """Latest report of each job process still reporting"""
+        cutoff = time.time() - self.stale_after
+        return [r for r in list(self._latest.values()) if r["received_at"] >= cutoff]
+
+    def active_sessions(self) -> int:
+        return sum(r.get("active_sessions", 0) for r in self.live())
+
+    def load(self, active_sessions: int | None = None) -> float:
+        """
+        Worker load with the busiest job process's in-flight Cortex
+        requests (each process has its own pool) and the worse of its
+        event-loop lag and the main process's.
+        """
+        processes = self.live()
+        if active_sessions is None:
+            active_sessions = sum(r.get("active_sessions", 0) for r in processes)
+        return self.health.load(
+            active_sessions=active_sessions,
+            cortex_inflight=max((r.get("cortex_inflight", 0) for r in processes), default=0),
+            loop_lag_ms=max(
+                [self.health.loop_lag.lag_ms, *(r.get("loop_lag_ms", 0.0) for r in processes)]
+            ),
+        )
+
+    def components(self, name: str) -> dict[str, Any]:
+        """One component's snapshot (e.g. "cortex") from each live process, by PID"""
+        return {str(r["pid"]): r[name] for r in self.live() if r.get(name) is not None}
+
+    def snapshot(self) -> dict[str, Any]:
+        processes = self.live()
+        sessions = sum(r.get("active_sessions", 0) for r in processes)
+        snapshot = self.health.snapshot()
+        snapshot.update(
+            reports_rejected=self.rejected_total,
+            active_sessions=sessions,
+            cortex_inflight=sum(r.get("cortex_inflight", 0) for r in processes),
+            load=round(self.load(active_sessions=sessions), 3),
+            job_processes=[
+                {
+                    "pid": r["pid"],
+                    "ready": r.get("ready", False),
+                    "startup_ms": r.get("startup_ms"),
+                    "active_sessions": r.get("active_sessions", 0),
+                    "cortex_inflight": r.get("cortex_inflight", 0),
+                    "loop_lag_ms": r.get("loop_lag_ms", 0.0),
+                    "rss_mb": r.get("rss_mb"),
+                }
+                for r in processes
+            ],
+        )
+        return snapshot
+
+    def install_routes(self, server: "StatusServer") -> None:
+        """Register /health, /ready, /load, /metrics, /metrics.json and POST /report"""
+        self.health.install_routes(server)
+        server.route("/load", lambda: json_response(self.snapshot()))
+        server.route(
+            "/metrics",
+            lambda: (
+                200,
+                "text/plain; version=0.0.4",
+                self.metrics.render_prometheus(active_sessions=self.active_sessions()),
+            ),
+        )
+        server.route(
+            "/metrics.json",
+            lambda: json_response(self.metrics.summary(active_sessions=self.active_sessions())),
+        )
+        server.post_route("/report", self.receive)
+
+
+def post_report(
+    url: str, report: dict[str, Any], timeout: float = 1.0, token: str = ""
+) -> dict[str, Any] | None:
+    """
+    POST a job-process report to the main process's status server
+    (blocking). Returns the main process's reply, None if the report
+    wasn't accepted.
+    """
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(report).encode(),
+        headers={"Content-Type": "application/json", REPORT_TOKEN_HEADER: token},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read()) if response.status == 200 else None
+    except (urllib.error.URLError, OSError, ValueError):
+        return None
+
+
+class JobReporter:
+    """Job-process side of the status server: periodic reports to the main process"""
+
+    def __init__(
+        self,
+        url: str,
+        metrics: WorkerMetrics,
+        build: Callable[[], dict[str, Any]],
+        interval: float = 2.0,
+        token: str = "",
+    ):
+        self.url = url
+        self.metrics = metrics
+        self.build = build
+        self.interval = interval
+        self.token = token
+        # The worker's load from the main process's latest reply
+        self.worker_load: float | None = None
+        self.worker_load_at = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    def _report(self, final: bool) -> dict[str, Any]:
+        return {**self.build(), "pid": os.getpid(), "final": final, "metrics": self.metrics.drain()}
+
+    def _replied(self, report: dict[str, Any], reply: dict[str, Any] | None) -> bool:
+        if reply is None:
+            self.metrics.restore(report["metrics"])
+            return False
+        if reply.get("load") is not None:
+            self.worker_load = float(reply["load"])
+            self.worker_load_at = time.monotonic()
+        return True
+
+    def send(self, final: bool = False) -> bool:
+        """Report now, blocking (for prewarm, before the job's event loop runs)"""
+        report = self._report(final)
+        return self._replied(report, post_report(self.url, report, token=self.token))
+
+    async def send_async(self, final: bool = False) -> bool:
+        """Report now without blocking the event loop"""
+        report = self._report(final)
+        return self._replied(report, await asyncio.to_thread(post_report, self.url, report, token=self.token))
+
+    def current_worker_load(self) -> float | None:
+        """The worker's load if the main process replied within the last few intervals"""
+        if self.worker_load is None or time.monotonic() - self.worker_load_at > 3 * self.interval:
+            return None
+        return self.worker_load
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop reporting and send the final report"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.send_async(final=True)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.send_async()
+
+
+def is_loopback(peer: Any) -> bool:
+    """Whether a socket peer address (host, port, ...) is on this host"""
+    try:
+        address = ipaddress.ip_address(peer[0])
+    except (TypeError, ValueError, IndexError):
+        return False
+    mapped = getattr(address, "ipv4_mapped", None)
+    return (mapped or address).is_loopback
+
+
+class StatusServer:
+    """
+    Tiny HTTP server for worker status routes (GET) and job reports (POST).
+
+    GET routes are served to anyone who can reach the port (the Docker
+    HEALTHCHECK, scrapers); POST routes only to loopback peers.
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 8080, max_body_bytes: int = 1_000_000):
+        self.host = host
+        self.port = port
+        self.max_body_bytes = max_body_bytes
+        self._routes: dict[str, Handler] = {}
+        self._post_routes: dict[str, PostHandler] = {}
+        self._server: asyncio.base_events.Server | None = None
+
+    def route(self, path: str, handler: Handler) -> None:
+        """Register a handler for a GET path"""
+        self._routes[path] = handler
+
+    def post_route(self, path: str, handler: PostHandler) -> None:
+        """Register a handler for a POST path (called with the request body)"""
+        self._post_routes[path] = handler
+
+    @property
+    def serving(self) -> bool:
+        return self._server is not None
+
+    @property
+    def bound_port(self) -> int | None:
+        """Port actually bound (differs from port when that is 0)"""
+        if self._server is None or not self._server.sockets:
+            return None
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self) -> bool:
+        """Bind and start serving, return False if the port is taken"""
+        if self._server is not None:
+            return True
+        try:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        except OSError as e:
+            print(f"[StatusServer] Not serving on :{self.port}: {e}")
+            return False
+        print(f"[StatusServer] Serving {', '.join(sorted(self._routes))} on :{self.bound_port}")
+        return True
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            headers: dict[str, str] = {}
+            while True:
+                header = await asyncio.wait_for(reader.readline(), timeout=5.0)
+                if header in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = header.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            content_length = int(headers.get("content-length") or 0)
+
+            parts = request_line.decode("latin-1").split()
+            method = parts[0] if parts else ""
+            path = parts[1].split("?", 1)[0] if len(parts) > 1 else "/"
+
+            try:
+                if method == "POST" and path in self._post_routes:
+                    if not is_loopback(writer.get_extra_info("peername")):
+                        status, content_type, body = 403, "text/plain", "forbidden\n"
+                    elif content_length > self.max_body_bytes:
+                        status, content_type, body = 400, "text/plain", "body too large\n"
+                    else:
+                        request_body = await asyncio.wait_for(reader.readexactly(content_length), timeout=5.0)
+                        status, content_type, body = self._post_routes[path](request_body, headers)
+                elif method not in ("GET", "HEAD"):
+                    status, content_type, body = 405, "text/plain", "method not allowed\n"
+                elif path not in self._routes:
+                    status, content_type, body = 404, "text/plain", "not found\n"
+                else:
+                    status, content_type, body = self._routes[path]()
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                raise
+            except Exception as e:
+                status, content_type, body = 503, "text/plain", f"error: {e}\n"
+
+            payload = body.encode()
+            writer.write(
+                (
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode("latin-1")
+            )
+            if method != "HEAD":
+                writer.write(payload)
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+# Process-wide health state (the main process's own, or a job process's)
+worker_health = WorkerHealth()
@@ -0,0 +1,336 @@
+"""
+HAUS Voice Agent - Listing Index
+
+Columnar, NumPy-backed property listing index used by the search tools.
+
+Rows are stored sorted by (suburb, price), so a suburb filter is a
+contiguous slice found through an offsets array and a price range inside
+that slice is two binary searches. Queries without a suburb go through a
+global price-sorted permutation instead. Bedroom and property-type
+predicates are applied as vectorized masks over the (already small)
+candidate range, so a query over hundreds of thousands of listings stays
+well under a millisecond.
+
+The index is loaded once per worker process at prewarm and shared
+read-only across sessions. Full listing records live behind a record
+store: an in-memory list when built from JSON, or the memory-mapped
+string heap of a snapshot file (see snapshot.py).
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, Protocol
+
+import numpy as np
+
+DEFAULT_LISTINGS_PATH = Path(__file__).parent / "fixtures" / "listings.json"
+
+PROPERTY_TYPES = ("house", "apartment", "townhouse", "villa", "land")
+
+# Spoken/colloquial property types -> canonical type
+PROPERTY_TYPE_ALIASES = {
+    "houses": "house",
+    "home": "house",
+    "homes": "house",
+    "freestanding": "house",
+    "apartments": "apartment",
+    "unit": "apartment",
+    "units": "apartment",
+    "flat": "apartment",
+    "flats": "apartment",
+    "studio": "apartment",
+    "townhouses": "townhouse",
+    "terrace": "townhouse",
+    "villas": "villa",
+}
+
+_UNKNOWN = -1
+
+# Numeric columns every index carries, in snapshot order
+COLUMN_NAMES = (
+    "suburb",
+    "price",
+    "bedrooms",
+    "bathrooms",
+    "property_type",
+    "lat",
+    "lon",
+    "price_order",
+    "price_sorted",
+)
+
+
+class RecordStore(Protocol):
+    """Row-addressed access to full listing records"""
+
+    def __len__(self) -> int: ...
+
+    def record(self, row: int) -> dict[str, Any]: ...
+
+    def row_for_id(self, listing_id: str) -> int | None: ...
+
+
+class RecordList:
+    """Record store backed by a list of listing dicts"""
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self._records = records
+        self._row_by_id = {record["id"]: row for row, record in enumerate(records)}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(self, row: int) -> dict[str, Any]:
+        return self._records[row]
+
+    def row_for_id(self, listing_id: str) -> int | None:
+        return self._row_by_id.get(listing_id)
+
+
+def normalize_property_type(property_type: str | None) -> str | None:
+    """Map a spoken property type onto one of PROPERTY_TYPES (None if unknown)"""
+    if not property_type:
+        return None
+    key = property_type.strip().lower()
+    key = PROPERTY_TYPE_ALIASES.get(key, key)
+    return key if key in PROPERTY_TYPES else None
+
+
+class ListingIndex:
+    """Read-only columnar index over property listings"""
+
+    def __init__(
+        self,
+        suburb_names: list[str],
+        suburb_offsets: np.ndarray,
+        columns: dict[str, np.ndarray],
+        records: RecordStore,
+    ):
+        self.suburb_names = suburb_names
+        self.suburb_offsets = suburb_offsets
+        self.columns = columns
+        self.price = columns["price"]
+        self.bedrooms = columns["bedrooms"]
+        self.bathrooms = columns["bathrooms"]
+        self.property_type = columns["property_type"]
+        self.suburb = columns["suburb"]
+        self.lat = columns["lat"]
+        self.lon = columns["lon"]
+        self.price_order = columns["price_order"]
+        self.price_sorted = columns["price_sorted"]
+
+        self.records = records
+        self._suburb_codes = {name.lower(): code for code, name in enumerate(suburb_names)}
+
+        for array in (self.suburb_offsets, *columns.values()):
+            array.flags.writeable = False
+
+    # -------------------------------------------------------------------------
+    # Construction
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> "ListingIndex":
+        """Build an index from listing dicts"""
+        records = list(records)
+        suburb_names = sorted({record["suburb"] for record in records}, key=str.lower)
+        codes = {name: code for code, name in enumerate(suburb_names)}
+
+        # Physical row order: by suburb, then price
+        records.sort(key=lambda record: (codes[record["suburb"]], record["price"]))
+
+        suburb = np.fromiter((codes[r["suburb"]] for r in records), np.int32, len(records))
+        price = np.fromiter((r["price"] for r in records), np.int64, len(records))
+        types = np.fromiter(
+            (_type_code(normalize_property_type(r.get("property_type"))) for r in records),
+            np.int8,
+            len(records),
+        )
+        columns = {
+            "suburb": suburb,
+            "price": price,
+            "bedrooms": np.fromiter((r.get("bedrooms") or 0 for r in records), np.int16, len(records)),
+            "bathrooms": np.fromiter((r.get("bathrooms") or 0 for r in records), np.int16, len(records)),
+            "property_type": types,
+            "lat": np.fromiter((_coord(r.get("lat")) for r in records), np.float64, len(records)),
+            "lon": np.fromiter((_coord(r.get("lon")) for r in records), np.float64, len(records)),
+        }
+        columns["price_order"] = np.argsort(price, kind="stable").astype(np.int32)
+        columns["price_sorted"] = price[columns["price_order"]]
+
+        suburb_offsets = np.searchsorted(
+            suburb, np.arange(len(suburb_names) + 1, dtype=np.int32)
+        ).astype(np.int64)
+
+        return cls(suburb_names, suburb_offsets, columns, RecordList(records))
+
+    @classmethod
+    def load(cls, path: str | Path = DEFAULT_LISTINGS_PATH) -> "ListingIndex":
+        """Load listings from a JSON file ({"listings": [...]} or a bare list)"""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get("listings", [])
+        return cls.from_records(data)
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def suburb_code(self, name: str) -> int | None:
+        """Code of a suburb in the suburb column (None if not in the index)"""
+        return self._suburb_codes.get(name.lower())
+
+    def suburbs_matching(self, location: str) -> list[str]:
+        """Suburbs named by a location string ("Bondi" also covers "Bondi Beach")"""
+        key = " ".join(location.lower().replace(",", " ").split())
+        if not key:
+            return []
+        if key in self._suburb_codes:
+            exact = self.suburb_names[self._suburb_codes[key]]
+            prefixed = [n for n in self.suburb_names if n.lower().startswith(key + " ")]
+            return [exact, *prefixed]
+        return [n for n in self.suburb_names if n.lower().startswith(key + " ")]
+
+    def search(
+        self,
+        suburbs: Iterable[str] | None = None,
+        price_min: int | None = None,
+        price_max: int | None = None,
+        bedrooms: int | None = None,
+        property_type: str | None = None,
+        limit: int | None = None,
+    ) -> np.ndarray:
+        """
+        Return row numbers of listings matching every given predicate.
+
+        Args:
+            suburbs: Suburb names to restrict to (None means anywhere)
+            price_min: Minimum price in AUD
+            price_max: Maximum price in AUD
+            bedrooms: Minimum number of bedrooms
+            property_type: Property type (house, apartment, ...)
+            limit: Maximum number of rows to return
+
+        Returns:
+            Row numbers ordered by ascending price.
+        """
+        lo_price = np.iinfo(np.int64).min if price_min is None else price_min
+        hi_price = np.iinfo(np.int64).max if price_max is None else price_max
+
+        if suburbs is not None:
+            rows = self._suburb_price_rows(suburbs, lo_price, hi_price)
+        else:
+            lo = np.searchsorted(self.price_sorted, lo_price, side="left")
+            hi = np.searchsorted(self.price_sorted, hi_price, side="right")
+            rows = self.price_order[lo:hi]
+
+        # Unrecognised spoken types don't filter anything out
+        type_name = normalize_property_type(property_type)
+
+        if len(rows) and (bedrooms is not None or type_name is not None):
+            mask = np.ones(len(rows), dtype=bool)
+            if bedrooms is not None:
+                mask &= self.bedrooms[rows] >= bedrooms
+            if type_name is not None:
+                mask &= self.property_type[rows] == _type_code(type_name)
+            rows = rows[mask]
+
+        if limit is not None:
+            rows = rows[:limit]
+        return rows
+
+    def matches(
+        self,
+        rows: np.ndarray,
+        suburbs: Iterable[str] | None = None,
+        price_min: int | None = None,
+        price_max: int | None = None,
+        bedrooms: int | None = None,
+        property_type: str | None = None,
+    ) -> np.ndarray:
+        """Boolean mask of rows (e.g. from a spatial query) matching search()'s predicates"""
+        mask = np.ones(len(rows), dtype=bool)
+        if not len(rows):
+            return mask
+        if suburbs is not None:
+            codes = [self._suburb_codes.get(name.lower()) for name in suburbs]
+            mask &= np.isin(self.suburb[rows], [code for code in codes if code is not None])
+        if price_min is not None:
+            mask &= self.price[rows] >= price_min
+        if price_max is not None:
+            mask &= self.price[rows] <= price_max
+        if bedrooms is not None:
+            mask &= self.bedrooms[rows] >= bedrooms
+        type_name = normalize_property_type(property_type)
+        if type_name is not None:
+            mask &= self.property_type[rows] == _type_code(type_name)
+        return mask
+
+    def _suburb_price_rows(
+        self, suburbs: Iterable[str], lo_price: int, hi_price: int
+    ) -> np.ndarray:
+        slices = []
+        for name in suburbs:
+            code = self._suburb_codes.get(name.lower())
+            if code is None:
+                continue
+            start, end = self.suburb_offsets[code], self.suburb_offsets[code + 1]
+            prices = self.price[start:end]
+            lo = start + np.searchsorted(prices, lo_price, side="left")
+            hi = start + np.searchsorted(prices, hi_price, side="right")
+            if hi > lo:
+                slices.append(np.arange(lo, hi, dtype=np.int32))
+
+        if not slices:
+            return np.empty(0, dtype=np.int32)
+        if len(slices) == 1:
+            return slices[0]
+        rows = np.concatenate(slices)
+        return rows[np.argsort(self.price[rows], kind="stable")]
+
+    # -------------------------------------------------------------------------
+    # Records
+    # -------------------------------------------------------------------------
+
+    def row_for_id(self, listing_id: str) -> int | None:
+        """Row number for a listing ID"""
+        return self.records.row_for_id(listing_id)
+
+    def record(self, row: int) -> dict[str, Any]:
+        """Full listing record for a row"""
+        return self.records.record(int(row))
+
+    def get(self, listing_id: str) -> dict[str, Any] | None:
+        """Full listing record for a listing ID"""
+        row = self.row_for_id(listing_id)
+        return None if row is None else self.record(row)
+
+    def summary(self, row: int) -> dict[str, Any]:
+        """Compact listing dict used in search results"""
+        record = self.record(row)
+        return {
+            "id": record["id"],
+            "address": record["address"],
+            "price": record["price"],
+            "bedrooms": record.get("bedrooms"),
+            "bathrooms": record.get("bathrooms"),
+            "property_type": record.get("property_type"),
+            "description": record.get("description", ""),
+        }
+
+
+def _type_code(property_type: str | None) -> int:
+    if property_type is None:
+        return _UNKNOWN
+    try:
+        return PROPERTY_TYPES.index(property_type)
+    except ValueError:
+        return _UNKNOWN
+
+
+def _coord(value: Any) -> float:
+    return float("nan") if value is None else float(value)
@@ -0,0 +1,141 @@
+"""
+HAUS Voice Agent - Memory Context Assembly
+
+Turns a Cortex recall response into one compact memory block for the
+LLM. Suburb preferences, facts and property interactions are scored for
+relevance to the user's latest utterance, then packed greedily under a
+token budget, so the injected context stays the same size however long
+the call runs:
+
+    Memory: likes Bondi (85), Paddington (70); avoids Parramatta.
+    Facts: has a dog; prefers north-facing homes.
+    Recent: prop-002 saved, prop-001 viewed.
+
+The block is added to the chat context on_user_turn_completed receives.
+That is a copy made for the turn's LLM request, not the session history,
+so each turn sends only its own block and blocks never accumulate.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+MEMORY_BLOCK_ID = "haus-memory-context"
+
+# Roughly four characters per token for English text; close enough for
+# budgeting without pulling in a tokenizer
+_CHARS_PER_TOKEN = 4
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Words too common to count as a query match
+_STOPWORDS = frozenset(
+    "a an and are at for i in is it me my of on or show the to what with".split()
+)
+
+
+@dataclass
+class MemoryItem:
+    """One recalled item, ready to render"""
+
+    section: str  # "likes" | "avoids" | "facts" | "recent"
+    text: str
+    relevance: float
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate LLM token count of a string"""
+    return (len(text) + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+def _terms(text: str) -> set[str]:
+    return {word for word in _WORD.findall(text.lower()) if word not in _STOPWORDS}
+
+
+def _overlap(query_terms: set[str], text: str) -> float:
+    """Fraction of an item's terms that appear in the query"""
+    terms = _terms(text)
+    if not terms or not query_terms:
+        return 0.0
+    return len(terms & query_terms) / len(terms)
+
+
+def rank_memory_items(context: dict[str, Any], query: str) -> list[MemoryItem]:
+    """Score recalled items by stored weight plus overlap with the query, best first"""
+    query_terms = _terms(query)
+    items: list[MemoryItem] = []
+
+    for pref in context.get("suburbPreferences") or []:
+        name = pref.get("suburbName")
+        if not name:
+            continue
+        score = float(pref.get("preferenceScore", 0))
+        section = "avoids" if score < 0 else "likes"
+        text = name if score < 0 else f"{name} ({score:.0f})"
+        items.append(
+            MemoryItem(section, text, abs(score) / 100.0 + _overlap(query_terms, name))
+        )
+
+    for fact in context.get("facts") or []:
+        text = fact.get("fact")
+        if not text:
+            continue
+        confidence = float(fact.get("confidence", 50)) / 100.0
+        items.append(MemoryItem("facts", text, confidence + _overlap(query_terms, text)))
+
+    # Interactions come back most recent first; decay by position
+    for position, interaction in enumerate(context.get("propertyInteractions") or []):
+        property_id = interaction.get("propertyId")
+        if not property_id:
+            continue
+        text = f"{property_id} {interaction.get('interactionType', 'viewed')}"
+        items.append(
+            MemoryItem("recent", text, 0.6 * 0.8**position + _overlap(query_terms, property_id))
+        )
+
+    items.sort(key=lambda item: item.relevance, reverse=True)
+    return items
+
+
+def render_memory_block(items: list[MemoryItem]) -> str:
+    """Render items grouped by section, keeping rank order within each"""
+    sections: dict[str, list[str]] = {"likes": [], "avoids": [], "facts": [], "recent": []}
+    for item in items:
+        sections[item.section].append(item.text)
+
+    lines = []
+    suburbs = []
+    if sections["likes"]:
+        suburbs.append("likes " + ", ".join(sections["likes"]))
+    if sections["avoids"]:
+        suburbs.append("avoids " + ", ".join(sections["avoids"]))
+    if suburbs:
+        lines.append("Memory: " + "; ".join(suburbs) + ".")
+    if sections["facts"]:
+        lines.append("Facts: " + "; ".join(sections["facts"]) + ".")
+    if sections["recent"]:
+        lines.append("Recent: " + ", ".join(sections["recent"]) + ".")
+    return "\n".join(lines)
+
+
+def build_memory_block(context: dict[str, Any], query: str, token_budget: int) -> str:
+    """
+    Most relevant recalled items that fit in token_budget, as one block.
+
+    Returns an empty string when nothing was recalled or nothing fits.
+    """
+    selected: list[MemoryItem] = []
+    block = ""
+    for item in rank_memory_items(context, query):
+        candidate = render_memory_block(selected + [item])
+        if estimate_tokens(candidate) > token_budget:
+            continue
+        selected.append(item)
+        block = candidate
+    return block
+
+
+def add_memory_block(chat_ctx: Any, block: str, role: str = "assistant") -> None:
+    """Add the memory block to a turn's ChatContext (nothing if empty)"""
+    if block:
+        chat_ctx.add_message(role=role, content=block, id=MEMORY_BLOCK_ID)
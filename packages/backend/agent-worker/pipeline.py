@@ -0,0 +1,115 @@
+"""
+HAUS Voice Agent - Load-Aware Pipeline Tiers
+
+Each new session is assigned a pipeline tier from the worker's pressure
+at the moment it starts. That is the load the main process computes for
+job dispatch from every job process's reports (see health.JobReports),
+which a job process gets back when it reports as its session starts. A
+fresh job process's own counters say nothing about the worker, so they
+are only used when the main process can't be reached:
+
+    tier      noise cancellation           turn detection   recall limit
+    full      BVC (BVCTelephony for SIP)   multilingual     10
+    reduced   NC                           multilingual     6
+    minimal   none                         VAD only         3
+
+Reduced and minimal tiers also shrink the memory block's token budget.
+Sessions keep their tier for the whole call, so under rising load new
+calls get cheaper pipelines while calls in progress are unaffected.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from health import WorkerHealth
+
+
+@dataclass(frozen=True)
+class PipelineTier:
+    """Voice pipeline settings for one session"""
+
+    name: str
+    noise_cancellation: str  # "bvc", "nc" or "off"
+    turn_detector: bool  # False: end of turn from VAD silence only
+    recall_limit: int
+    memory_budget_scale: float = 1.0
+
+    def memory_token_budget(self, budget: int) -> int:
+        return max(1, int(budget * self.memory_budget_scale))
+
+
+FULL = PipelineTier("full", "bvc", turn_detector=True, recall_limit=10)
+REDUCED = PipelineTier("reduced", "nc", turn_detector=True, recall_limit=6, memory_budget_scale=0.75)
+MINIMAL = PipelineTier("minimal", "off", turn_detector=False, recall_limit=3, memory_budget_scale=0.5)
+
+TIERS = (FULL, REDUCED, MINIMAL)
+
+
+def noise_cancellation_filter(tier: PipelineTier, is_sip: bool) -> Any:
+    """Noise-cancellation processor for a participant's audio, or None"""
+    if tier.noise_cancellation == "off":
+        return None
+
+    from livekit.plugins import noise_cancellation
+
+    if tier.noise_cancellation == "nc":
+        return noise_cancellation.NC()
+    return noise_cancellation.BVCTelephony() if is_sip else noise_cancellation.BVC()
+
+
+class PipelinePolicy:
+    """Picks a tier for each new session from the worker's current pressure"""
+
+    def __init__(
+        self,
+        health: WorkerHealth,
+        reduced_at: float = 0.6,
+        minimal_at: float = 0.85,
+        enabled: bool = True,
+        worker_load: Callable[[], float | None] | None = None,
+    ):
+        self.health = health
+        # The main process's worker load, None while unknown
+        self.worker_load = worker_load
+        self.reduced_at = reduced_at
+        self.minimal_at = minimal_at
+        self.enabled = enabled
+        self.assigned = {tier.name: 0 for tier in TIERS}
+
+    def pressure(self) -> tuple[float, str]:
+        """
+        Worker load from the main process, 0.0-1.0, and where it came from.
+        Without it, the higher of this process's CPU (with its children)
+        and event-loop lag over its budget.
+        """
+        load = self.worker_load() if self.worker_load is not None else None
+        if load is not None:
+            return min(1.0, load), "worker"
+        lag = self.health.loop_lag.lag_ms / max(self.health.lag_budget_ms, 1e-3)
+        return min(1.0, max(self.health.cpu_load(), lag)), "process"
+
+    def select(self, session_id: str = "") -> PipelineTier:
+        """Assign a tier to a new session, and log the decision"""
+        pressure, source = self.pressure()
+        if not self.enabled or pressure < self.reduced_at:
+            tier = FULL
+        elif pressure < self.minimal_at:
+            tier = REDUCED
+        else:
+            tier = MINIMAL
+
+        self.assigned[tier.name] += 1
+        print(
+            f"[Pipeline] Session {session_id or '-'}: {tier.name} tier "
+            f"({source} pressure {pressure:.2f})"
+        )
+        return tier
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "pressure": round(self.pressure()[0], 3),
+            "reduced_at": self.reduced_at,
+            "minimal_at": self.minimal_at,
+            "assigned": dict(self.assigned),
+        }
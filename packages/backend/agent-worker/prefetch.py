@@ -0,0 +1,130 @@
+"""
+HAUS Voice Agent - Property Detail Prefetch
+
+After search_properties answers, the user's next question is almost
+always about one of the results. The search tool hands its top results to
+the session's DetailPrefetcher, which loads each listing's full record and
+renders its detail text in background tasks. A follow-up
+get_property_details then takes the finished (or still running) prefetch
+instead of starting its own lookup.
+
+- one prefetcher per session, bounded; the oldest entries are dropped
+  (and cancelled if still running) first
+- a later search doesn't cancel earlier prefetches, since the user may
+  go back to an earlier result
+- a prefetch started before a catalogue update (the tool cache's
+  generation moved on) is discarded rather than served
+- cancel() stops every in-flight prefetch when the session ends
+"""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable
+
+
+@dataclass
+class PropertyDetails:
+    """A listing's full record and its rendered detail text"""
+
+    record: dict[str, Any]
+    text: str
+    # Scraped listings aren't recorded as property interactions
+    scraped: bool = False
+
+
+DetailsFn = Callable[[str], Awaitable[PropertyDetails | None]]
+
+
+class DetailPrefetcher:
+    """Per-session background prefetch of property details"""
+
+    def __init__(
+        self,
+        load: DetailsFn,
+        max_entries: int = 16,
+        generation: Callable[[], int] = lambda: 0,
+    ):
+        self._load = load
+        self.max_entries = max_entries
+        self._generation = generation
+        # property ID -> (prefetch task, generation it started in)
+        self._tasks: OrderedDict[str, tuple[asyncio.Task[PropertyDetails | None], int]] = OrderedDict()
+
+        self.scheduled = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def schedule(self, property_ids: Iterable[str]) -> int:
+        """Start prefetching listings not already prefetched; returns how many were started"""
+        started = 0
+        generation = self._generation()
+        for property_id in property_ids:
+            entry = self._tasks.get(property_id)
+            if entry is not None and entry[1] == generation and not _failed(entry[0]):
+                self._tasks.move_to_end(property_id)
+                continue
+            if entry is not None:
+                entry[0].cancel()
+            task = asyncio.create_task(self._load(property_id))
+            task.add_done_callback(_log_failure)
+            self._tasks[property_id] = (task, generation)
+            self._tasks.move_to_end(property_id)
+            started += 1
+        while len(self._tasks) > self.max_entries:
+            _, (evicted, _) = self._tasks.popitem(last=False)
+            evicted.cancel()
+        self.scheduled += started
+        return started
+
+    async def get(self, property_id: str) -> PropertyDetails | None:
+        """Prefetched details, waiting for a running prefetch (None if not prefetched or it failed)"""
+        entry = self._tasks.get(property_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        task, generation = entry
+        # wait() rather than awaiting the task, so a prefetch cancelled
+        # meanwhile is a miss instead of cancelling the caller
+        await asyncio.wait((task,))
+        if _failed(task) or generation != self._generation():
+            if self._tasks.get(property_id) is entry:
+                del self._tasks[property_id]
+            self.misses += 1
+            return None
+        details = task.result()
+        if details is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return details
+
+    def cancel(self) -> int:
+        """Cancel every in-flight prefetch (e.g. on session shutdown); returns how many were running"""
+        running = 0
+        for task, _ in self._tasks.values():
+            if not task.done():
+                task.cancel()
+                running += 1
+        self._tasks.clear()
+        return running
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._tasks),
+            "scheduled": self.scheduled,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def _failed(task: asyncio.Task) -> bool:
+    return task.done() and (task.cancelled() or task.exception() is not None)
+
+
+def _log_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        print(f"[Prefetch] Detail prefetch failed: {task.exception()}")
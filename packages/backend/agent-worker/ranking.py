@@ -0,0 +1,210 @@
+"""
+HAUS Voice Agent - Preference-Aware Result Ranking
+
+Scores candidate listings from ListingIndex.search for one user in a
+single vectorized pass over the index columns, then keeps the top k:
+
+    score = w_price     * price fit      (closeness to the budget target)
+          + w_bedrooms  * bedroom fit    (exact match best, extra rooms decay)
+          + w_suburb    * suburb score   (Cortex suburbPreferences, -1..1)
+          + w_history   * history        (saved/viewed listings and their suburbs)
+          + w_text      * text match     (BM25 for free-text keywords, scaled to 0..1)
+          + w_proximity * proximity      (closeness to a "near" target, 0..1)
+
+Features with nothing to go on (no budget, no bedroom count, no recalled
+preferences) are constant and so don't change the order; ties keep the
+index's ascending-price order.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from listings import ListingIndex
+
+# How much each interaction type says about the user's taste
+INTERACTION_WEIGHTS = {
+    "saved": 1.0,
+    "enquired": 1.0,
+    "inspected": 0.8,
+    "viewed": 0.4,
+    "dismissed": -1.0,
+}
+
+
+@dataclass
+class RankingWeights:
+    """Weights of the ranking model's features"""
+
+    price: float = 1.0
+    bedrooms: float = 0.6
+    suburb: float = 0.5
+    history: float = 0.4
+    # Share of an interaction's weight passed on to its whole suburb
+    suburb_history: float = 0.3
+    text: float = 1.5
+    proximity: float = 1.0
+
+
+@dataclass
+class RankingProfile:
+    """Per-user signals from Cortex recall, resolved against the index"""
+
+    suburb_scores: np.ndarray  # float32 per suburb code, -1..1
+    row_history: dict[int, float]  # row -> interaction weight
+
+    @classmethod
+    def from_recall(cls, index: ListingIndex, context: dict[str, Any] | None) -> "RankingProfile":
+        suburb_scores = np.zeros(len(index.suburb_names), dtype=np.float32)
+        row_history: dict[int, float] = {}
+        context = context or {}
+
+        for pref in context.get("suburbPreferences") or []:
+            code = index.suburb_code(pref.get("suburbName") or "")
+            if code is not None:
+                score = float(pref.get("preferenceScore", 0)) / 100.0
+                suburb_scores[code] = max(-1.0, min(1.0, score))
+
+        for interaction in context.get("propertyInteractions") or []:
+            row = index.row_for_id(interaction.get("propertyId") or "")
+            if row is not None:
+                weight = INTERACTION_WEIGHTS.get(interaction.get("interactionType", ""), 0.2)
+                row_history[row] = row_history.get(row, 0.0) + weight
+
+        return cls(suburb_scores, row_history)
+
+    @property
+    def empty(self) -> bool:
+        return not self.row_history and not self.suburb_scores.any()
+
+
+class ListingRanker:
+    """Batched weighted scoring of candidate rows"""
+
+    def __init__(self, index: ListingIndex, weights: RankingWeights | None = None):
+        self.index = index
+        self.weights = weights or RankingWeights()
+
+    def scores(
+        self,
+        rows: np.ndarray,
+        profile: RankingProfile,
+        budget_min: int | None = None,
+        budget_max: int | None = None,
+        bedrooms: int | None = None,
+        text_scores: np.ndarray | None = None,
+        proximity: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Score every candidate row (float32, higher is better)"""
+        w = self.weights
+        scores = np.zeros(len(rows), dtype=np.float32)
+        if not len(rows):
+            return scores
+
+        target = _budget_target(budget_min, budget_max)
+        if target is not None:
+            price = self.index.price[rows].astype(np.float32)
+            scores += w.price * np.clip(1.0 - np.abs(price - target) / target, 0.0, 1.0)
+
+        if bedrooms is not None:
+            extra = self.index.bedrooms[rows].astype(np.float32) - bedrooms
+            fit = np.exp(-0.5 * np.clip(extra, 0.0, None))
+            scores += w.bedrooms * np.where(extra < 0, 0.0, fit)
+
+        if text_scores is not None and len(text_scores) and text_scores.max() > 0:
+            scores += w.text * text_scores / text_scores.max()
+
+        if proximity is not None:
+            scores += w.proximity * proximity
+
+        suburbs = self.index.suburb[rows]
+        if profile.suburb_scores.any():
+            scores += w.suburb * profile.suburb_scores[suburbs]
+
+        if profile.row_history:
+            history_rows = np.fromiter(profile.row_history.keys(), np.int64, len(profile.row_history))
+            history_weights = np.fromiter(
+                profile.row_history.values(), np.float32, len(profile.row_history)
+            )
+            # Taste carries over to other listings in the same suburbs
+            suburb_history = np.zeros(len(profile.suburb_scores), dtype=np.float32)
+            np.add.at(suburb_history, self.index.suburb[history_rows], history_weights)
+            scores += w.history * w.suburb_history * np.tanh(suburb_history[suburbs])
+
+            order = np.argsort(history_rows)
+            position = np.searchsorted(history_rows[order], rows)
+            position = np.minimum(position, len(history_rows) - 1)
+            hit = history_rows[order][position] == rows
+            scores += w.history * np.where(hit, history_weights[order][position], 0.0)
+
+        return scores
+
+    def top_k(
+        self,
+        rows: np.ndarray,
+        profile: RankingProfile,
+        k: int,
+        budget_min: int | None = None,
+        budget_max: int | None = None,
+        bedrooms: int | None = None,
+        text_scores: np.ndarray | None = None,
+        proximity: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Best k rows, best first (ties keep the input order)"""
+        return rows[
+            self.top_positions(
+                rows, profile, k, budget_min, budget_max, bedrooms, text_scores, proximity
+            )
+        ]
+
+    def top_positions(
+        self,
+        rows: np.ndarray,
+        profile: RankingProfile,
+        k: int,
+        budget_min: int | None = None,
+        budget_max: int | None = None,
+        bedrooms: int | None = None,
+        text_scores: np.ndarray | None = None,
+        proximity: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Positions in `rows` of the best k, best first (ties keep the input order)"""
+        if not len(rows) or k <= 0:
+            return np.arange(0)
+        if (
+            profile.empty
+            and budget_max is None
+            and budget_min is None
+            and bedrooms is None
+            and text_scores is None
+            and proximity is None
+        ):
+            return np.arange(min(k, len(rows)))
+
+        scores = self.scores(
+            rows, profile, budget_min, budget_max, bedrooms, text_scores, proximity
+        )
+        if len(rows) > k:
+            # Partition, then widen to every row tied at the cutoff so ties
+            # are broken by input order below
+            keep = np.argpartition(-scores, k - 1)[:k]
+            cutoff = scores[keep].min()
+            keep = np.flatnonzero(scores >= cutoff)
+        else:
+            keep = np.arange(len(rows))
+        return keep[np.lexsort((keep, -scores[keep]))][:k]
+
+
+def _budget_target(budget_min: int | None, budget_max: int | None) -> float | None:
+    """Price the user is most likely aiming for"""
+    if budget_max is not None and budget_min is not None:
+        target = (budget_min + budget_max) / 2.0 if budget_max > budget_min else float(budget_max)
+    elif budget_max is not None:
+        # Buyers tend to spend close to their ceiling
+        target = 0.9 * budget_max
+    elif budget_min is not None:
+        target = float(budget_min)
+    else:
+        return None
+    return target if target > 0 else None
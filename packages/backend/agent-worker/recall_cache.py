@@ -0,0 +1,146 @@
+"""
+HAUS Voice Agent - Tiered Recall Cache
+
+In-process cache for Cortex recall results, owned by a session's
+ConvexClient. A recall response is split into two tiers:
+
+- stable:   facts and suburb preferences, which rarely change within a
+            session and don't depend on the query
+- volatile: memories and property interactions, which are query-dependent
+            and change whenever the agent stores a conversation
+
+Volatile entries are also reused across near-identical queries ("what
+about 3 bedrooms?" vs "what about three bedrooms"), but only when both
+name the same numbers and places: memories recalled for Bondi don't
+answer a question about Manly. Both tiers are bounded by TTL and LRU
+eviction, and writes invalidate the affected tier.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from speculative import LocationsFn, normalize_query, query_anchors, query_similarity
+
+STABLE_KEYS = ("facts", "suburbPreferences")
+VOLATILE_KEYS = ("memories", "propertyInteractions")
+
+
+@dataclass
+class _CacheEntry:
+    """A cached slice of a recall response"""
+
+    value: dict[str, Any]
+    expires_at: float
+    query: str = ""
+    limit: int = 0
+
+
+class RecallCache:
+    """TTL + LRU cache for recall_context results, split into stable and volatile tiers"""
+
+    def __init__(
+        self,
+        stable_ttl: float = 300.0,
+        volatile_ttl: float = 60.0,
+        max_entries: int = 64,
+        similarity_threshold: float = 0.75,
+        clock: Callable[[], float] = time.monotonic,
+        locations: LocationsFn | None = None,
+    ):
+        self.stable_ttl = stable_ttl
+        self.volatile_ttl = volatile_ttl
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self._clock = clock
+        # Places named in a query, which must match for a similar query's entry
+        self.locations = locations
+
+        # user_id -> stable slice
+        self._stable: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # (user_id, normalized query, limit) -> volatile slice
+        self._volatile: OrderedDict[tuple[str, str, int], _CacheEntry] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: str, query: str, limit: int) -> dict[str, Any] | None:
+        """Return a cached recall response, or None if either tier is missing"""
+        now = self._clock()
+        stable = self._get_live(self._stable, user_id, now)
+        volatile = self._find_volatile(user_id, query, limit, now) if stable else None
+
+        if stable is None or volatile is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return {**stable.value, **volatile.value}
+
+    def put(self, user_id: str, query: str, limit: int, result: dict[str, Any]) -> None:
+        """Cache a successful recall response"""
+        now = self._clock()
+        stable = {key: result.get(key, []) for key in STABLE_KEYS}
+        volatile = {key: result.get(key, []) for key in VOLATILE_KEYS}
+
+        self._store(self._stable, user_id, _CacheEntry(stable, now + self.stable_ttl))
+        self._store(
+            self._volatile,
+            (user_id, normalize_query(query), limit),
+            _CacheEntry(volatile, now + self.volatile_ttl, query=query, limit=limit),
+        )
+
+    def invalidate(self, user_id: str, stable: bool = True, volatile: bool = True) -> None:
+        """Drop cached tiers for a user after a write to Cortex"""
+        if stable:
+            self._stable.pop(user_id, None)
+        if volatile:
+            for key in [key for key in self._volatile if key[0] == user_id]:
+                del self._volatile[key]
+
+    def clear(self) -> None:
+        """Drop everything"""
+        self._stable.clear()
+        self._volatile.clear()
+
+    def _find_volatile(
+        self, user_id: str, query: str, limit: int, now: float
+    ) -> _CacheEntry | None:
+        exact = self._get_live(self._volatile, (user_id, normalize_query(query), limit), now)
+        if exact is not None:
+            return exact
+
+        # Fall back to the most similar cached query about the same numbers
+        # and places, fetched with at least the requested limit
+        anchors = query_anchors(query, self.locations)
+        best_key, best_score = None, self.similarity_threshold
+        for key, entry in self._volatile.items():
+            if key[0] != user_id or entry.limit < limit or entry.expires_at <= now:
+                continue
+            if query_anchors(entry.query, self.locations) != anchors:
+                continue
+            score = query_similarity(entry.query, query)
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+        self._volatile.move_to_end(best_key)
+        return self._volatile[best_key]
+
+    def _get_live(self, store: OrderedDict, key: Any, now: float) -> _CacheEntry | None:
+        entry = store.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            del store[key]
+            return None
+        store.move_to_end(key)
+        return entry
+
+    def _store(self, store: OrderedDict, key: Any, entry: _CacheEntry) -> None:
+        store[key] = entry
+        store.move_to_end(key)
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
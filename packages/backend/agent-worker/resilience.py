@@ -0,0 +1,193 @@
+"""
+HAUS Voice Agent - Cortex Call Resilience
+
+Keeps a slow or failing Cortex from eating a voice turn's latency budget:
+
+- AdaptiveDeadline: per-endpoint request deadline derived from recently
+  observed latency (p99 x headroom, clamped to a floor and ceiling).
+  Timed-out requests count as observations at the deadline, so if Cortex
+  gets slower for good the deadline grows with it instead of failing
+  every request.
+- CircuitBreaker: after consecutive failures (timeouts, transport errors,
+  5xx) calls are skipped outright for a cool-down, then a single probe
+  decides whether to close again.
+- CortexGuard bundles one breaker with a deadline per endpoint and the
+  hedge delay for idempotent calls (p95 of the endpoint's latency).
+
+A guard is shared by every session in the worker process; Cortex health
+is not a per-session property.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Callable
+
+
+class CortexUnavailable(Exception):
+    """A Cortex call was skipped (circuit open) or ran out of time"""
+
+
+class AdaptiveDeadline:
+    """Request deadline from a sliding window of observed latencies (seconds)"""
+
+    def __init__(
+        self,
+        initial: float,
+        floor: float = 0.2,
+        ceiling: float = 10.0,
+        headroom: float = 1.5,
+        window: int = 200,
+        warmup: int = 20,
+    ):
+        self.initial = initial
+        self.floor = floor
+        self.ceiling = ceiling
+        self.headroom = headroom
+        self.warmup = warmup
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    @property
+    def warm(self) -> bool:
+        return len(self._samples) >= self.warmup
+
+    def percentile(self, q: float) -> float | None:
+        """q-th percentile (0-100) of the window, None until warmed up"""
+        if not self.warm:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(len(ordered) * q / 100.0) - 1))]
+
+    def current(self) -> float:
+        p99 = self.percentile(99)
+        deadline = self.initial if p99 is None else p99 * self.headroom
+        return min(self.ceiling, max(self.floor, deadline))
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 15.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.skipped = 0
+        self._probe_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are being skipped right now (without claiming a probe)"""
+        return self.state == self.OPEN and self._clock() - self.opened_at < self.reset_timeout
+
+    def allow(self) -> bool:
+        """Whether a call may go out now"""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and self._clock() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.skipped += 1
+        return False
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            print(f"[CircuitBreaker] {self.name} recovered, closing circuit")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def release(self) -> None:
+        """Give back a half-open probe whose call was cancelled before it finished"""
+        if self.state == self.HALF_OPEN:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or (
+            self.state == self.CLOSED and self.failures >= self.failure_threshold
+        ):
+            if self.state == self.CLOSED:
+                print(
+                    f"[CircuitBreaker] {self.name} failed {self.failures} times in a row, "
+                    f"skipping calls for {self.reset_timeout:.0f}s"
+                )
+            self.state = self.OPEN
+            self.opened_at = self._clock()
+            self._probe_in_flight = False
+
+
+class CortexGuard:
+    """Breaker, per-endpoint deadlines and hedge delays for Cortex calls"""
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        recall_budget: float = 1.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 15.0,
+        hedge_recall: bool = True,
+    ):
+        self.timeout = timeout
+        self.recall_budget = recall_budget
+        self.hedge_recall = hedge_recall
+        self.breaker = CircuitBreaker("cortex", failure_threshold, reset_timeout)
+        self._deadlines: dict[str, AdaptiveDeadline] = {}
+
+    def deadline_tracker(self, endpoint: str) -> AdaptiveDeadline:
+        tracker = self._deadlines.get(endpoint)
+        if tracker is None:
+            # Recall sits on the turn's critical path; writes can wait longer
+            ceiling = self.recall_budget if endpoint == "recall" else self.timeout
+            tracker = self._deadlines[endpoint] = AdaptiveDeadline(
+                initial=ceiling, ceiling=ceiling
+            )
+        return tracker
+
+    def deadline(self, endpoint: str) -> float:
+        return self.deadline_tracker(endpoint).current()
+
+    def hedge_delay(self, endpoint: str) -> float | None:
+        """When to send a duplicate request, None if hedging is off or not warmed up"""
+        if not self.hedge_recall:
+            return None
+        return self.deadline_tracker(endpoint).percentile(95)
+
+    def record_success(self, endpoint: str, seconds: float) -> None:
+        self.deadline_tracker(endpoint).observe(seconds)
+        self.breaker.record_success()
+
+    def record_failure(self, endpoint: str, seconds: float | None = None) -> None:
+        if seconds is not None:
+            self.deadline_tracker(endpoint).observe(seconds)
+        self.breaker.record_failure()
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "skipped": self.breaker.skipped,
+            "deadlines_ms": {
+                endpoint: round(tracker.current() * 1000.0, 1)
+                for endpoint, tracker in sorted(self._deadlines.items())
+            },
+        }
@@ -0,0 +1,441 @@
+"""
+HAUS Voice Agent - Live Listing Crawler
+
+Backs the scrape_listings tool: fetches a listing site's search pages for
+a suburb and parses them into records shaped like ListingIndex.summary(),
+so scraped results read the same as search_properties results.
+
+- one bounded connection pool per worker process, separate from the
+  Cortex pool
+- per-host token-bucket rate limiting, and robots.txt is honoured
+- result pages are fetched concurrently (within the host's rate)
+- pages are parsed incrementally from schema.org JSON-LD listing markup,
+  stopping once enough listings are found
+- parsed pages are cached by content hash, and whole crawls by
+  (site, suburb) for a TTL, so repeat queries never re-fetch
+- a crawl whose every page failed raises SiteUnavailable and isn't
+  cached, so the next query tries the site again
+- robots.txt is re-fetched after a TTL, and soon after a failed fetch
+
+Point HAUS_SCRAPE_SITE_URL at bench.fake_listing_site to crawl fixture
+pages locally.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Any, Iterator
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import httpx
+
+from listings import normalize_property_type
+from tool_cache import ToolResultCache, make_key
+
+USER_AGENT = "HausVoiceAgent/0.1 (+https://haus.com.au/bot)"
+
+# schema.org types that describe a listed property
+LISTING_TYPES = {
+    "accommodation",
+    "apartment",
+    "house",
+    "place",
+    "product",
+    "realestatelisting",
+    "residence",
+    "singlefamilyresidence",
+}
+
+
+@dataclass(frozen=True)
+class SiteProfile:
+    """URL scheme of a listing site's search pages"""
+
+    name: str
+    base_url: str
+    search_path: str  # formatted with slug and page
+
+    def slug(self, suburb: str, state: str, postcode: str | None) -> str:
+        parts = [suburb, state] + ([postcode] if postcode else [])
+        if self.name == "realestate":
+            return ",+".join(part.lower().replace(" ", "+") for part in parts)
+        return "-".join(part.lower().replace(" ", "-") for part in parts)
+
+    def search_url(
+        self, suburb: str, state: str, postcode: str | None, page: int, base_url: str | None = None
+    ) -> str:
+        path = self.search_path.format(slug=self.slug(suburb, state, postcode), page=page)
+        return (base_url or self.base_url).rstrip("/") + path
+
+
+SITES = {
+    "domain": SiteProfile("domain", "https://www.domain.com.au", "/sale/{slug}/?page={page}"),
+    "realestate": SiteProfile("realestate", "https://www.realestate.com.au", "/buy/in-{slug}/list-{page}"),
+}
+
+
+class SiteUnavailable(Exception):
+    """Every search page of a crawl failed (the site is down or refusing us)"""
+
+    def __init__(self, site: str):
+        super().__init__(f"{site} is unavailable")
+        self.site = site
+
+
+class HostRateLimiter:
+    """Token bucket per host: `rate` requests/second with bursts of `burst`"""
+
+    def __init__(self, rate: float = 1.0, burst: int = 2):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, tuple[float, float]] = {}  # host -> (tokens, updated)
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, host: str) -> None:
+        if self.rate <= 0:
+            return
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(host, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+            if tokens < 1.0:
+                await asyncio.sleep((1.0 - tokens) / self.rate)
+                now = time.monotonic()
+                tokens = 1.0
+            self._buckets[host] = (tokens - 1.0, now)
+
+
+class ListingPageParser(HTMLParser):
+    """Incremental parser collecting listings from JSON-LD script blocks"""
+
+    def __init__(self, site: str, page_url: str):
+        super().__init__(convert_charrefs=True)
+        self.site = site
+        self.page_url = page_url
+        self.records: list[dict[str, Any]] = []
+        self._in_json_ld = False
+        self._script: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "script" and dict(attrs).get("type") == "application/ld+json":
+            self._in_json_ld = True
+            self._script = []
+
+    def handle_data(self, data: str) -> None:
+        if self._in_json_ld:
+            self._script.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag != "script" or not self._in_json_ld:
+            return
+        self._in_json_ld = False
+        try:
+            data = json.loads("".join(self._script))
+        except ValueError:
+            return
+        for item in _json_ld_items(data):
+            record = listing_from_json_ld(item, self.site, self.page_url)
+            if record is not None:
+                self.records.append(record)
+
+
+def _json_ld_items(data: Any) -> Iterator[dict[str, Any]]:
+    """Every object in a JSON-LD document, including @graph and ItemList entries"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _json_ld_items(item)
+    elif isinstance(data, dict):
+        yield data
+        for key in ("@graph", "itemListElement", "item", "mainEntity"):
+            if key in data:
+                yield from _json_ld_items(data[key])
+
+
+def _number(value: Any) -> int | None:
+    if isinstance(value, dict):
+        value = value.get("value")
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        digits = re.sub(r"[^\d.]", "", value)
+        try:
+            return int(float(digits)) if digits else None
+        except ValueError:
+            return None
+    return None
+
+
+def listing_from_json_ld(item: dict[str, Any], site: str, page_url: str) -> dict[str, Any] | None:
+    """Listing record (ListingIndex.summary() fields plus source) from a JSON-LD object"""
+    types = item.get("@type")
+    types = types if isinstance(types, list) else [types]
+    if not any(isinstance(t, str) and t.lower() in LISTING_TYPES for t in types):
+        return None
+    address = item.get("address")
+    if not isinstance(address, dict):
+        return None
+
+    street = address.get("streetAddress") or ""
+    suburb = address.get("addressLocality") or ""
+    state = address.get("addressRegion") or ""
+    postcode = address.get("postalCode") or ""
+    if not street and not suburb:
+        return None
+    full_address = ", ".join(
+        part for part in (street, " ".join(p for p in (suburb, state, postcode) if p)) if part
+    )
+
+    offers = item.get("offers")
+    offers = offers[0] if isinstance(offers, list) and offers else offers
+    price = _number(offers.get("price")) if isinstance(offers, dict) else _number(item.get("price"))
+
+    url = item.get("url") or (offers.get("url") if isinstance(offers, dict) else None) or page_url
+    identifier = item.get("identifier") or item.get("@id") or url
+    if isinstance(identifier, dict):
+        identifier = identifier.get("value")
+    identifier = str(identifier)
+    # Short site IDs are kept (speakable); URLs are hashed
+    if not re.fullmatch(r"[\w-]{1,32}", identifier):
+        identifier = hashlib.sha1(identifier.encode()).hexdigest()[:12]
+    listing_id = f"{site}-{identifier}"
+
+    property_type = next(
+        (normalize_property_type(t) for t in types if isinstance(t, str) and normalize_property_type(t)),
+        None,
+    )
+    return {
+        "id": listing_id,
+        "address": full_address,
+        "price": price,
+        "bedrooms": _number(item.get("numberOfBedrooms") or item.get("numberOfRooms")),
+        "bathrooms": _number(item.get("numberOfBathroomsTotal") or item.get("numberOfFullBathrooms")),
+        "property_type": property_type,
+        "description": (item.get("description") or "")[:300],
+        "suburb": suburb,
+        "url": url,
+        "source": site,
+    }
+
+
+class ListingCrawler:
+    """Rate-limited concurrent crawler over listing sites' search pages"""
+
+    def __init__(
+        self,
+        max_connections: int = 4,
+        rate_per_host: float = 1.0,
+        burst: int = 2,
+        max_pages: int = 3,
+        timeout: float = 8.0,
+        cache_ttl: float = 900.0,
+        site_url: str | None = None,
+        max_page_bytes: int = 2_000_000,
+        parse_cache_size: int = 256,
+        robots_ttl: float = 3600.0,
+        robots_retry: float = 60.0,
+        http_client: httpx.AsyncClient | None = None,
+    ):
+        self.max_pages = max_pages
+        self.site_url = site_url or None
+        self.max_page_bytes = max_page_bytes
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+        self._owns_http_client = http_client is None
+        self.rate_limiter = HostRateLimiter(rate_per_host, burst)
+        self.crawl_cache = ToolResultCache(max_entries=256, ttl=cache_ttl)
+        self._parse_cache: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+        self._parse_cache_size = parse_cache_size
+        # origin -> (robots.txt load, when it started); a load is reused for
+        # robots_ttl, or robots_retry if robots.txt couldn't be fetched
+        self._robots: dict[str, tuple[asyncio.Future[tuple[RobotFileParser | None, float]], float]] = {}
+        self.robots_ttl = robots_ttl
+        self.robots_retry = robots_retry
+        # Scraped records by ID, for get_property_details follow-ups
+        self._records: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self.pages_fetched = 0
+        self.pages_parsed = 0
+        self.parse_cache_hits = 0
+
+    async def search(
+        self,
+        site: str,
+        suburb: str,
+        state: str,
+        postcode: str | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """
+        Listings for a suburb from a site's first max_pages search pages
+        (cached for the TTL). Raises SiteUnavailable, and caches nothing,
+        when every page failed.
+        """
+        profile = SITES.get(site)
+        if profile is None:
+            raise ValueError(f"unknown listing site {site!r} (expected one of {', '.join(SITES)})")
+
+        async def _crawl() -> list[dict[str, Any]]:
+            urls = [
+                profile.search_url(suburb, state, postcode, page, self.site_url)
+                for page in range(1, self.max_pages + 1)
+            ]
+            pages = await asyncio.gather(*(self._fetch_listings(site, url, limit) for url in urls))
+            if all(page is None for page in pages):
+                raise SiteUnavailable(site)
+            records: dict[str, dict[str, Any]] = {}
+            for page in pages:
+                for record in page or ():
+                    records.setdefault(record["id"], record)
+            return list(records.values())[:limit]
+
+        records = await self.crawl_cache.get_or_compute(
+            make_key("scrape_listings", site=site, suburb=suburb, state=state, postcode=postcode, limit=limit),
+            _crawl,
+            tags=("scrape", f"site:{site}"),
+        )
+        for record in records:
+            self._records[record["id"]] = record
+            self._records.move_to_end(record["id"])
+        while len(self._records) > 1024:
+            self._records.popitem(last=False)
+        return records
+
+    def get(self, listing_id: str) -> dict[str, Any] | None:
+        """A previously scraped listing by ID"""
+        return self._records.get(listing_id)
+
+    async def _fetch_listings(self, site: str, url: str, limit: int) -> list[dict[str, Any]] | None:
+        """A search page's listings (None if the page couldn't be fetched)"""
+        host = urlsplit(url).netloc
+        if not await self._allowed(url):
+            print(f"[Scraper] robots.txt disallows {url}")
+            return []
+
+        await self.rate_limiter.acquire(host)
+        try:
+            body = await self._fetch(url)
+        except httpx.HTTPError as e:
+            print(f"[Scraper] Fetch failed for {url}: {e}")
+            return None
+        if body is None:
+            return None
+        self.pages_fetched += 1
+
+        # Records carry site-prefixed IDs, so the site is part of the key
+        digest = hashlib.sha256(f"{site}\n{body}".encode()).hexdigest()
+        cached = self._parse_cache.get(digest)
+        if cached is not None:
+            self._parse_cache.move_to_end(digest)
+            self.parse_cache_hits += 1
+            return cached
+
+        records = self._parse(site, url, body, limit)
+        self._parse_cache[digest] = records
+        while len(self._parse_cache) > self._parse_cache_size:
+            self._parse_cache.popitem(last=False)
+        return records
+
+    async def _fetch(self, url: str) -> str | None:
+        """Page body (None for non-200 or oversized pages)"""
+        async with self.http_client.stream("GET", url) as response:
+            if response.status_code != 200:
+                return None
+            chunks: list[bytes] = []
+            size = 0
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if size > self.max_page_bytes:
+                    return None
+                chunks.append(chunk)
+            return b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+
+    def _parse(self, site: str, url: str, body: str, limit: int, chunk_size: int = 65536) -> list[dict[str, Any]]:
+        """Feed the page to the parser in chunks, stopping once `limit` listings are found"""
+        parser = ListingPageParser(site, url)
+        for start in range(0, len(body), chunk_size):
+            parser.feed(body[start : start + chunk_size])
+            if len(parser.records) >= limit:
+                break
+        else:
+            parser.close()
+        self.pages_parsed += 1
+        return parser.records[:limit]
+
+    async def _allowed(self, url: str) -> bool:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        # Concurrent page fetches share one robots.txt request per origin
+        entry = self._robots.get(origin)
+        if entry is None or self._robots_expired(entry):
+            entry = self._robots[origin] = (asyncio.ensure_future(self._load_robots(origin)), time.monotonic())
+        robots, _ = await asyncio.shield(entry[0])
+        return robots is None or robots.can_fetch(USER_AGENT, url)
+
+    @staticmethod
+    def _robots_expired(entry: tuple[asyncio.Future, float]) -> bool:
+        load, started = entry
+        if not load.done():
+            return False
+        if load.cancelled() or load.exception() is not None:
+            return True
+        _, ttl = load.result()
+        return time.monotonic() - started > ttl
+
+    async def _load_robots(self, origin: str) -> tuple[RobotFileParser | None, float]:
+        """
+        Parsed robots.txt (None when the site has none or it can't be
+        fetched) and how long to keep it
+        """
+        try:
+            response = await self.http_client.get(f"{origin}/robots.txt")
+        except httpx.HTTPError:
+            return None, self.robots_retry
+        if response.status_code >= 500:
+            return None, self.robots_retry
+        if response.status_code != 200:
+            return None, self.robots_ttl
+        robots = RobotFileParser()
+        robots.parse(response.text.splitlines())
+        return robots, self.robots_ttl
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pages_fetched": self.pages_fetched,
+            "pages_parsed": self.pages_parsed,
+            "parse_cache_hits": self.parse_cache_hits,
+            "crawl_cache": self.crawl_cache.stats(),
+        }
+
+    async def aclose(self) -> None:
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+
+def filter_listings(
+    records: list[dict[str, Any]],
+    budget_min: int | None = None,
+    budget_max: int | None = None,
+    bedrooms: int | None = None,
+) -> list[dict[str, Any]]:
+    """Apply search_properties' budget and bedroom filters (unknown values pass)"""
+    results = []
+    for record in records:
+        price, beds = record.get("price"), record.get("bedrooms")
+        if price is not None and budget_min is not None and price < budget_min:
+            continue
+        if price is not None and budget_max is not None and price > budget_max:
+            continue
+        if beds is not None and bedrooms is not None and beds < bedrooms:
+            continue
+        results.append(record)
+    return results
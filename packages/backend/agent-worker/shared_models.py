@@ -0,0 +1,87 @@
+"""
+HAUS Voice Agent - Shared Voice Models
+
+One Silero VAD and one multilingual turn detector per job process,
+reused by every session the process runs. The VAD keeps per-session
+state in the streams it opens, and the turn detector takes the chat
+context on each prediction, so neither instance carries session state.
+
+The VAD is loaded at prewarm. The turn detector needs the job's
+inference executor, so it is built by the first session and reused
+after that. Load time and resident-memory growth are recorded for each
+model and served on the status port (/models).
+
+The plugins are imported on first use (at prewarm), not when agent.py is
+imported, so the main worker process never pays for them.
+"""
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from health import WorkerHealth
+
+if TYPE_CHECKING:
+    from livekit.plugins import silero
+    from livekit.plugins.turn_detector.multilingual import MultilingualModel
+
+
+class SharedModels:
+    """Process-wide VAD and turn-detector instances"""
+
+    def __init__(self):
+        self._vad: "silero.VAD | None" = None
+        self._turn_detector: "MultilingualModel | None" = None
+        self.load_ms: dict[str, float] = {}
+        self.rss_mb: dict[str, float] = {}
+        self.sessions_served = 0
+
+    def _timed_load(self, name: str, factory: Any) -> Any:
+        rss_before = WorkerHealth.rss_bytes()
+        start = time.perf_counter()
+        model = factory()
+        self.load_ms[name] = round((time.perf_counter() - start) * 1000.0, 1)
+        self.rss_mb[name] = round((WorkerHealth.rss_bytes() - rss_before) / 1e6, 1)
+        print(
+            f"[SharedModels] Loaded {name} in {self.load_ms[name]} ms "
+            f"(+{self.rss_mb[name]} MB resident)"
+        )
+        return model
+
+    def load_vad(self) -> "silero.VAD":
+        """Load the shared VAD now (at prewarm) if it isn't loaded yet"""
+        if self._vad is None:
+            from livekit.plugins import silero
+
+            self._vad = self._timed_load("vad", silero.VAD.load)
+        return self._vad
+
+    @property
+    def vad(self) -> "silero.VAD":
+        return self.load_vad()
+
+    @property
+    def turn_detector(self) -> "MultilingualModel":
+        """Shared turn detector (must first be read inside a job context)"""
+        if self._turn_detector is None:
+            from livekit.plugins.turn_detector.multilingual import MultilingualModel
+
+            self._turn_detector = self._timed_load("turn_detector", MultilingualModel)
+        return self._turn_detector
+
+    def for_session(self, turn_detector: bool = True) -> tuple["silero.VAD", "MultilingualModel | None"]:
+        """VAD and turn detector (None for VAD-only turn detection) for a new session"""
+        self.sessions_served += 1
+        return self.vad, self.turn_detector if turn_detector else None
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "loaded": sorted(self.load_ms),
+            "load_ms": self.load_ms,
+            "rss_mb": self.rss_mb,
+            "sessions_served": self.sessions_served,
+            "process_rss_mb": round(WorkerHealth.rss_bytes() / 1e6, 1),
+        }
+
+
+# Process-wide models shared by every session in this worker process
+shared_models = SharedModels()
@@ -0,0 +1,314 @@
+"""
+HAUS Voice Agent - Listing Snapshot Format
+
+Compact on-disk format for the listing index that every job process
+memory-maps read-only, so the property catalogue is held once in the OS
+page cache instead of once per process.
+
+Layout (little-endian):
+
+    magic        8 bytes   b"HAUSLST1"
+    toc_length   uint32
+    reserved     uint32
+    toc          toc_length bytes of UTF-8 JSON
+    blocks       64-byte aligned column and heap blocks described by the toc
+
+The toc lists the suburb names, every fixed-width numeric column of the
+ListingIndex (dtype, offset, count) and two string heaps: full listing
+records as UTF-8 JSON addressed by a uint64 offsets column, and listing
+IDs addressed the same way with an ID-sorted row permutation for binary
+search. Columns are wrapped with np.frombuffer (zero-copy); records are
+only decoded when a tool formats them.
+
+The snapshot also carries the main segment of the full-text index
+(text_index.py): document lengths as a column, and each term's
+compressed postings in two heaps (varint doc IDs and byte term
+frequencies) addressed by per-term offsets columns, with the sorted
+terms in a third heap for binary search. Job processes serve postings
+as slices of the mapping instead of building the index themselves.
+
+Build a snapshot from a JSON catalogue with:
+
+    python snapshot.py fixtures/listings.json listings.snap
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator, Mapping
+
+import numpy as np
+
+from listings import COLUMN_NAMES, ListingIndex
+from text_index import PostingList, TextIndex
+
+MAGIC = b"HAUSLST1"
+# Part of the cache key, so snapshots cached by older builds are rebuilt
+FORMAT_VERSION = 2
+_HEADER = struct.Struct("<8sII")
+_ALIGN = 64
+
+
+# =============================================================================
+# Writing
+# =============================================================================
+
+def write_snapshot(index: ListingIndex, path: str | Path) -> None:
+    """Serialize a listing index to a snapshot file (atomically replaced)"""
+    n_rows = len(index)
+    records = [
+        json.dumps(index.record(row), ensure_ascii=False, separators=(",", ":")).encode()
+        for row in range(n_rows)
+    ]
+    ids = [index.record(row)["id"].encode() for row in range(n_rows)]
+    id_order = np.array(sorted(range(n_rows), key=ids.__getitem__), dtype=np.int32)
+
+    arrays: dict[str, np.ndarray] = {name: index.columns[name] for name in COLUMN_NAMES}
+    arrays["suburb_offsets"] = index.suburb_offsets
+    arrays["record_offsets"] = _offsets(records)
+    arrays["id_offsets"] = _offsets(ids)
+    arrays["id_order"] = id_order
+    heaps = {"records": b"".join(records), "ids": b"".join(ids)}
+
+    postings, doc_len = TextIndex.from_listings(index).main_segment()
+    terms = sorted(postings, key=str.encode)
+    term_blobs = [term.encode() for term in terms]
+    arrays["text_doc_len"] = doc_len[:n_rows].astype(np.float32)
+    arrays["text_term_offsets"] = _offsets(term_blobs)
+    arrays["text_doc_offsets"] = _offsets([postings[term].docs for term in terms])
+    arrays["text_tf_offsets"] = _offsets([postings[term].tfs for term in terms])
+    heaps["text_terms"] = b"".join(term_blobs)
+    heaps["text_docs"] = b"".join(postings[term].docs for term in terms)
+    heaps["text_tfs"] = b"".join(postings[term].tfs for term in terms)
+
+    # Lay out blocks after a toc whose size depends on the offsets it
+    # contains; iterate until the toc length is stable.
+    toc_length = 0
+    while True:
+        cursor = _align(_HEADER.size + toc_length)
+        toc: dict[str, Any] = {
+            "rows": n_rows,
+            "suburbs": index.suburb_names,
+            "columns": {},
+            "heaps": {},
+        }
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            toc["columns"][name] = {
+                "dtype": array.dtype.newbyteorder("<").str,
+                "offset": cursor,
+                "count": int(array.size),
+            }
+            cursor = _align(cursor + array.nbytes)
+        for name, heap in heaps.items():
+            toc["heaps"][name] = {"offset": cursor, "length": len(heap)}
+            cursor = _align(cursor + len(heap))
+
+        toc_bytes = json.dumps(toc, separators=(",", ":")).encode()
+        if len(toc_bytes) == toc_length:
+            break
+        toc_length = len(toc_bytes)
+
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, toc_length, 0))
+            f.write(toc_bytes)
+            for name, array in arrays.items():
+                _pad_to(f, toc["columns"][name]["offset"])
+                f.write(np.ascontiguousarray(array).astype(toc["columns"][name]["dtype"]).tobytes())
+            for name, heap in heaps.items():
+                _pad_to(f, toc["heaps"][name]["offset"])
+                f.write(heap)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _offsets(blobs: list[bytes]) -> np.ndarray:
+    offsets = np.zeros(len(blobs) + 1, dtype=np.uint64)
+    np.cumsum([len(blob) for blob in blobs], out=offsets[1:])
+    return offsets
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _pad_to(f, offset: int) -> None:
+    f.write(b"\0" * (offset - f.tell()))
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+class SnapshotRecords:
+    """Record store that decodes listings lazily from a mapped string heap"""
+
+    def __init__(self, buffer: mmap.mmap, toc: dict[str, Any], columns: dict[str, np.ndarray]):
+        self._buffer = buffer
+        self._rows = toc["rows"]
+        self._record_offsets = columns["record_offsets"]
+        self._record_base = toc["heaps"]["records"]["offset"]
+        self._id_offsets = columns["id_offsets"]
+        self._id_base = toc["heaps"]["ids"]["offset"]
+        self._id_order = columns["id_order"]
+        # Full-text main segment, when the snapshot carries one
+        self.text_postings: SnapshotPostings | None = None
+        self.text_doc_len: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def record(self, row: int) -> dict[str, Any]:
+        start = self._record_base + int(self._record_offsets[row])
+        end = self._record_base + int(self._record_offsets[row + 1])
+        return json.loads(self._buffer[start:end])
+
+    def row_for_id(self, listing_id: str) -> int | None:
+        target = listing_id.encode()
+        lo, hi = 0, self._rows
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._id(int(self._id_order[mid])) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._rows:
+            row = int(self._id_order[lo])
+            if self._id(row) == target:
+                return row
+        return None
+
+    def _id(self, row: int) -> bytes:
+        start = self._id_base + int(self._id_offsets[row])
+        end = self._id_base + int(self._id_offsets[row + 1])
+        return self._buffer[start:end]
+
+
+class SnapshotPostings(Mapping[str, PostingList]):
+    """Full-text postings by term, served as zero-copy slices of a mapped snapshot"""
+
+    def __init__(self, buffer: mmap.mmap, toc: dict[str, Any], columns: dict[str, np.ndarray]):
+        self._view = memoryview(buffer)
+        self._term_offsets = columns["text_term_offsets"]
+        self._term_base = toc["heaps"]["text_terms"]["offset"]
+        self._doc_offsets = columns["text_doc_offsets"]
+        self._doc_base = toc["heaps"]["text_docs"]["offset"]
+        self._tf_offsets = columns["text_tf_offsets"]
+        self._tf_base = toc["heaps"]["text_tfs"]["offset"]
+        self._terms = len(self._term_offsets) - 1
+
+    def __len__(self) -> int:
+        return self._terms
+
+    def __iter__(self) -> Iterator[str]:
+        for slot in range(self._terms):
+            yield bytes(self._term(slot)).decode()
+
+    def __getitem__(self, term: str) -> PostingList:
+        target = term.encode()
+        lo, hi = 0, self._terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self._terms or self._term(lo) != target:
+            raise KeyError(term)
+        return PostingList.encoded(
+            self._slice(self._doc_base, self._doc_offsets, lo),
+            self._slice(self._tf_base, self._tf_offsets, lo),
+        )
+
+    def _term(self, slot: int) -> bytes:
+        return bytes(self._slice(self._term_base, self._term_offsets, slot))
+
+    def _slice(self, base: int, offsets: np.ndarray, slot: int) -> memoryview:
+        return self._view[base + int(offsets[slot]):base + int(offsets[slot + 1])]
+
+
+def open_snapshot(path: str | Path) -> ListingIndex:
+    """Memory-map a snapshot file read-only and wrap it as a ListingIndex"""
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, toc_length, _ = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a HAUS listing snapshot")
+    toc = json.loads(buffer[_HEADER.size:_HEADER.size + toc_length])
+
+    columns = {
+        name: np.frombuffer(buffer, dtype=spec["dtype"], count=spec["count"], offset=spec["offset"])
+        for name, spec in toc["columns"].items()
+    }
+    records = SnapshotRecords(buffer, toc, columns)
+    if "text_terms" in toc["heaps"]:
+        records.text_postings = SnapshotPostings(buffer, toc, columns)
+        records.text_doc_len = columns["text_doc_len"]
+    return ListingIndex(
+        toc["suburbs"],
+        columns["suburb_offsets"],
+        {name: columns[name] for name in COLUMN_NAMES},
+        records,
+    )
+
+
+def is_snapshot(path: str | Path) -> bool:
+    """Whether a file starts with the snapshot magic"""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load_listing_index(path: str | Path, cache_dir: str | Path | None = None) -> ListingIndex:
+    """
+    Load the listing index for a worker process.
+
+    Snapshot files are mapped directly. A JSON catalogue is converted to a
+    snapshot in cache_dir (keyed on the source path, size and mtime) the
+    first time any process loads it, and every process then maps that file.
+    """
+    path = Path(path)
+    if is_snapshot(path):
+        return open_snapshot(path)
+
+    stat = path.stat()
+    source = f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}:{FORMAT_VERSION}"
+    key = hashlib.sha1(source.encode()).hexdigest()
+    cache_dir = Path(cache_dir or tempfile.gettempdir())
+    snapshot_path = cache_dir / f"haus-listings-{key[:16]}.snap"
+
+    if not snapshot_path.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        write_snapshot(ListingIndex.load(path), snapshot_path)
+    return open_snapshot(snapshot_path)
+
+
+def load_text_index(listings: ListingIndex, **kwargs: Any) -> TextIndex:
+    """
+    Full-text index for a listing index: the postings stored in its
+    snapshot when it has them, otherwise built from the listing records.
+    """
+    records = listings.records
+    if isinstance(records, SnapshotRecords) and records.text_postings is not None:
+        return TextIndex.from_postings(records.text_postings, records.text_doc_len, **kwargs)
+    return TextIndex.from_listings(listings, **kwargs)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python snapshot.py <listings.json> <output.snap>")
+        sys.exit(1)
+
+    source = ListingIndex.load(sys.argv[1])
+    write_snapshot(source, sys.argv[2])
+    print(f"Wrote {len(source)} listings to {sys.argv[2]}")
@@ -0,0 +1,155 @@
+"""
+HAUS Voice Agent - Speculative Cortex Recall
+
+Starts the Cortex recall for a user turn while the turn detector is still
+deciding whether the user has finished speaking. Interim and final STT
+transcripts feed the speculation; when the turn completes, the in-flight
+recall is reused if its query asks the same question as the final
+transcript, otherwise it is cancelled and a fresh recall is issued.
+
+Two queries ask the same question when they name the same numbers and
+places (their anchors) and their wording is close enough. Wording
+similarity alone would reuse a recall about Bondi for a turn about Manly,
+or one for "under 2 million" for "under 3 million".
+"""
+
+import asyncio
+from difflib import SequenceMatcher
+from typing import Any, Awaitable, Callable, Iterable
+
+RecallFn = Callable[[str], Awaitable[dict[str, Any]]]
+# Places named in a query (e.g. Gazetteer.mentions)
+LocationsFn = Callable[[str], Iterable[str]]
+
+# Spoken numbers, as STT may write them either way
+_NUMBER_WORDS = {
+    word: str(value)
+    for value, word in enumerate(
+        "zero one two three four five six seven eight nine ten eleven twelve thirteen "
+        "fourteen fifteen sixteen seventeen eighteen nineteen twenty".split()
+    )
+}
+_NUMBER_WORDS.update(
+    (word, str(value))
+    for value, word in zip(range(30, 100, 10), "thirty forty fifty sixty seventy eighty ninety".split())
+)
+_MAGNITUDES = {"hundred", "thousand", "million", "billion", "k", "m", "mil"}
+
+
+def normalize_query(text: str) -> str:
+    """Lower-case, collapse whitespace/punctuation and write numbers as digits, so STT noise doesn't matter"""
+    cleaned = "".join(ch if ch.isalnum() else " " for ch in text.lower())
+    return " ".join(_NUMBER_WORDS.get(word, word) for word in cleaned.split())
+
+
+def query_similarity(a: str, b: str) -> float:
+    """Word-level similarity between two queries, 0.0 (unrelated) to 1.0 (same)"""
+    words_a = normalize_query(a).split()
+    words_b = normalize_query(b).split()
+    if not words_a and not words_b:
+        return 1.0
+    if not words_a or not words_b:
+        return 0.0
+    return SequenceMatcher(None, words_a, words_b, autojunk=False).ratio()
+
+
+def query_anchors(text: str, locations: LocationsFn | None = None) -> frozenset[str]:
+    """Numbers (spoken or written) and, given a locations lookup, places named in a query"""
+    anchors: set[str] = set()
+    for word in normalize_query(text).split():
+        if word.isdigit() or word in _MAGNITUDES:
+            anchors.add(word)
+    if locations is not None:
+        anchors.update(locations(text))
+    return frozenset(anchors)
+
+
+def same_question(a: str, b: str, threshold: float, locations: LocationsFn | None = None) -> bool:
+    """Whether a recall for query a can answer query b: equal anchors and similar wording"""
+    if query_anchors(a, locations) != query_anchors(b, locations):
+        return False
+    return query_similarity(a, b) >= threshold
+
+
+class SpeculativeRecall:
+    """Per-session speculative recall driven by STT transcripts"""
+
+    def __init__(
+        self,
+        recall: RecallFn,
+        reuse_threshold: float = 0.8,
+        min_query_chars: int = 12,
+        max_speculations_per_turn: int = 3,
+        locations: LocationsFn | None = None,
+    ):
+        self._recall = recall
+        self.reuse_threshold = reuse_threshold
+        self.locations = locations
+        self.min_query_chars = min_query_chars
+        self.max_speculations_per_turn = max_speculations_per_turn
+
+        self._final_segments: list[str] = []
+        self._task: asyncio.Task[dict[str, Any]] | None = None
+        self._task_query = ""
+        self._speculations = 0
+
+        # Counters for tuning the threshold in production
+        self.hits = 0
+        self.misses = 0
+
+    def on_transcript(self, transcript: str, is_final: bool) -> None:
+        """Feed an STT transcript event; may start or restart the speculative recall"""
+        text = transcript.strip()
+        if not text:
+            return
+
+        if is_final:
+            self._final_segments.append(text)
+            query = " ".join(self._final_segments)
+        else:
+            query = " ".join([*self._final_segments, text])
+
+        if len(query) < self.min_query_chars:
+            return
+
+        if self._task is not None:
+            # Keep the in-flight recall while the transcript is still
+            # converging on the same question
+            if same_question(self._task_query, query, self.reuse_threshold, self.locations):
+                return
+            if self._speculations >= self.max_speculations_per_turn:
+                return
+            self._task.cancel()
+
+        self._speculations += 1
+        self._task_query = query
+        self._task = asyncio.create_task(self._recall(query))
+
+    async def resolve(self, final_query: str) -> dict[str, Any]:
+        """Return recall results for the completed turn, reusing the speculation if it fits"""
+        task, task_query = self._task, self._task_query
+        self._reset()
+
+        if task is not None:
+            if not task.cancelled() and same_question(
+                task_query, final_query, self.reuse_threshold, self.locations
+            ):
+                result = await task
+                self.hits += 1
+                return result
+            task.cancel()
+
+        self.misses += 1
+        return await self._recall(final_query)
+
+    def cancel(self) -> None:
+        """Drop any in-flight speculation (e.g. on session shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._final_segments = []
+        self._task = None
+        self._task_query = ""
+        self._speculations = 0
@@ -0,0 +1,120 @@
+"""
+HAUS Voice Agent - Staged Startup and Import Profiling
+
+Startup is split into stages so each process imports only what it uses:
+
+    1. agent.py import     livekit.agents, httpx, numpy and our modules;
+                           enough for the main worker process to register
+                           and dispatch jobs
+    2. prewarm             voice plugins (VAD, turn detector, noise
+                           cancellation), imported by import_voice_plugins()
+                           in each job process before it reports ready
+
+`download-files` needs the plugins registered, so the CLI imports them
+eagerly for that command.
+
+`python agent.py profile-imports` measures both stages in fresh
+interpreters (python -X importtime) and prints the costliest modules:
+
+    uv run agent.py profile-imports --top 20
+"""
+
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+# Heavy plugins deferred to prewarm
+VOICE_PLUGINS = (
+    "livekit.plugins.silero",
+    "livekit.plugins.turn_detector.multilingual",
+    "livekit.plugins.noise_cancellation",
+)
+
+# module -> import time in ms, for plugins imported by this process
+plugin_import_ms: dict[str, float] = {}
+
+
+def import_voice_plugins() -> float:
+    """Import the voice plugins (must run on the main thread), return total ms"""
+    total = 0.0
+    for name in VOICE_PLUGINS:
+        if name in sys.modules:
+            continue
+        start = time.perf_counter()
+        importlib.import_module(name)
+        plugin_import_ms[name] = round((time.perf_counter() - start) * 1000.0, 1)
+        total += plugin_import_ms[name]
+    return total
+
+
+@dataclass
+class ImportCost:
+    """One line of python -X importtime output (times in ms)"""
+
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+def measure_imports(code: str) -> list[ImportCost]:
+    """Run code in a fresh interpreter under -X importtime and parse the report"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import profiling failed:\n{completed.stderr[-2000:]}")
+
+    costs = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        head, cumulative_us, name = line.split("|", 2)
+        try:
+            self_us = int(head.split(":", 1)[1])
+            cumulative = int(cumulative_us)
+        except ValueError:
+            continue  # header line
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        costs.append(ImportCost(name.strip(), self_us / 1000.0, cumulative / 1000.0, depth))
+    return costs
+
+
+def _total_ms(costs: list[ImportCost]) -> float:
+    return sum(cost.cumulative_ms for cost in costs if cost.depth == 0)
+
+
+def print_import_report(label: str, costs: list[ImportCost], top: int) -> None:
+    print(f"\n{label}: {_total_ms(costs):.0f} ms across {len(costs)} modules")
+    print("  cumulative ms    self ms  module")
+    for cost in sorted(costs, key=lambda c: c.cumulative_ms, reverse=True)[:top]:
+        print(f"  {cost.cumulative_ms:13.1f} {cost.self_ms:10.1f}  {'  ' * cost.depth}{cost.module}")
+
+
+def profile_imports(argv: list[str] | None = None) -> None:
+    """CLI: per-module import cost of each startup stage"""
+    parser = argparse.ArgumentParser(prog="agent.py profile-imports")
+    parser.add_argument("--top", type=int, default=25, help="modules to list per stage")
+    args = parser.parse_args(argv)
+
+    worker = measure_imports("import agent")
+    print_import_report("Stage 1 - agent.py import (main worker process)", worker, args.top)
+
+    # Top-level imports that stage 1 didn't make are the plugins and what they pull in
+    stage1 = {cost.module for cost in worker}
+    prewarmed = measure_imports("import agent, startup; startup.import_voice_plugins()")
+    plugins = [cost for cost in prewarmed if cost.depth == 0 and cost.module not in stage1]
+    print_import_report("Stage 2 - voice plugins (job process prewarm)", plugins, args.top)
+
+    print(
+        f"\nMain process import: {_total_ms(worker):.0f} ms; "
+        f"deferred to prewarm: {_total_ms(plugins):.0f} ms"
+    )
@@ -0,0 +1,120 @@
+"""
+HAUS Voice Agent - Streaming Tool Output
+
+LiveKit function tools return a single value to the LLM, so a slow tool
+means silence until it finishes. Tools here are written as async
+generators of text chunks (count first, then the top match, then the
+rest), and narrate_tool_stream consumes one:
+
+- the first chunks can be spoken as they arrive through a single
+  session.say() fed by a SpeechFeed, so TTS starts on the count while the
+  rest is still being built
+- if the first chunk takes longer than a threshold, a short filler
+  ("Let me have a look.") is spoken so the user isn't left in silence
+- whatever wasn't spoken is returned for the tool's result to the LLM
+
+Without a session to speak through (e.g. the offline benchmark) all
+chunks are returned as text.
+"""
+
+import asyncio
+import random
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+# Matches AgentSession.say(text, *, add_to_chat_ctx=...)
+Say = Callable[..., Any]
+
+FILLER_PHRASES = (
+    "Let me have a look.",
+    "One moment, I'll check that.",
+    "Just pulling that up now.",
+)
+
+
+class SpeechFeed:
+    """Async text iterable for session.say(), fed chunk by chunk"""
+
+    def __init__(self):
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+    def push(self, text: str) -> None:
+        self._queue.put_nowait(text)
+
+    def close(self) -> None:
+        self._queue.put_nowait(None)
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        while True:
+            text = await self._queue.get()
+            if text is None:
+                return
+            yield text
+
+
+async def run_with_filler(
+    awaitable: Awaitable[T],
+    say: Say | None,
+    filler_after: float,
+    phrase: str | None = None,
+) -> T:
+    """
+    Await a tool step, speaking a filler phrase if it takes longer than
+    filler_after. The timer only runs while the step is suspended, so
+    blocking work inside it should go through asyncio.to_thread.
+    """
+    if say is None or filler_after <= 0:
+        return await awaitable
+
+    task = asyncio.ensure_future(awaitable)
+    try:
+        done, _ = await asyncio.wait({task}, timeout=filler_after)
+        if not done:
+            say(phrase or random.choice(FILLER_PHRASES), add_to_chat_ctx=False)
+        return await task
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+
+
+async def narrate_tool_stream(
+    chunks: AsyncIterator[str],
+    say: Say | None = None,
+    narrate: int = 0,
+    filler_after: float = 0.0,
+) -> tuple[str, str]:
+    """
+    Consume a tool's chunk stream.
+
+    The first `narrate` chunks are spoken as they arrive (when `say` is
+    given); a filler is spoken if the first chunk is slower than
+    `filler_after`. Returns (spoken text, remaining text).
+    """
+    spoken: list[str] = []
+    remaining: list[str] = []
+    feed: SpeechFeed | None = None
+    iterator = chunks.__aiter__()
+    try:
+        while True:
+            step = iterator.__anext__()
+            try:
+                if not spoken and not remaining:
+                    chunk = await run_with_filler(step, say, filler_after)
+                else:
+                    chunk = await step
+            except StopAsyncIteration:
+                break
+
+            if say is not None and len(spoken) < narrate and not remaining:
+                if feed is None:
+                    feed = SpeechFeed()
+                    say(feed, add_to_chat_ctx=True)
+                feed.push(chunk)
+                spoken.append(chunk)
+            else:
+                remaining.append(chunk)
+    finally:
+        if feed is not None:
+            feed.close()
+    return "".join(spoken), "".join(remaining)
@@ -0,0 +1,54 @@
+"""Shared fixtures for the agent worker's unit tests (fixture data in ../fixtures)"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+WORKER_DIR = Path(__file__).resolve().parent.parent
+# The worker's modules are flat, top-level imports (as agent.py uses them)
+sys.path.insert(0, str(WORKER_DIR))
+
+from gazetteer import Gazetteer  # noqa: E402
+from listings import DEFAULT_LISTINGS_PATH, ListingIndex  # noqa: E402
+from spatial import PlaceIndex  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def listing_records() -> list[dict[str, Any]]:
+    return json.loads(DEFAULT_LISTINGS_PATH.read_text())["listings"]
+
+
+@pytest.fixture(scope="session")
+def listing_index() -> ListingIndex:
+    return ListingIndex.load()
+
+
+@pytest.fixture(scope="session")
+def gazetteer() -> Gazetteer:
+    return Gazetteer.load()
+
+
+@pytest.fixture(scope="session")
+def places() -> PlaceIndex:
+    return PlaceIndex.load()
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
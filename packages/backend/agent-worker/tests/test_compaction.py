@@ -0,0 +1,113 @@
+import json
+
+import pytest
+from livekit.agents.llm import ChatContext, FunctionCall, FunctionCallOutput
+
+from compaction import SUMMARY_MESSAGE_ID, ContextCompactor, SearchCriteria, context_tokens
+
+SEARCH_OUTPUT = (
+    "Found 2 properties in Bondi, NSW. Would you like more details about any of these?\n"
+    "- prop-011: 103 Brunswick Street, Bondi Beach NSW 2026, $685,000, 1 bed\n"
+    "- prop-002: 15 Beach Road, Bondi Beach NSW 2026, $800,000, 2 bed"
+)
+
+
+def add_tool_call(chat_ctx: ChatContext, call_id: str, name: str, arguments: dict, output: str) -> None:
+    chat_ctx.items.append(FunctionCall(call_id=call_id, name=name, arguments=json.dumps(arguments)))
+    chat_ctx.items.append(FunctionCallOutput(call_id=call_id, name=name, output=output, is_error=False))
+
+
+@pytest.fixture
+def chat_ctx() -> ChatContext:
+    chat_ctx = ChatContext()
+    chat_ctx.add_message(role="system", content="You are a property assistant.")
+    chat_ctx.add_message(role="assistant", content="You are speaking with user u1.", id="initial")
+
+    chat_ctx.add_message(role="user", content="Show me houses in Bondi under two million")
+    add_tool_call(
+        chat_ctx,
+        "call-1",
+        "search_properties",
+        {"location": "Bondi", "budget_max": 2_000_000, "property_type": "house"},
+        SEARCH_OUTPUT,
+    )
+    chat_ctx.add_message(role="assistant", content="I found two properties in Bondi. " * 10)
+
+    chat_ctx.add_message(role="user", content="We've got a dog, so somewhere with a yard")
+    add_tool_call(chat_ctx, "call-2", "remember_preference", {"preference": "Paddington"}, "Saved.")
+    add_tool_call(
+        chat_ctx,
+        "call-3",
+        "get_property_details",
+        {"property_id": "prop-011"},
+        "103 Brunswick Street, Bondi Beach NSW 2026\nPrice: $685,000",
+    )
+    chat_ctx.add_message(role="assistant", content="That one has a small courtyard. " * 10)
+
+    chat_ctx.add_message(role="user", content="What about three bedrooms?")
+    chat_ctx.add_message(role="assistant", content="Let me look for three bedroom homes. " * 5)
+    chat_ctx.add_message(role="user", content="And close to the beach")
+    return chat_ctx
+
+
+def test_under_threshold_is_left_alone(chat_ctx):
+    compactor = ContextCompactor(token_threshold=context_tokens(chat_ctx) + 1)
+    assert compactor.compact(chat_ctx) is None
+
+
+def test_compaction_keeps_instructions_pinned_items_and_recent_turns(chat_ctx):
+    compactor = ContextCompactor(token_threshold=50, keep_turns=2, pinned_ids=["initial"])
+    compacted = compactor.compact(chat_ctx)
+    assert compacted is not None
+    assert context_tokens(compacted) < context_tokens(chat_ctx)
+
+    ids = [item.id for item in compacted.items]
+    assert "initial" in ids and SUMMARY_MESSAGE_ID in ids
+    assert compacted.items[0].role == "system"
+    # The last two user turns are kept verbatim, after the summary
+    texts = [item.text_content for item in compacted.items if item.type == "message"]
+    assert texts[-3:] == [
+        "What about three bedrooms?",
+        "Let me look for three bedroom homes. " * 5,
+        "And close to the beach",
+    ]
+    assert ids.index(SUMMARY_MESSAGE_ID) < len(ids) - 3
+    # Nothing compacted was a tool output whose call was dropped
+    assert not [item for item in compacted.items if item.type.startswith("function_call")]
+    # The original context is untouched
+    assert len(chat_ctx.items) > len(compacted.items)
+
+
+def test_summary_carries_criteria_preferences_views_and_quotes(chat_ctx):
+    compactor = ContextCompactor(token_threshold=50, keep_turns=2)
+    compacted = compactor.compact(chat_ctx)
+    summary = next(item for item in compacted.items if item.id == SUMMARY_MESSAGE_ID).text_content
+
+    assert "Search: Bondi; up to $2,000,000; house." in summary
+    assert "Saved preferences: likes Paddington." in summary
+    assert "prop-011 (103 Brunswick Street, Bondi Beach NSW 2026)" in summary
+    assert "prop-002 15 Beach Road, $800,000" in summary
+    assert "we've got a dog" in summary.lower()
+    assert compactor.stats()["compactions"] == 1
+
+
+def test_summary_rolls_forward_and_stays_within_budget(chat_ctx):
+    compactor = ContextCompactor(token_threshold=50, keep_turns=1, summary_token_budget=60)
+    first = compactor.compact(chat_ctx)
+    first.add_message(role="user", content="Actually make it Paddington, three bedrooms")
+    add_tool_call(first, "call-4", "search_properties", {"location": "Paddington", "bedrooms": 3}, "Found 0.")
+    first.add_message(role="user", content="Thanks")
+
+    second = compactor.compact(first)
+    summaries = [item for item in second.items if item.id == SUMMARY_MESSAGE_ID]
+    assert len(summaries) == 1
+    text = summaries[0].text_content
+    assert "Search: Paddington; up to $2,000,000; 3+ bedrooms; house." in text
+    assert context_tokens(ChatContext(summaries)) <= 60 + 4
+
+
+def test_search_criteria_later_calls_win_per_field():
+    criteria = SearchCriteria()
+    criteria.update({"location": "Bondi", "budget_max": 1_500_000})
+    criteria.update({"location": "", "bedrooms": 2, "near": "the beach", "radius_km": 1})
+    assert criteria.render() == "Bondi; within 1 km of the beach; up to $1,500,000; 2+ bedrooms"
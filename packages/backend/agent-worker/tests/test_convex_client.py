@@ -0,0 +1,82 @@
+import asyncio
+
+import httpx
+
+import agent
+from agent import ConvexClient, HausConfig
+from health import worker_health
+
+
+def client_with(handler) -> ConvexClient:
+    config = HausConfig(
+        livekit_api_key="", livekit_api_secret="", livekit_url="", convex_url="http://cortex.test", openai_api_key=""
+    )
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = ConvexClient(config, http_client=http_client)
+    client.guard.hedge_delay = lambda endpoint: 0.05
+    client.guard.deadline = lambda endpoint: 1.0
+    return client
+
+
+def test_cancelled_before_the_hedge_leaves_nothing_running():
+    cancelled = []
+
+    async def handler(request):
+        try:
+            await asyncio.sleep(1.0)
+        except asyncio.CancelledError:
+            cancelled.append(request.url.path)
+            raise
+        return httpx.Response(200, json={})
+
+    async def scenario():
+        client = client_with(handler)
+        call = asyncio.create_task(client._hedged_post("recall", {}))
+        await asyncio.sleep(0.01)
+        call.cancel()
+        await asyncio.gather(call, return_exceptions=True)
+        await asyncio.sleep(0.01)
+        # Checked before asyncio.run cancels whatever is left
+        assert cancelled == ["/api/cortex/recall"]
+        assert worker_health.cortex_inflight == 0
+        assert client.guard.breaker.state == "closed"
+
+    asyncio.run(scenario())
+
+
+def test_hedge_wins_and_the_slow_request_is_cancelled():
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(1.0 if calls == 1 else 0.0)
+        return httpx.Response(200, json={"call": calls})
+
+    async def scenario():
+        client = client_with(handler)
+        response = await client._hedged_post("recall", {})
+        await asyncio.sleep(0.01)
+        assert response.json() == {"call": 2}
+        assert worker_health.cortex_inflight == 0
+
+    asyncio.run(scenario())
+
+
+def test_missing_bulk_endpoint_is_learned_once_per_process(monkeypatch):
+    monkeypatch.setattr(agent, "_no_bulk_remember", set())
+    paths = []
+
+    async def handler(request):
+        paths.append(request.url.path)
+        if request.url.path.endswith("remember-batch"):
+            return httpx.Response(404)
+        return httpx.Response(200, json={})
+
+    async def scenario():
+        for _ in range(2):
+            client = client_with(handler)
+            assert await client._send_remember_batch([{"n": 0}]) == []
+
+    asyncio.run(scenario())
+    assert paths == ["/api/cortex/remember-batch", "/api/cortex/remember", "/api/cortex/remember"]
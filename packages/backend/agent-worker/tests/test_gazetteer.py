@@ -0,0 +1,88 @@
+import pytest
+
+from gazetteer import Gazetteer, normalize_location, phonetic_key
+
+
+@pytest.mark.parametrize(
+    "spoken, kind, suburb",
+    [
+        ("bondi", "suburb", "Bondi"),
+        ("  Bondi Beach ", "suburb", "Bondi Beach"),
+        ("in newtown", "suburb", "Newtown"),
+        ("paddo", "alias", "Paddington"),
+        ("bondy beach", "fuzzy", "Bondi Beach"),
+    ],
+)
+def test_resolves_named_suburbs(gazetteer, spoken, kind, suburb):
+    match = gazetteer.resolve(spoken)
+    assert match.kind == kind
+    assert not match.is_region
+    assert match.primary is not None and match.primary.name == suburb
+    assert match.label == f"{suburb}, NSW"
+
+
+def test_region_covers_its_suburbs(gazetteer):
+    match = gazetteer.resolve("Eastern Suburbs")
+    assert match.kind == "region"
+    assert match.is_region and match.primary is None
+    names = {suburb.name for suburb in match.suburbs}
+    assert {"Bondi", "Bondi Beach", "Bondi Junction"} <= names
+
+
+def test_postcode_covers_every_suburb_in_it(gazetteer):
+    match = gazetteer.resolve("2026")
+    assert match.kind == "postcode"
+    assert match.is_region
+    assert all(suburb.postcode == "2026" for suburb in match.suburbs)
+    assert "Bondi Beach" in {suburb.name for suburb in match.suburbs}
+
+
+def test_unknown_location_resolves_to_nothing(gazetteer):
+    match = gazetteer.resolve("zzzz")
+    assert match.kind == "none"
+    assert match.suburbs == [] and match.primary is None
+
+
+def test_resolve_is_memoised(gazetteer):
+    assert gazetteer.resolve("paddo") is gazetteer.resolve("paddo")
+
+
+def test_normalize_and_phonetic_keys():
+    assert normalize_location("  Bondi   BEACH ") == normalize_location("bondi beach")
+    # Spelling variants of the same sound share a key
+    assert phonetic_key("bondi") == phonetic_key("bondy")
+
+
+def test_mentions_finds_places_in_free_text(gazetteer):
+    assert gazetteer.mentions("houses in bondi beach near paddo") == {"Bondi Beach", "Paddington"}
+    assert gazetteer.mentions("anything in the eastern suburbs") == {"Eastern Suburbs"}
+    assert gazetteer.mentions("somewhere with a pool") == frozenset()
+
+
+@pytest.mark.parametrize(
+    "spoken, suburb, state",
+    [("Eastwood", "Eastwood", "NSW"), ("Brunswick East", "Brunswick East", "VIC"), ("eastwod", "Eastwood", "NSW")],
+)
+def test_localities_outside_the_curated_set_resolve(gazetteer, spoken, suburb, state):
+    match = gazetteer.resolve(spoken)
+    assert match.primary is not None
+    assert (match.primary.name, match.primary.state) == (suburb, state)
+
+
+@pytest.mark.parametrize("spoken", ["the beach", "eastern", "Eastwood", "Brunswick East", "bondi east", "richmnd"])
+def test_no_distant_fuzzy_guesses(spoken):
+    curated = Gazetteer.load(localities_path=None)
+    assert curated.resolve(spoken).kind == "none"
+
+
+def test_fuzzy_matching_never_lands_on_a_region(gazetteer):
+    assert gazetteer.resolve("the beaches").kind == "region"
+    assert gazetteer.resolve("the beach").kind == "none"
+    assert gazetteer.resolve("northern beach").kind == "none"
+
+
+def test_curated_entries_win_over_localities(gazetteer):
+    # "The Junction" is also a Newcastle locality, but the curated alias wins
+    assert gazetteer.resolve("the junction").label == "Bondi Junction, NSW"
+    assert gazetteer.resolve("brisbane").label == "Brisbane City, QLD"
+    assert gazetteer.resolve("2026").kind == "postcode"
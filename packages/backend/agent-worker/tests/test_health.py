@@ -0,0 +1,124 @@
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from health import REPORT_TOKEN_HEADER, JobReports, StatusServer, WorkerHealth, is_loopback, post_report
+
+
+def report(pid: int, **fields) -> bytes:
+    return json.dumps({"pid": pid, "final": False, **fields}).encode()
+
+
+@pytest.fixture
+def reports() -> JobReports:
+    return JobReports(WorkerHealth(), token="secret", job_pids=lambda: {101, 102})
+
+
+def test_report_needs_the_token(reports):
+    status, _, _ = reports.receive(report(101, ready=True, cortex_inflight=10), {})
+    assert status == 403
+    status, _, _ = reports.receive(report(101, ready=True), {REPORT_TOKEN_HEADER.lower(): "guess"})
+    assert status == 403
+    assert reports.rejected_total == 2
+    assert not reports.health.ready and reports.live() == []
+
+
+def test_report_from_another_pid_is_rejected(reports):
+    status, _, _ = reports.receive(report(999, cortex_inflight=10), {REPORT_TOKEN_HEADER.lower(): "secret"})
+    assert status == 403
+    assert reports.live() == []
+
+
+def test_accepted_report_counts(reports):
+    headers = {REPORT_TOKEN_HEADER.lower(): "secret"}
+    assert reports.receive(report(101, ready=True, active_sessions=1), headers)[0] == 200
+    assert reports.health.ready
+    assert [r["pid"] for r in reports.live()] == [101]
+    assert reports.receive(b"not json", headers)[0] == 400
+
+    # A final report removes the process
+    assert reports.receive(json.dumps({"pid": 101, "final": True}).encode(), headers)[0] == 200
+    assert reports.live() == []
+
+
+@pytest.mark.parametrize(
+    "peer, expected",
+    [
+        (("127.0.0.1", 5000), True),
+        (("::1", 5000, 0, 0), True),
+        (("::ffff:127.0.0.1", 5000, 0, 0), True),
+        (("10.0.0.7", 5000), False),
+        (None, False),
+    ],
+)
+def test_is_loopback(peer, expected):
+    assert is_loopback(peer) is expected
+
+
+def test_report_route_over_http():
+    reports = JobReports(WorkerHealth(), token="secret", job_pids=lambda: {os.getpid()})
+    status = StatusServer(host="127.0.0.1", port=0)
+    reports.install_routes(status)
+
+    async def scenario():
+        await status.start()
+        url = f"http://127.0.0.1:{status.bound_port}/report"
+        try:
+            good = await asyncio.to_thread(post_report, url, {"pid": os.getpid(), "ready": True}, token="secret")
+            bad = await asyncio.to_thread(post_report, url, {"pid": os.getpid()}, token="wrong")
+            return good, bad
+        finally:
+            await status.stop()
+
+    good, bad = asyncio.run(scenario())
+    assert good["ok"] and 0.0 <= good["load"] <= 1.0
+    assert bad is None
+    assert reports.health.ready
+    assert reports.rejected_total == 1
+
+
+def test_load_takes_the_busiest_process_and_the_worst_lag(monkeypatch):
+    monkeypatch.setattr(WorkerHealth, "cpu_load", staticmethod(lambda: 0.0))
+    health = WorkerHealth(max_sessions=10, lag_budget_ms=100.0, inflight_budget=10)
+    reports = JobReports(health)
+    reports.receive(report(1, active_sessions=1, cortex_inflight=2, loop_lag_ms=10.0), {})
+    reports.receive(report(2, active_sessions=1, cortex_inflight=8, loop_lag_ms=30.0), {})
+
+    # In-flight requests are per process (each has its own pool), not summed
+    assert reports.load() == pytest.approx(0.8)
+    health.loop_lag.lag_ms = 95.0
+    assert reports.load() == pytest.approx(0.95)
+    assert reports.load(active_sessions=10) == 1.0
+
+
+def test_load_without_reports_is_the_session_ratio(monkeypatch):
+    monkeypatch.setattr(WorkerHealth, "cpu_load", staticmethod(lambda: 0.0))
+    reports = JobReports(WorkerHealth(max_sessions=4))
+    assert reports.load() == 0.0
+    assert reports.load(active_sessions=1) == pytest.approx(0.25)
+
+
+def test_stale_processes_stop_counting(monkeypatch):
+    monkeypatch.setattr(WorkerHealth, "cpu_load", staticmethod(lambda: 0.0))
+    reports = JobReports(WorkerHealth(inflight_budget=10), stale_after=5.0)
+    reports.receive(report(1, cortex_inflight=9), {})
+    later = time.time() + 10.0
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert reports.live() == []
+    assert reports.load() == 0.0
+
+
+def test_report_reply_carries_the_worker_load(monkeypatch):
+    monkeypatch.setattr(WorkerHealth, "cpu_load", staticmethod(lambda: 0.0))
+    reports = JobReports(WorkerHealth(inflight_budget=10))
+    _, _, body = reports.receive(report(1, cortex_inflight=5), {})
+    assert json.loads(body) == {"ok": True, "load": 0.5}
+
+
+def test_tree_cpu_is_a_share_of_the_available_cpus():
+    health = WorkerHealth()
+    assert 0.0 <= health.cpu_load() <= 1.0
+    assert health.cpu.cpus >= 1
@@ -0,0 +1,79 @@
+import pytest
+
+from listings import normalize_property_type
+
+
+def brute_force(records, suburbs=None, price_min=None, price_max=None, bedrooms=None, property_type=None):
+    """IDs search() should return, by scanning every record"""
+    wanted = {name.lower() for name in suburbs} if suburbs is not None else None
+    matches = [
+        record
+        for record in records
+        if (wanted is None or record["suburb"].lower() in wanted)
+        and (price_min is None or record["price"] >= price_min)
+        and (price_max is None or record["price"] <= price_max)
+        and (bedrooms is None or record["bedrooms"] >= bedrooms)
+        and (property_type is None or record["property_type"] == property_type)
+    ]
+    return sorted(record["id"] for record in matches)
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        {},
+        {"suburbs": ["Bondi"]},
+        {"suburbs": ["Bondi", "Bondi Beach", "Paddington"], "price_max": 2_000_000},
+        {"price_min": 1_000_000, "price_max": 1_500_000},
+        {"bedrooms": 3, "property_type": "house"},
+        {"suburbs": ["Newtown"], "bedrooms": 2, "property_type": "apartment"},
+        {"suburbs": ["Nowhere"]},
+    ],
+)
+def test_search_matches_brute_force(listing_index, listing_records, criteria):
+    rows = listing_index.search(**criteria)
+    ids = sorted(listing_index.record(row)["id"] for row in rows)
+    assert ids == brute_force(listing_records, **criteria)
+
+
+def test_search_orders_by_price_and_limits(listing_index):
+    rows = listing_index.search(price_min=500_000)
+    prices = [listing_index.summary(row)["price"] for row in rows]
+    assert prices == sorted(prices)
+    assert list(listing_index.search(price_min=500_000, limit=3)) == list(rows[:3])
+
+
+def test_matches_agrees_with_search(listing_index):
+    everything = listing_index.search()
+    criteria = {"suburbs": ["Bondi", "Bondi Beach"], "price_max": 2_500_000, "bedrooms": 2}
+    mask = listing_index.matches(everything, **criteria)
+    assert sorted(everything[mask]) == sorted(listing_index.search(**criteria))
+
+
+def test_unrecognised_property_type_does_not_filter(listing_index):
+    assert normalize_property_type("castle") is None
+    assert len(listing_index.search(property_type="castle")) == len(listing_index)
+
+
+@pytest.mark.parametrize(
+    "spoken, expected",
+    [("flat", "apartment"), ("Houses", "house"), ("townhouse", "townhouse"), (None, None), ("", None)],
+)
+def test_normalize_property_type(spoken, expected):
+    assert normalize_property_type(spoken) == expected
+
+
+def test_suburbs_matching_covers_prefixed_suburbs(listing_index):
+    assert listing_index.suburbs_matching("bondi") == ["Bondi", "Bondi Beach", "Bondi Junction"]
+    assert listing_index.suburbs_matching("") == []
+    assert listing_index.suburbs_matching("Atlantis") == []
+
+
+def test_get_and_summary(listing_index, listing_records):
+    first = listing_records[0]
+    assert listing_index.get(first["id"]) == first
+    assert listing_index.get("prop-missing") is None
+    summary = listing_index.summary(listing_index.row_for_id(first["id"]))
+    assert summary["id"] == first["id"]
+    assert summary["price"] == first["price"]
+
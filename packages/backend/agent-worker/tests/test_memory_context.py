@@ -0,0 +1,65 @@
+from livekit.agents.llm import ChatContext
+
+from memory_context import (
+    MEMORY_BLOCK_ID,
+    add_memory_block,
+    build_memory_block,
+    estimate_tokens,
+    rank_memory_items,
+)
+
+CONTEXT = {
+    "suburbPreferences": [
+        {"suburbName": "Bondi", "preferenceScore": 85},
+        {"suburbName": "Paddington", "preferenceScore": 70},
+        {"suburbName": "Parramatta", "preferenceScore": -60},
+    ],
+    "facts": [
+        {"fact": "has a dog", "confidence": 90},
+        {"fact": "prefers north-facing homes", "confidence": 60},
+        {"fact": "works from home on Fridays", "confidence": 30},
+    ],
+    "propertyInteractions": [
+        {"propertyId": "prop-002", "interactionType": "saved"},
+        {"propertyId": "prop-001", "interactionType": "viewed"},
+    ],
+}
+
+
+def test_block_groups_sections():
+    block = build_memory_block(CONTEXT, "anything near the beach", token_budget=200)
+    assert block.splitlines() == [
+        "Memory: likes Bondi (85), Paddington (70); avoids Parramatta.",
+        "Facts: has a dog; prefers north-facing homes; works from home on Fridays.",
+        "Recent: prop-002 saved, prop-001 viewed.",
+    ]
+
+
+def test_block_stays_within_budget_and_keeps_the_most_relevant():
+    block = build_memory_block(CONTEXT, "somewhere for the dog", token_budget=12)
+    assert estimate_tokens(block) <= 12
+    assert "has a dog" in block
+    assert "works from home" not in block
+
+
+def test_query_overlap_lifts_an_item():
+    plain = [item.text for item in rank_memory_items(CONTEXT, "")]
+    asked = [item.text for item in rank_memory_items(CONTEXT, "do I work from home on fridays?")]
+    assert asked.index("works from home on Fridays") < plain.index("works from home on Fridays")
+
+
+def test_nothing_recalled_is_an_empty_block():
+    assert build_memory_block({}, "houses in bondi", token_budget=100) == ""
+    assert build_memory_block(CONTEXT, "houses", token_budget=0) == ""
+
+
+def test_add_memory_block_adds_one_message_and_skips_empty():
+    chat_ctx = ChatContext()
+    chat_ctx.add_message(role="user", content="houses in bondi")
+    add_memory_block(chat_ctx, "")
+    assert len(chat_ctx.items) == 1
+
+    add_memory_block(chat_ctx, "Memory: likes Bondi (85).")
+    assert [item.id for item in chat_ctx.items][-1] == MEMORY_BLOCK_ID
+    assert chat_ctx.items[-1].role == "assistant"
+    assert chat_ctx.items[0].text_content == "houses in bondi"
@@ -0,0 +1,26 @@
+import pytest
+
+from health import WorkerHealth
+from pipeline import FULL, MINIMAL, REDUCED, PipelinePolicy
+
+
+@pytest.mark.parametrize("load, tier", [(0.2, FULL), (0.6, REDUCED), (0.84, REDUCED), (0.9, MINIMAL)])
+def test_tier_follows_the_worker_load(load, tier):
+    policy = PipelinePolicy(WorkerHealth(), worker_load=lambda: load)
+    assert policy.select("job") is tier
+    assert policy.pressure() == (load, "worker")
+
+
+def test_falls_back_to_the_process_without_a_worker_load(monkeypatch):
+    health = WorkerHealth(lag_budget_ms=100.0)
+    monkeypatch.setattr(health, "cpu_load", lambda: 0.1)
+    policy = PipelinePolicy(health, worker_load=lambda: None)
+    health.loop_lag.lag_ms = 70.0
+    assert policy.pressure() == (pytest.approx(0.7), "process")
+    assert policy.select() is REDUCED
+    assert policy.snapshot()["assigned"] == {"full": 0, "reduced": 1, "minimal": 0}
+
+
+def test_disabled_policy_always_picks_full():
+    policy = PipelinePolicy(WorkerHealth(), enabled=False, worker_load=lambda: 1.0)
+    assert policy.select() is FULL
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from ranking import ListingRanker, RankingProfile
+
+
+@pytest.fixture
+def ranker(listing_index) -> ListingRanker:
+    return ListingRanker(listing_index)
+
+
+def ids(index, rows) -> list[str]:
+    return [index.record(row)["id"] for row in rows]
+
+
+def no_profile(index) -> RankingProfile:
+    return RankingProfile.from_recall(index, None)
+
+
+def test_without_signals_keeps_price_order(ranker, listing_index):
+    rows = listing_index.search()
+    assert list(ranker.top_k(rows, no_profile(listing_index), 5)) == list(rows[:5])
+    assert len(ranker.top_k(rows[:0], no_profile(listing_index), 5)) == 0
+
+
+def test_budget_prefers_prices_near_the_ceiling(ranker, listing_index):
+    rows = listing_index.search(price_max=2_000_000)
+    top = ranker.top_k(rows, no_profile(listing_index), 3, budget_max=2_000_000)
+    prices = listing_index.price[top]
+    # The best match sits closest to 90% of the ceiling
+    distances = np.abs(listing_index.price[rows].astype(np.float64) - 1_800_000)
+    assert abs(prices[0] - 1_800_000) == distances.min()
+
+
+def test_bedrooms_below_the_request_rank_last(ranker, listing_index):
+    rows = listing_index.search()
+    top = ranker.top_k(rows, no_profile(listing_index), 5, bedrooms=3)
+    assert (listing_index.bedrooms[top] >= 3).all()
+    # Exactly three beats extra rooms
+    assert listing_index.bedrooms[top[0]] == 3
+
+
+def test_suburb_preferences_lift_liked_and_sink_avoided(ranker, listing_index):
+    rows = listing_index.search(suburbs=["Bondi Beach", "Paddington"])
+    profile = RankingProfile.from_recall(
+        listing_index,
+        {
+            "suburbPreferences": [
+                {"suburbName": "Paddington", "preferenceScore": 90},
+                {"suburbName": "Bondi Beach", "preferenceScore": -80},
+                {"suburbName": "Atlantis", "preferenceScore": 100},
+            ]
+        },
+    )
+    top = ranker.top_k(rows, profile, 3)
+    assert {listing_index.record(row)["suburb"] for row in top} == {"Paddington"}
+
+
+def test_interactions_lift_the_listing_and_its_suburb(ranker, listing_index):
+    rows = listing_index.search()
+    saved = listing_index.record(rows[-1])
+    profile = RankingProfile.from_recall(
+        listing_index,
+        {"propertyInteractions": [{"propertyId": saved["id"], "interactionType": "saved"}]},
+    )
+    assert profile.row_history == {int(rows[-1]): 1.0}
+    top = ranker.top_k(rows, profile, 3)
+    assert ids(listing_index, top)[0] == saved["id"]
+
+    dismissed = RankingProfile.from_recall(
+        listing_index,
+        {"propertyInteractions": [{"propertyId": saved["id"], "interactionType": "dismissed"}]},
+    )
+    assert saved["id"] not in ids(listing_index, ranker.top_k(rows, dismissed, len(rows) - 1))
+
+
+def test_text_and_proximity_scores_lead(ranker, listing_index):
+    rows = listing_index.search()
+    text_scores = np.zeros(len(rows), dtype=np.float32)
+    text_scores[7] = 4.0
+    assert ranker.top_k(rows, no_profile(listing_index), 1, text_scores=text_scores)[0] == rows[7]
+
+    proximity = np.zeros(len(rows), dtype=np.float32)
+    proximity[11] = 1.0
+    assert ranker.top_k(rows, no_profile(listing_index), 1, proximity=proximity)[0] == rows[11]
+
+
+def test_ties_keep_input_order(ranker, listing_index):
+    rows = listing_index.search()
+    proximity = np.ones(len(rows), dtype=np.float32)
+    assert list(ranker.top_k(rows, no_profile(listing_index), 4, proximity=proximity)) == list(rows[:4])
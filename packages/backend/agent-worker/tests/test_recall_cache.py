@@ -0,0 +1,76 @@
+import pytest
+
+from recall_cache import RecallCache
+
+RESULT = {
+    "memories": [{"content": "Wants a yard for the dog"}],
+    "facts": [{"fact": "Has a dog"}],
+    "propertyInteractions": [],
+    "suburbPreferences": [{"suburb": "Bondi"}],
+}
+
+
+@pytest.fixture
+def cache(clock, gazetteer) -> RecallCache:
+    return RecallCache(stable_ttl=300.0, volatile_ttl=60.0, clock=clock, locations=gazetteer.mentions)
+
+
+def test_exact_query_hits(cache):
+    cache.put("u1", "houses in bondi", 5, RESULT)
+    assert cache.get("u1", "Houses in Bondi?", 5) == RESULT
+    assert cache.get("u2", "houses in bondi", 5) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_similar_query_about_the_same_place_hits(cache):
+    cache.put("u1", "what about 3 bedrooms in paddington", 5, RESULT)
+    assert cache.get("u1", "what about three bedrooms in paddo", 5) == RESULT
+
+
+@pytest.mark.parametrize(
+    "cached, asked",
+    [
+        ("apartments in bondi with a pool", "apartments in manly with a pool"),
+        ("houses under 2 million in mosman", "houses under 3 million in mosman"),
+        ("what about 3 bedrooms in paddington", "what about 4 bedrooms in paddington"),
+    ],
+)
+def test_similar_query_about_another_place_or_number_misses(cache, cached, asked):
+    cache.put("u1", cached, 5, RESULT)
+    assert cache.get("u1", asked, 5) is None
+
+
+def test_smaller_cached_limit_misses(cache):
+    cache.put("u1", "houses in bondi", 3, RESULT)
+    assert cache.get("u1", "houses in bondi please", 5) is None
+    assert cache.get("u1", "houses in bondi", 3) == RESULT
+
+
+def test_tiers_expire_separately(cache, clock):
+    cache.put("u1", "houses in bondi", 5, RESULT)
+    clock.advance(61.0)
+    assert cache.get("u1", "houses in bondi", 5) is None
+
+    # A fresh volatile slice is served with the still-live stable slice
+    cache.put("u1", "houses in bondi", 5, {**RESULT, "facts": []})
+    assert cache.get("u1", "houses in bondi", 5)["facts"] == []
+    clock.advance(300.0)
+    assert cache.get("u1", "houses in bondi", 5) is None
+
+
+def test_invalidate_drops_one_tier(cache):
+    cache.put("u1", "houses in bondi", 5, RESULT)
+    cache.invalidate("u1", stable=False)
+    assert cache.get("u1", "houses in bondi", 5) is None
+
+    cache.put("u1", "houses in bondi", 5, RESULT)
+    cache.invalidate("u1", volatile=False)
+    assert cache.get("u1", "houses in bondi", 5) is None
+
+
+def test_lru_bound(clock, gazetteer):
+    cache = RecallCache(max_entries=2, clock=clock, locations=gazetteer.mentions)
+    for query in ("houses in bondi", "houses in manly", "houses in mosman"):
+        cache.put("u1", query, 5, RESULT)
+    assert cache.get("u1", "houses in bondi", 5) is None
+    assert cache.get("u1", "houses in mosman", 5) == RESULT
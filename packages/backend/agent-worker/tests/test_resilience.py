@@ -0,0 +1,89 @@
+from resilience import AdaptiveDeadline, CircuitBreaker, CortexGuard
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("cortex", failure_threshold=3, reset_timeout=10.0, clock=clock)
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_success()
+    assert breaker.failures == 0
+
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.is_open
+    assert not breaker.allow()
+    assert breaker.skipped == 1
+
+
+def test_half_open_allows_one_probe(clock):
+    breaker = CircuitBreaker("cortex", failure_threshold=1, reset_timeout=10.0, clock=clock)
+    breaker.record_failure()
+    clock.advance(10.0)
+
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker("cortex", failure_threshold=1, reset_timeout=10.0, clock=clock)
+    breaker.record_failure()
+    clock.advance(10.0)
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    clock.advance(10.0)
+    assert breaker.allow()
+
+
+def test_released_probe_can_be_retried(clock):
+    breaker = CircuitBreaker("cortex", failure_threshold=1, reset_timeout=10.0, clock=clock)
+    breaker.record_failure()
+    clock.advance(10.0)
+    assert breaker.allow()
+
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+
+def test_adaptive_deadline_tracks_p99_within_bounds():
+    deadline = AdaptiveDeadline(initial=1.0, floor=0.2, ceiling=2.0, headroom=1.5, warmup=10)
+    assert deadline.current() == 1.0
+    assert deadline.percentile(99) is None
+
+    for _ in range(10):
+        deadline.observe(0.4)
+    assert deadline.current() == 0.4 * 1.5
+
+    for _ in range(10):
+        deadline.observe(0.01)
+    # p99 of the window is still 0.4
+    assert deadline.current() == 0.4 * 1.5
+
+    fast = AdaptiveDeadline(initial=1.0, floor=0.2, warmup=1)
+    fast.observe(0.01)
+    assert fast.current() == 0.2
+
+    slow = AdaptiveDeadline(initial=1.0, ceiling=2.0, warmup=1)
+    slow.observe(5.0)
+    assert slow.current() == 2.0
+
+
+def test_guard_caps_recall_at_its_budget():
+    guard = CortexGuard(timeout=10.0, recall_budget=1.5, hedge_recall=True)
+    assert guard.deadline("recall") == 1.5
+    assert guard.deadline("remember") == 10.0
+    assert guard.hedge_delay("recall") is None
+
+    assert CortexGuard(hedge_recall=False).hedge_delay("recall") is None
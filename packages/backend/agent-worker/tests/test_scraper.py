@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from bench.fake_listing_site import FakeListingSite
+from scraper import SITES, ListingCrawler, SiteUnavailable, filter_listings
+
+
+def crawl(site_url: str | None, scenario, listings=None, **crawler_options):
+    """Run scenario(crawler, site) against a fake listing site (site_url=None) or site_url"""
+
+    async def run():
+        async with FakeListingSite(listings=listings, latency_ms=0) as site:
+            crawler = ListingCrawler(
+                site_url=site_url or site.url, rate_per_host=1000.0, burst=100, **crawler_options
+            )
+            try:
+                return await scenario(crawler, site)
+            finally:
+                await crawler.aclose()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("site_name", sorted(SITES))
+def test_crawl_parses_listing_markup(site_name, listing_records):
+    async def scenario(crawler, site):
+        return await crawler.search(site_name, "Bondi Beach", "NSW", "2026")
+
+    records = crawl(None, scenario)
+    expected = {record["id"] for record in listing_records if record["suburb"] == "Bondi Beach"}
+    assert {record["id"] for record in records} == {f"{site_name}-{pid}" for pid in expected}
+
+    by_id = {record["id"]: record for record in listing_records}
+    for record in records:
+        source = by_id[record["id"].removeprefix(f"{site_name}-")]
+        assert record["address"] == source["address"]
+        assert record["price"] == source["price"]
+        assert record["bedrooms"] == source["bedrooms"]
+        # schema.org has no townhouse type, so only these round-trip
+        if source["property_type"] in ("house", "apartment"):
+            assert record["property_type"] == source["property_type"]
+
+
+def test_repeat_crawl_is_served_from_cache():
+    async def scenario(crawler, site):
+        first = await crawler.search("domain", "Bondi Beach", "NSW", "2026")
+        fetched = site.requests["search"]
+        second = await crawler.search("domain", "bondi beach", "NSW", "2026")
+        return first, second, fetched, site.requests["search"], crawler
+
+    first, second, fetched, fetched_after, crawler = crawl(None, scenario)
+    assert second == first
+    assert fetched == fetched_after == crawler.max_pages
+    assert crawler.get(first[0]["id"]) == first[0]
+
+
+def test_concurrent_crawls_share_robots_txt():
+    async def scenario(crawler, site):
+        await asyncio.gather(
+            crawler.search("domain", "Bondi Beach", "NSW", "2026"),
+            crawler.search("domain", "Paddington", "NSW", "2021"),
+        )
+        return site.requests["robots"]
+
+    assert crawl(None, scenario) == 1
+
+
+def test_unreachable_site_raises_and_is_not_cached():
+    async def scenario(crawler, site):
+        with pytest.raises(SiteUnavailable):
+            await crawler.search("domain", "Bondi Beach", "NSW", "2026")
+        assert len(crawler.crawl_cache) == 0
+
+        # The next query tries again, and succeeds once the site is back
+        crawler.site_url = site.url
+        crawler.robots_retry = 0.0
+        return await crawler.search("domain", "Bondi Beach", "NSW", "2026")
+
+    records = crawl("http://127.0.0.1:9", scenario, timeout=1.0)
+    assert records
+
+
+def test_unknown_site_is_rejected():
+    async def scenario(crawler, site):
+        with pytest.raises(ValueError):
+            await crawler.search("zillow", "Bondi", "NSW")
+
+    crawl(None, scenario)
+
+
+def test_filter_listings_lets_unknown_values_through():
+    records = [
+        {"id": "a", "price": 900_000, "bedrooms": 2},
+        {"id": "b", "price": 1_600_000, "bedrooms": 3},
+        {"id": "c", "price": None, "bedrooms": None},
+    ]
+    assert [r["id"] for r in filter_listings(records, budget_max=1_000_000)] == ["a", "c"]
+    assert [r["id"] for r in filter_listings(records, budget_min=1_000_000, bedrooms=3)] == ["b", "c"]
+    assert filter_listings(records) == records
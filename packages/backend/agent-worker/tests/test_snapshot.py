@@ -0,0 +1,35 @@
+import numpy as np
+
+from listings import DEFAULT_LISTINGS_PATH
+from snapshot import SnapshotPostings, is_snapshot, load_listing_index, load_text_index
+from text_index import TextIndex
+
+
+def test_snapshot_serves_the_same_index(tmp_path, listing_index):
+    snapshot_index = load_listing_index(DEFAULT_LISTINGS_PATH, tmp_path)
+    assert any(is_snapshot(path) for path in tmp_path.iterdir())
+    assert len(snapshot_index) == len(listing_index)
+    criteria = {"suburbs": ["Bondi Beach", "Paddington"], "price_max": 3_000_000}
+    assert list(snapshot_index.search(**criteria)) == list(listing_index.search(**criteria))
+    listing_id = listing_index.record(0)["id"]
+    assert snapshot_index.get(listing_id) == listing_index.get(listing_id)
+
+
+
+def test_snapshot_serves_the_text_index(tmp_path, listing_index):
+    snapshot_index = load_listing_index(DEFAULT_LISTINGS_PATH, tmp_path)
+    mapped = load_text_index(snapshot_index)
+    built = TextIndex.from_listings(listing_index)
+    assert isinstance(snapshot_index.records.text_postings, SnapshotPostings)
+    assert mapped.vocabulary_size == built.vocabulary_size
+    for query in ("ocean views", "pool garden", "helipad"):
+        assert np.allclose(mapped.scores(query), built.scores(query)[: len(listing_index)])
+    assert mapped.matched_terms("ocean helipad") == ["ocean"]
+
+
+def test_mapped_text_index_accepts_updates(tmp_path, listing_index):
+    mapped = load_text_index(load_listing_index(DEFAULT_LISTINGS_PATH, tmp_path))
+    record = {**listing_index.record(3), "features": ["Helipad"], "description": "Private helipad."}
+    mapped.update(3, record)
+    mapped.compact()
+    assert np.flatnonzero(mapped.scores("helipad")).tolist() == [3]
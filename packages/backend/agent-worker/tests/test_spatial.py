@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from spatial import GridIndex, haversine_km
+
+
+@pytest.fixture(scope="module")
+def grid(listing_index) -> GridIndex:
+    return GridIndex(listing_index.lat, listing_index.lon)
+
+
+def test_haversine_known_distance():
+    # Sydney Town Hall to Bondi Beach is about 7 km
+    distance = haversine_km(np.array([-33.8731]), np.array([151.2067]), -33.8915, 151.2767)
+    assert distance[0] == pytest.approx(6.8, abs=0.3)
+
+
+@pytest.mark.parametrize("radius_km", [0.5, 1.0, 3.0, 10.0])
+def test_within_matches_brute_force(grid, listing_index, places, radius_km):
+    target = places.resolve("Bondi Beach")
+    rows, distances = grid.within(target.points, radius_km)
+
+    lat0, lon0 = target.points[0]
+    all_distances = haversine_km(listing_index.lat, listing_index.lon, lat0, lon0)
+    expected = np.flatnonzero(all_distances <= radius_km)
+    assert sorted(rows.tolist()) == sorted(expected.tolist())
+    assert np.allclose(distances, all_distances[rows])
+
+
+def test_nearest_is_closest_first_and_respects_where(grid, listing_index, places):
+    target = places.resolve("Bondi Beach")
+    rows, distances = grid.nearest(target.points, 3)
+    assert len(rows) == 3
+    assert list(distances) == sorted(distances)
+
+    lat0, lon0 = target.points[0]
+    all_distances = haversine_km(listing_index.lat, listing_index.lon, lat0, lon0)
+    assert distances[-1] <= np.sort(all_distances[~np.isnan(all_distances)])[2] + 1e-9
+
+    houses = listing_index.search(property_type="house")
+    rows, _ = grid.nearest(target.points, 3, where=lambda r: np.isin(r, houses))
+    assert set(rows.tolist()) <= set(houses.tolist())
+
+
+def test_nearest_stops_at_max_km(grid, places):
+    rows, distances = grid.nearest(places.resolve("Bondi Beach").points, 1000, max_km=2.0)
+    assert len(rows) < 1000
+    assert (distances <= 2.0).all()
+
+
+def test_place_resolution(places):
+    landmark = places.resolve("Bondi Beach")
+    assert landmark is not None and not landmark.is_category
+    stations = places.resolve("a train station")
+    assert stations is not None and stations.is_category
+    assert len(stations.points) > 1
+    assert places.resolve("nowhere land") is None
+
+
+def test_centroid_of_rows(grid, listing_index):
+    rows = listing_index.search(suburbs=["Bondi Beach"])
+    lat, lon = grid.centroid(rows)
+    assert lat == pytest.approx(float(np.nanmean(listing_index.lat[rows])))
+    assert lon == pytest.approx(float(np.nanmean(listing_index.lon[rows])))
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from speculative import SpeculativeRecall, query_anchors, same_question
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ("apartments in bondi with a pool", "apartments in manly with a pool"),
+        ("houses under 2 million in mosman", "houses under 3 million in mosman"),
+        ("houses in bondi beach", "houses in bondi"),
+        ("three bedroom houses in paddington", "four bedroom houses in paddington"),
+        ("anything in the eastern suburbs", "anything in the inner west"),
+    ],
+)
+def test_different_places_or_numbers_are_different_questions(gazetteer, a, b):
+    assert not same_question(a, b, 0.5, gazetteer.mentions)
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ("Apartments in Bondi with a pool.", "apartments in bondi with a pool"),
+        ("what about 3 bedrooms in paddo", "what about three bedrooms in paddington"),
+        ("show me houses in bondi under 2 million", "show me the houses in bondi under 2 million"),
+    ],
+)
+def test_rewordings_are_the_same_question(gazetteer, a, b):
+    assert same_question(a, b, 0.8, gazetteer.mentions)
+
+
+def test_anchors(gazetteer):
+    assert query_anchors("two million in bondi beach", gazetteer.mentions) == {"2", "million", "Bondi Beach"}
+    # Without a gazetteer only numbers anchor a query
+    assert query_anchors("two bedrooms in bondi") == {"2"}
+
+
+class Recalls:
+    """Fake Cortex recall recording each query"""
+
+    def __init__(self):
+        self.queries: list[str] = []
+
+    async def __call__(self, query: str) -> dict:
+        self.queries.append(query)
+        await asyncio.sleep(0.01)
+        return {"query": query}
+
+
+def test_speculation_is_reused_for_the_same_question(gazetteer):
+    recalls = Recalls()
+
+    async def scenario():
+        speculative = SpeculativeRecall(recalls, locations=gazetteer.mentions)
+        speculative.on_transcript("show me houses in bondi under 2 million", is_final=False)
+        result = await speculative.resolve("Show me houses in Bondi under 2 million.")
+        return speculative, result
+
+    speculative, result = asyncio.run(scenario())
+    assert recalls.queries == ["show me houses in bondi under 2 million"]
+    assert result == {"query": "show me houses in bondi under 2 million"}
+    assert (speculative.hits, speculative.misses) == (1, 0)
+
+
+def test_speculation_for_another_suburb_is_not_reused(gazetteer):
+    recalls = Recalls()
+
+    async def scenario():
+        speculative = SpeculativeRecall(recalls, locations=gazetteer.mentions)
+        speculative.on_transcript("apartments in bondi with a pool", is_final=False)
+        result = await speculative.resolve("apartments in manly with a pool")
+        return speculative, result
+
+    speculative, result = asyncio.run(scenario())
+    assert result == {"query": "apartments in manly with a pool"}
+    assert (speculative.hits, speculative.misses) == (0, 1)
+
+
+def test_interim_with_a_new_number_restarts_the_speculation(gazetteer):
+    recalls = Recalls()
+
+    async def scenario():
+        speculative = SpeculativeRecall(recalls, locations=gazetteer.mentions)
+        speculative.on_transcript("houses under 2 million in mosman", is_final=False)
+        await asyncio.sleep(0)
+        speculative.on_transcript("houses under 3 million in mosman", is_final=False)
+        return await speculative.resolve("houses under 3 million in mosman")
+
+    assert asyncio.run(scenario()) == {"query": "houses under 3 million in mosman"}
+    assert recalls.queries == ["houses under 2 million in mosman", "houses under 3 million in mosman"]
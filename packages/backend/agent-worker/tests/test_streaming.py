@@ -0,0 +1,73 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from agent import HausAgent
+from streaming import FILLER_PHRASES, narrate_tool_stream, run_with_filler
+from tool_cache import ToolResultCache
+
+
+class SlowListings:
+    """Listing lookups that block the calling thread"""
+
+    def __init__(self, listing_index, delay: float):
+        self.listing_index = listing_index
+        self.delay = delay
+
+    def get(self, property_id):
+        time.sleep(self.delay)
+        return self.listing_index.get(property_id)
+
+
+def test_filler_plays_while_a_step_runs_in_a_thread():
+    spoken = []
+
+    async def scenario():
+        step = asyncio.to_thread(time.sleep, 0.2)
+        await run_with_filler(step, lambda text, **kwargs: spoken.append(text), filler_after=0.05)
+
+    asyncio.run(scenario())
+    assert len(spoken) == 1 and spoken[0] in FILLER_PHRASES
+
+
+def test_no_filler_for_a_fast_step():
+    spoken = []
+
+    async def scenario():
+        await run_with_filler(asyncio.sleep(0), lambda text, **kwargs: spoken.append(text), filler_after=0.5)
+
+    asyncio.run(scenario())
+    assert spoken == []
+
+
+def test_slow_detail_lookup_plays_the_filler(listing_index):
+    listing_id = listing_index.record(0)["id"]
+    agent = SimpleNamespace(crawler=None, tool_cache=ToolResultCache(), listings=SlowListings(listing_index, 0.2))
+    spoken = []
+
+    async def scenario():
+        return await run_with_filler(
+            HausAgent._load_details(agent, listing_id),
+            lambda text, **kwargs: spoken.append(text),
+            filler_after=0.05,
+        )
+
+    details = asyncio.run(scenario())
+    assert details.record == listing_index.get(listing_id)
+    assert len(spoken) == 1 and spoken[0] in FILLER_PHRASES
+
+
+def test_narration_speaks_the_first_chunks_and_returns_the_rest():
+    spoken = []
+
+    async def chunks():
+        for text in ("Three homes. ", "The first is in Bondi. ", "The others are in Bronte."):
+            yield text
+
+    async def scenario():
+        return await narrate_tool_stream(chunks(), lambda text, **kwargs: spoken.append(text), narrate=2)
+
+    said, remaining = asyncio.run(scenario())
+    assert said == "Three homes. The first is in Bondi. "
+    assert remaining == "The others are in Bronte."
+    assert len(spoken) == 1  # one say() fed by the speech feed
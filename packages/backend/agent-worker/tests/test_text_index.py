@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from text_index import (
+    DESCRIPTION_WEIGHT,
+    FEATURE_WEIGHT,
+    TextIndex,
+    decode_varints,
+    encode_varints,
+    listing_terms,
+    tokenize,
+)
+
+
+@pytest.fixture
+def text_index(listing_index) -> TextIndex:
+    return TextIndex.from_listings(listing_index)
+
+
+def test_tokenize_stems_and_drops_stopwords():
+    assert tokenize("Ocean Views and pools!") == ["ocean", "view", "pool"]
+
+
+@pytest.mark.parametrize("values", [[0], [1, 127, 128, 16_383, 16_384, 2**31 - 1], list(range(0, 5000, 7))])
+def test_varints_round_trip(values):
+    encoded = encode_varints(np.array(values, dtype=np.int64))
+    assert decode_varints(encoded).tolist() == values
+
+
+def test_features_outweigh_description():
+    terms = listing_terms({"features": ["Pool"], "description": "Garden."})
+    assert terms == {"pool": FEATURE_WEIGHT, "garden": DESCRIPTION_WEIGHT}
+
+
+def test_bm25_ranks_matching_listings_first(text_index, listing_index):
+    scores = text_index.scores("ocean views")[: len(listing_index)]
+    best = listing_index.record(int(np.argmax(scores)))
+    text = (" ".join(best["features"]) + " " + best["description"]).lower()
+    assert "ocean" in text and "view" in text
+    # Listings mentioning neither term score zero
+    for row in np.flatnonzero(scores == 0):
+        record = listing_index.record(int(row))
+        words = set(tokenize(" ".join(record["features"]) + " " + record["description"]))
+        assert not {"ocean", "view"} & words
+
+
+def test_unknown_terms_score_nothing(text_index):
+    assert not text_index.scores("helipad").any()
+    assert text_index.matched_terms("ocean helipad") == ["ocean"]
+
+
+def test_score_rows_matches_full_scores(text_index):
+    rows = np.array([0, 3, 7, 21])
+    assert np.allclose(text_index.score_rows("ocean views", rows), text_index.scores("ocean views")[rows])
+
+
+def test_updates_match_a_fresh_build(listing_index):
+    records = [(row, listing_index.record(row)) for row in range(len(listing_index))]
+    changed = {**records[5][1], "features": ["Helipad"], "description": "Private helipad and ocean views."}
+
+    incremental = TextIndex.from_records(records)
+    incremental.update(5, changed)
+    incremental.remove(9)
+    expected = TextIndex.from_records([(row, changed if row == 5 else record) for row, record in records if row != 9])
+
+    for query in ("helipad", "ocean views", "pool garden"):
+        assert np.allclose(incremental.scores(query), expected.scores(query))
+    incremental.compact()
+    for query in ("helipad", "ocean views", "pool garden"):
+        assert np.allclose(incremental.scores(query), expected.scores(query))
+    assert incremental.stats()["delta_documents"] == 0
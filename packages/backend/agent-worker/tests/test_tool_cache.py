@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from tool_cache import ToolResultCache, make_key
+
+
+def test_keys_are_normalized():
+    assert make_key("search", location="Bondi  Beach ") == make_key("search", location="bondi beach")
+    assert make_key("search", radius_km=3.0) == make_key("search", radius_km=3)
+    assert make_key("search", terms={"pool", "view"}) == make_key("search", terms={"view", "pool"})
+    assert make_key("search", location="bondi", bedrooms=None) == make_key("search", location="bondi")
+    assert make_key("search", bedrooms=2) != make_key("search", bedrooms=3)
+
+
+def test_sync_compute_is_cached_until_ttl(clock):
+    cache = ToolResultCache(ttl=60.0, clock=clock)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    async def lookup():
+        return await cache.get_or_compute(("k",), compute)
+
+    assert asyncio.run(lookup()) == 1
+    assert asyncio.run(lookup()) == 1
+    clock.advance(61.0)
+    assert asyncio.run(lookup()) == 2
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 2, "coalesced": 0}
+
+
+def test_lru_eviction():
+    cache = ToolResultCache(max_entries=2)
+
+    async def scenario():
+        for key in ("a", "b"):
+            await cache.get_or_compute((key,), lambda key=key: key)
+        await cache.get_or_compute(("a",), lambda: "recomputed")
+        await cache.get_or_compute(("c",), lambda: "c")
+        return await cache.get_or_compute(("a",), lambda: "recomputed"), await cache.get_or_compute(
+            ("b",), lambda: "recomputed"
+        )
+
+    assert asyncio.run(scenario()) == ("a", "recomputed")
+
+
+def test_tag_invalidation_and_generation():
+    cache = ToolResultCache()
+
+    async def scenario():
+        await cache.get_or_compute(("search",), lambda: "results", tags=("search",))
+        await cache.get_or_compute(("p1",), lambda: "one", tags=("property:prop-001",))
+        await cache.get_or_compute(("p2",), lambda: "two", tags=("property:prop-002",))
+        generation = cache.generation
+        assert cache.invalidate(["search", "property:prop-001"]) == 2
+        assert cache.generation == generation + 1
+        assert len(cache) == 1
+        assert cache.invalidate() == 1
+
+    asyncio.run(scenario())
+    assert len(cache) == 0
+
+
+def test_concurrent_async_lookups_share_one_computation():
+    cache = ToolResultCache()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get_or_compute(("k",), compute) for _ in range(5)))
+
+    assert asyncio.run(scenario()) == ["value"] * 5
+    assert calls == 1
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_cancelled_caller_does_not_cancel_other_callers():
+    cache = ToolResultCache()
+
+    async def compute():
+        await asyncio.sleep(0.02)
+        return "value"
+
+    async def scenario():
+        first = asyncio.create_task(cache.get_or_compute(("k",), compute))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_compute(("k",), compute))
+        await asyncio.sleep(0.005)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "value"
+    # The shared lookup finished and was cached
+    assert cache.stats()["entries"] == 1
+
+
+def test_errors_reach_every_caller_and_are_not_cached():
+    cache = ToolResultCache()
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        raise ValueError("lookup failed")
+
+    async def scenario():
+        return await asyncio.gather(
+            *(cache.get_or_compute(("k",), compute) for _ in range(2)), return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(cache) == 0
+
+
+def test_result_computed_across_an_invalidation_is_not_stored():
+    cache = ToolResultCache()
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        return "stale"
+
+    async def scenario():
+        lookup = asyncio.create_task(cache.get_or_compute(("k",), compute))
+        await asyncio.sleep(0)
+        cache.invalidate()
+        return await lookup
+
+    assert asyncio.run(scenario()) == "stale"
+    assert len(cache) == 0
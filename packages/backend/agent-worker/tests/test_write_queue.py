@@ -0,0 +1,101 @@
+import asyncio
+
+from write_queue import WriteBehindQueue
+
+
+def test_writes_are_batched_and_drained():
+    batches = []
+
+    async def send(batch):
+        batches.append([item["n"] for item in batch])
+        return []
+
+    async def scenario():
+        queue = WriteBehindQueue(send, max_batch_size=3, flush_interval=0.01)
+        for n in range(5):
+            queue.enqueue({"n": n})
+        assert queue.pending == 5
+        await queue.drain()
+        return queue
+
+    queue = asyncio.run(scenario())
+    assert batches == [[0, 1, 2], [3, 4]]
+    assert queue.sent == 5 and queue.dropped == 0 and queue.pending == 0
+
+
+def test_failed_items_are_retried():
+    attempts = []
+
+    async def send(batch):
+        attempts.append([item["n"] for item in batch])
+        # Item 1 fails on its first attempt only
+        return [item for item in batch if item["n"] == 1 and len(attempts) == 1]
+
+    async def scenario():
+        queue = WriteBehindQueue(send, flush_interval=0.0, retry_backoff=0.001)
+        queue.enqueue({"n": 0})
+        queue.enqueue({"n": 1})
+        await queue.drain()
+        return queue
+
+    queue = asyncio.run(scenario())
+    assert attempts == [[0, 1], [1]]
+    assert queue.sent == 2 and queue.dropped == 0
+
+
+def test_gives_up_after_max_retries():
+    calls = 0
+
+    async def send(batch):
+        nonlocal calls
+        calls += 1
+        raise ConnectionError("cortex down")
+
+    async def scenario():
+        queue = WriteBehindQueue(send, flush_interval=0.0, max_retries=2, retry_backoff=0.001)
+        queue.enqueue({"n": 0})
+        await queue.drain()
+        return queue
+
+    queue = asyncio.run(scenario())
+    assert calls == 3
+    assert queue.sent == 0 and queue.dropped == 1
+
+
+def test_sheds_oldest_beyond_max_pending_and_drops_after_drain():
+    sent = []
+
+    async def send(batch):
+        sent.extend(item["n"] for item in batch)
+        return []
+
+    async def scenario():
+        queue = WriteBehindQueue(send, flush_interval=0.01, max_pending=3)
+        for n in range(5):
+            queue.enqueue({"n": n})
+        await queue.drain()
+        queue.enqueue({"n": 99})
+        return queue
+
+    queue = asyncio.run(scenario())
+    assert sent == [2, 3, 4]
+    assert queue.dropped == 3
+
+
+def test_drain_times_out_and_drops_pending():
+    async def send(batch):
+        await asyncio.sleep(10)
+        return []
+
+    async def scenario():
+        queue = WriteBehindQueue(send, flush_interval=0.0, max_batch_size=1)
+        queue.enqueue({"n": 0})
+        queue.enqueue({"n": 1})
+        await queue.drain(timeout=0.05)
+        return queue
+
+    queue = asyncio.run(scenario())
+    assert queue.pending == 0
+    # The write in flight is lost as well as the pending one
+    assert queue.dropped == 2
+
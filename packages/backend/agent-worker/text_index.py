@@ -0,0 +1,326 @@
+"""
+HAUS Voice Agent - Full-Text Listing Index
+
+In-process inverted index with BM25 scoring over listing descriptions
+and feature lists, so "ocean views and a pool" resolves in the same
+search_properties call as the location and budget filters.
+
+- documents are listing-index rows; feature terms count double (a
+  listed feature says more than a passing mention in the description)
+- the main segment stores each term's posting list compressed: doc IDs
+  as delta-encoded varints and term frequencies as bytes, decoded with
+  vectorized NumPy
+- updates go to an uncompressed delta segment, and replaced or removed
+  documents are masked out of the main segment until compact() merges
+  the two (automatically once the delta segment grows past a threshold)
+- score_rows() evaluates a query against candidate rows that already
+  passed the structured filters
+- the main segment can also be served straight from a listing snapshot
+  (see snapshot.py), whose postings are mapped rather than rebuilt
+- updates and queries hold a lock, so searches can score in a worker
+  thread while the listing-update hook re-indexes on the event loop
+"""
+
+import math
+import re
+import threading
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or the this to with".split()
+)
+
+# Field weights (term-frequency multipliers)
+FEATURE_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+
+def _stem(token: str) -> str:
+    """Light plural folding, so "views" matches "view" and "pools" matches "pool" """
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase, stopword-free, plural-folded terms"""
+    return [_stem(token) for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def listing_terms(record: dict[str, Any]) -> dict[str, int]:
+    """Weighted term frequencies of a listing's description and features"""
+    tf: dict[str, int] = {}
+    for token in tokenize(record.get("description") or ""):
+        tf[token] = tf.get(token, 0) + DESCRIPTION_WEIGHT
+    for token in tokenize(" ".join(record.get("features") or [])):
+        tf[token] = tf.get(token, 0) + FEATURE_WEIGHT
+    return tf
+
+
+# -----------------------------------------------------------------------------
+# Varint posting compression
+# -----------------------------------------------------------------------------
+
+
+def encode_varints(values: np.ndarray) -> bytes:
+    """LEB128-encode non-negative integers (vectorized)"""
+    values = np.asarray(values, dtype=np.uint64)
+    if not len(values):
+        return b""
+    nbytes = np.ones(len(values), dtype=np.int64)
+    for shift in (7, 14, 21, 28, 35):
+        nbytes += values >= (np.uint64(1) << np.uint64(shift))
+    starts = np.cumsum(nbytes) - nbytes
+    owner = np.repeat(np.arange(len(values)), nbytes)
+    position = np.arange(int(nbytes.sum())) - starts[owner]
+    out = (values[owner] >> (np.uint64(7) * position.astype(np.uint64))) & np.uint64(0x7F)
+    out |= np.where(position < nbytes[owner] - 1, np.uint64(0x80), np.uint64(0))
+    return out.astype(np.uint8).tobytes()
+
+
+def decode_varints(data: bytes) -> np.ndarray:
+    """Inverse of encode_varints"""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if not len(raw):
+        return np.empty(0, dtype=np.int64)
+    ends = raw < 0x80
+    value_index = np.concatenate(([0], np.cumsum(ends)[:-1]))
+    starts = np.flatnonzero(np.concatenate(([True], ends[:-1])))
+    position = np.arange(len(raw)) - starts[value_index]
+    parts = (raw & 0x7F).astype(np.int64) << (7 * position)
+    return np.add.reduceat(parts, starts)
+
+
+class PostingList:
+    """One term's compressed postings: delta-varint doc IDs, byte term frequencies"""
+
+    __slots__ = ("docs", "tfs", "count")
+
+    def __init__(self, docs: np.ndarray, tfs: np.ndarray):
+        order = np.argsort(docs, kind="stable")
+        docs = np.asarray(docs, dtype=np.int64)[order]
+        self.docs = encode_varints(np.diff(docs, prepend=0))
+        self.tfs = np.minimum(np.asarray(tfs)[order], 255).astype(np.uint8).tobytes()
+        self.count = len(docs)
+
+    @classmethod
+    def encoded(cls, docs: bytes | memoryview, tfs: bytes | memoryview) -> "PostingList":
+        """Wrap already-encoded postings (e.g. slices of a mapped snapshot) without copying"""
+        postings = cls.__new__(cls)
+        postings.docs = docs
+        postings.tfs = tfs
+        postings.count = len(tfs)
+        return postings
+
+    def decode(self) -> tuple[np.ndarray, np.ndarray]:
+        return np.cumsum(decode_varints(self.docs)), np.frombuffer(self.tfs, dtype=np.uint8)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.docs) + len(self.tfs)
+
+
+class TextIndex:
+    """BM25 inverted index over listing text, keyed by listing-index row"""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, compact_threshold: int = 1000):
+        self.k1 = k1
+        self.b = b
+        self.compact_threshold = compact_threshold
+        self._postings: dict[str, PostingList] = {}
+        # Main-segment documents that were since updated or removed
+        self._main_docs = np.zeros(0, dtype=bool)
+        self._masked = np.zeros(0, dtype=bool)
+        # Delta segment: doc -> term frequencies
+        self._delta: dict[int, dict[str, int]] = {}
+        self._doc_len = np.zeros(0, dtype=np.float32)
+        self._live = np.zeros(0, dtype=bool)
+        self._total_len = 0.0
+        self._live_count = 0
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_records(cls, records: Iterable[tuple[int, dict[str, Any]]], **kwargs: Any) -> "TextIndex":
+        """Build the main segment from (row, record) pairs"""
+        index = cls(**kwargs)
+        for row, record in records:
+            index._delta[row] = listing_terms(record)
+            index._set_length(row, sum(index._delta[row].values()))
+        index.compact()
+        return index
+
+    @classmethod
+    def from_listings(cls, listings: Any, **kwargs: Any) -> "TextIndex":
+        """Index every row of a ListingIndex"""
+        return cls.from_records(((row, listings.record(row)) for row in range(len(listings))), **kwargs)
+
+    @classmethod
+    def from_postings(cls, postings: Mapping[str, PostingList], doc_len: np.ndarray, **kwargs: Any) -> "TextIndex":
+        """
+        Serve a prebuilt main segment: compressed postings by term and the
+        length of every document (rows 0..len(doc_len) - 1). The postings
+        mapping is only read until the first compact().
+        """
+        index = cls(**kwargs)
+        index._postings = postings
+        index._doc_len = np.array(doc_len, dtype=np.float32)
+        index._live = np.ones(len(doc_len), dtype=bool)
+        index._main_docs = index._live.copy()
+        index._masked = np.zeros(len(doc_len), dtype=bool)
+        index._total_len = float(index._doc_len.sum())
+        index._live_count = len(doc_len)
+        return index
+
+    def __len__(self) -> int:
+        return self._live_count
+
+    @property
+    def vocabulary_size(self) -> int:
+        """Distinct terms in the main segment"""
+        return len(self._postings)
+
+    def main_segment(self) -> tuple[Mapping[str, PostingList], np.ndarray]:
+        """Compacted postings by term and document lengths by row, for serialization"""
+        self.compact()
+        return self._postings, self._doc_len
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def update(self, row: int, record: dict[str, Any]) -> None:
+        """Add or replace a document"""
+        terms = listing_terms(record)
+        with self._lock:
+            self.remove(row)
+            self._delta[row] = terms
+            self._set_length(row, sum(terms.values()))
+            if len(self._delta) >= self.compact_threshold:
+                self.compact()
+
+    def remove(self, row: int) -> None:
+        """Drop a document (a no-op if it isn't indexed)"""
+        with self._lock:
+            if row < len(self._live) and self._live[row]:
+                self._total_len -= float(self._doc_len[row])
+                self._live_count -= 1
+                self._live[row] = False
+                self._doc_len[row] = 0.0
+            self._delta.pop(row, None)
+            if row < len(self._main_docs) and self._main_docs[row]:
+                self._masked[row] = True
+
+    def _set_length(self, row: int, length: int) -> None:
+        self._grow(row + 1)
+        self._doc_len[row] = length
+        self._live[row] = True
+        self._total_len += length
+        self._live_count += 1
+
+    def _grow(self, size: int) -> None:
+        if size <= len(self._live):
+            return
+        size = max(size, 2 * len(self._live))
+        for name in ("_doc_len", "_live", "_main_docs", "_masked"):
+            array = getattr(self, name)
+            grown = np.zeros(size, dtype=array.dtype)
+            grown[: len(array)] = array
+            setattr(self, name, grown)
+
+    def compact(self) -> None:
+        """Merge the delta segment into compressed main-segment postings"""
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        merged: dict[str, tuple[list[np.ndarray], list[np.ndarray]]] = {}
+        for term, postings in self._postings.items():
+            docs, tfs = postings.decode()
+            keep = ~self._masked[docs]
+            if keep.any():
+                merged[term] = ([docs[keep]], [tfs[keep]])
+
+        delta_terms: dict[str, tuple[list[int], list[int]]] = {}
+        for row, terms in self._delta.items():
+            for term, tf in terms.items():
+                docs, tfs = delta_terms.setdefault(term, ([], []))
+                docs.append(row)
+                tfs.append(tf)
+        for term, (docs, tfs) in delta_terms.items():
+            entry = merged.setdefault(term, ([], []))
+            entry[0].append(np.asarray(docs, dtype=np.int64))
+            entry[1].append(np.asarray(tfs, dtype=np.int64))
+
+        self._postings = {
+            term: PostingList(np.concatenate(docs), np.concatenate(tfs))
+            for term, (docs, tfs) in merged.items()
+        }
+        self._main_docs = self._live.copy()
+        self._masked = np.zeros(len(self._live), dtype=bool)
+        self._delta = {}
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def _term_postings(self, term: str) -> tuple[np.ndarray, np.ndarray]:
+        """Live (docs, tfs) for a term across both segments"""
+        docs = np.empty(0, dtype=np.int64)
+        tfs = np.empty(0, dtype=np.int64)
+        postings = self._postings.get(term)
+        if postings is not None:
+            docs, tfs = postings.decode()
+            if self._masked.any():
+                keep = ~self._masked[docs]
+                docs, tfs = docs[keep], tfs[keep]
+        if self._delta:
+            extra = [(row, terms[term]) for row, terms in self._delta.items() if term in terms]
+            if extra:
+                docs = np.concatenate((docs, np.fromiter((r for r, _ in extra), np.int64, len(extra))))
+                tfs = np.concatenate((tfs, np.fromiter((t for _, t in extra), np.int64, len(extra))))
+        return docs, tfs
+
+    def scores(self, query: str) -> np.ndarray:
+        """BM25 score of every document (float32, indexed by row; 0 = no match)"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            scores = np.zeros(len(self._live), dtype=np.float32)
+            if not self._live_count:
+                return scores
+            avg_len = self._total_len / self._live_count
+            for term in terms:
+                docs, tfs = self._term_postings(term)
+                if not len(docs):
+                    continue
+                idf = math.log(1.0 + (self._live_count - len(docs) + 0.5) / (len(docs) + 0.5))
+                tf = tfs.astype(np.float32)
+                norm = self.k1 * (1.0 - self.b + self.b * self._doc_len[docs] / avg_len)
+                scores[docs] += idf * tf * (self.k1 + 1.0) / (tf + norm)
+            return scores
+
+    def score_rows(self, query: str, rows: np.ndarray) -> np.ndarray:
+        """BM25 scores of candidate rows (e.g. structured-search results)"""
+        scores = self.scores(query)
+        rows = np.asarray(rows)
+        inside = rows < len(scores)
+        return np.where(inside, scores[np.minimum(rows, max(len(scores) - 1, 0))], 0.0).astype(np.float32)
+
+    def matched_terms(self, query: str) -> list[str]:
+        """Query terms that occur in the index"""
+        with self._lock:
+            return [term for term in dict.fromkeys(tokenize(query)) if len(self._term_postings(term)[0])]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "documents": self._live_count,
+            "terms": len(self._postings),
+            "postings_bytes": sum(p.nbytes for p in self._postings.values()),
+            "postings": sum(p.count for p in self._postings.values()),
+            "delta_documents": len(self._delta),
+        }
@@ -0,0 +1,163 @@
+"""
+HAUS Voice Agent - Tool Result Cache
+
+Worker-level async cache for tool lookups (listing searches, property
+details) shared by every session in the worker process:
+
+- keys are built from normalized arguments, so "Bondi " and "bondi"
+  share an entry
+- concurrent identical async lookups are coalesced: the first caller
+  starts one task and every caller awaits it through a shield, so a
+  cancelled caller doesn't cancel it for the rest (single-flight)
+- synchronous lookups run inline, since nothing can interleave with them
+- entries are bounded by TTL and LRU eviction
+- entries carry tags (e.g. "search", "property:prop-001") so a listing
+  update can invalidate exactly what it affects
+
+Only the lookup is cached. Per-session side effects such as recording a
+property interaction stay in the tool and run on every call.
+"""
+
+import asyncio
+import inspect
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable, Iterable
+
+
+def normalize_key_part(value: Any) -> Hashable:
+    """Canonical, hashable form of a tool argument"""
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        parts = [normalize_key_part(item) for item in value]
+        return tuple(sorted(parts, key=repr)) if isinstance(value, (set, frozenset)) else tuple(parts)
+    return value
+
+
+def make_key(tool: str, **arguments: Any) -> tuple:
+    """Cache key for a tool call; None-valued arguments are dropped"""
+    return (tool,) + tuple(
+        (name, normalize_key_part(value))
+        for name, value in sorted(arguments.items())
+        if value is not None
+    )
+
+
+@dataclass
+class _ToolEntry:
+    value: Any
+    expires_at: float
+    tags: frozenset[str] = field(default_factory=frozenset)
+
+
+class ToolResultCache:
+    """TTL + LRU cache with single-flight computation and tag invalidation"""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[tuple, _ToolEntry] = OrderedDict()
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # Bumped on invalidation so lookups started before it don't store
+        # stale results
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_compute(
+        self,
+        key: tuple,
+        compute: Callable[[], Any | Awaitable[Any]],
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """
+        Return the cached value for key, computing it on a miss.
+
+        A synchronous compute runs inline. An async one runs as a task
+        shared by concurrent callers for the key, which finishes (and is
+        cached) even if the caller that started it is cancelled.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        generation = self._generation
+        value = compute()
+        if not inspect.isawaitable(value):
+            self._store_current(key, value, tags, generation)
+            return value
+
+        task = asyncio.ensure_future(self._finish(key, value, tags, generation))
+        self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _finish(self, key: tuple, pending: Awaitable[Any], tags: Iterable[str], generation: int) -> Any:
+        try:
+            value = await pending
+        finally:
+            self._inflight.pop(key, None)
+        self._store_current(key, value, tags, generation)
+        return value
+
+    def _store_current(self, key: tuple, value: Any, tags: Iterable[str], generation: int) -> None:
+        """Cache a value unless an invalidation happened while it was computed"""
+        if generation == self._generation:
+            self._store(key, _ToolEntry(value, self._clock() + self.ttl, frozenset(tags)))
+
+    @property
+    def generation(self) -> int:
+        """Bumped by every invalidate(), so holders of looked-up values can tell they may be stale"""
+        return self._generation
+
+    def invalidate(self, tags: Iterable[str] | None = None) -> int:
+        """Drop entries carrying any of tags (everything if None), return the count"""
+        self._generation += 1
+        if tags is None:
+            dropped = len(self._entries)
+            self._entries.clear()
+            return dropped
+
+        tags = frozenset(tags)
+        stale = [key for key, entry in self._entries.items() if entry.tags & tags]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+    def _store(self, key: tuple, entry: _ToolEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
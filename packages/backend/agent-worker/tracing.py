@@ -0,0 +1,265 @@
+"""
+HAUS Voice Agent - Latency Tracing
+
+Low-overhead timing spans for each stage of a voice turn:
+
+    session.greeting_ready session start to greeting dispatch (room joined, profile recalled)
+    stt.final_transcript   STT final transcript delay (from LiveKit metrics)
+    stt.end_of_utterance   end-of-turn detection delay (from LiveKit metrics)
+    turn.recall            Cortex recall inside on_user_turn_completed
+    llm.first_token        LLM time to first token (from LiveKit metrics)
+    tool.<name>            each @function_tool call
+    search.rank            preference ranking of search candidates
+    cortex.<endpoint>      each Cortex HTTP request
+    cortex.recall.hedged   hedge delay, each time a duplicate recall was sent
+    tts.first_audio        TTS time to first audio byte (from LiveKit metrics)
+
+A span is two perf_counter() reads and a bucket increment. Spans are
+aggregated into per-session histograms and into process-level
+histograms. Job processes drain the process-level histograms into their
+reports to the main worker process, which merges them and serves the
+result on /metrics.
+"""
+
+import bisect
+import functools
+import math
+import time
+from typing import Any, Callable
+
+# Log-spaced bucket upper bounds in ms, ~15% apart from 0.1 ms to ~2 min
+_BUCKET_BOUNDS = [0.1 * 1.15**i for i in range(100)]
+
+# LiveKit metrics event type -> [(attribute, stage)]
+_LIVEKIT_METRIC_STAGES = {
+    "eou_metrics": [
+        ("transcription_delay", "stt.final_transcript"),
+        ("end_of_utterance_delay", "stt.end_of_utterance"),
+    ],
+    "llm_metrics": [("ttft", "llm.first_token")],
+    "tts_metrics": [("ttfb", "tts.first_audio")],
+}
+
+
+class Histogram:
+    """Fixed log-bucket latency histogram (values in ms)"""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def percentile(self, q: float) -> float:
+        """Approximate q-th percentile (0-100), accurate to one bucket"""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100.0))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                bound = _BUCKET_BOUNDS[index] if index < len(_BUCKET_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def merge(self, other: "Histogram") -> None:
+        for index, bucket_count in enumerate(other.counts):
+            self.counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-safe form (non-empty buckets only)"""
+        return {
+            "buckets": {str(index): n for index, n in enumerate(self.counts) if n},
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Histogram":
+        histogram = cls()
+        for index, n in data.get("buckets", {}).items():
+            histogram.counts[int(index)] = int(n)
+        histogram.count = int(data.get("count", 0))
+        histogram.total = float(data.get("total", 0.0))
+        histogram.max = float(data.get("max", 0.0))
+        return histogram
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 2) if self.count else 0.0,
+            "p50": round(self.percentile(50), 2),
+            "p95": round(self.percentile(95), 2),
+            "p99": round(self.percentile(99), 2),
+            "max": round(self.max, 2),
+        }
+
+
+class _Span:
+    __slots__ = ("_trace", "_stage", "_start")
+
+    def __init__(self, trace: "SessionTrace", stage: str):
+        self._trace = trace
+        self._stage = stage
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._trace.record(self._stage, (time.perf_counter() - self._start) * 1000.0)
+
+
+class SessionTrace:
+    """Latency histograms for one voice session"""
+
+    def __init__(self, session_id: str, worker: "WorkerMetrics | None" = None):
+        self.session_id = session_id
+        self.worker = worker
+        self.histograms: dict[str, Histogram] = {}
+        self.started_at = time.time()
+
+    def span(self, stage: str) -> _Span:
+        """Time a block: `with trace.span("cortex.recall"): ...`"""
+        return _Span(self, stage)
+
+    def record(self, stage: str, value_ms: float) -> None:
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = Histogram()
+        histogram.record(value_ms)
+        if self.worker is not None:
+            self.worker.record(stage, value_ms)
+
+    def on_metrics_collected(self, event: Any) -> None:
+        """Session 'metrics_collected' handler for LiveKit STT/LLM/TTS metrics"""
+        metrics = getattr(event, "metrics", event)
+        for attribute, stage in _LIVEKIT_METRIC_STAGES.get(getattr(metrics, "type", ""), ()):
+            value = getattr(metrics, attribute, None)
+            if value is not None and value >= 0:
+                self.record(stage, value * 1000.0)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {stage: h.summary() for stage, h in sorted(self.histograms.items())}
+
+
+class WorkerMetrics:
+    """Process-level aggregation of session traces"""
+
+    def __init__(self):
+        self.histograms: dict[str, Histogram] = {}
+        self.sessions: dict[str, SessionTrace] = {}
+        self.sessions_total = 0
+        self._sessions_drained = 0
+
+    def session(self, session_id: str) -> SessionTrace:
+        """Start tracing a session"""
+        trace = SessionTrace(session_id, self)
+        self.sessions[session_id] = trace
+        self.sessions_total += 1
+        return trace
+
+    def end_session(self, session_id: str) -> SessionTrace | None:
+        """Stop tracking a session and log its latency summary"""
+        trace = self.sessions.pop(session_id, None)
+        if trace is not None:
+            stages = ", ".join(
+                f"{stage} p50={s['p50']}ms p95={s['p95']}ms"
+                for stage, s in trace.summary().items()
+            )
+            print(f"[Tracing] Session {session_id} latency: {stages or 'no spans'}")
+        return trace
+
+    def record(self, stage: str, value_ms: float) -> None:
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = Histogram()
+        histogram.record(value_ms)
+
+    def drain(self) -> dict[str, Any]:
+        """Histograms and session starts since the last drain, for a report; resets both"""
+        drained = {
+            "sessions_started": self.sessions_total - self._sessions_drained,
+            "histograms": {stage: h.to_dict() for stage, h in self.histograms.items()},
+        }
+        self.histograms = {}
+        self._sessions_drained = self.sessions_total
+        return drained
+
+    def merge(self, drained: dict[str, Any]) -> None:
+        """Add another process's drain() result"""
+        self.sessions_total += int(drained.get("sessions_started", 0))
+        self._merge_histograms(drained)
+
+    def restore(self, drained: dict[str, Any]) -> None:
+        """Put back a drain() result that couldn't be reported"""
+        self._sessions_drained -= int(drained.get("sessions_started", 0))
+        self._merge_histograms(drained)
+
+    def _merge_histograms(self, drained: dict[str, Any]) -> None:
+        for stage, data in drained.get("histograms", {}).items():
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram()
+            histogram.merge(Histogram.from_dict(data))
+
+    def summary(self, active_sessions: int | None = None) -> dict[str, Any]:
+        return {
+            "active_sessions": len(self.sessions) if active_sessions is None else active_sessions,
+            "sessions_total": self.sessions_total,
+            "stages": {stage: h.summary() for stage, h in sorted(self.histograms.items())},
+        }
+
+    def render_prometheus(self, active_sessions: int | None = None) -> str:
+        """Prometheus text exposition of the worker histograms (as summaries)"""
+        lines = [
+            "# HELP haus_stage_latency_ms Voice pipeline stage latency in milliseconds",
+            "# TYPE haus_stage_latency_ms summary",
+        ]
+        for stage, histogram in sorted(self.histograms.items()):
+            for quantile in (0.5, 0.95, 0.99):
+                lines.append(
+                    f'haus_stage_latency_ms{{stage="{stage}",quantile="{quantile}"}} '
+                    f"{histogram.percentile(quantile * 100):.3f}"
+                )
+            lines.append(f'haus_stage_latency_ms_sum{{stage="{stage}"}} {histogram.total:.3f}')
+            lines.append(f'haus_stage_latency_ms_count{{stage="{stage}"}} {histogram.count}')
+        lines.append("# TYPE haus_active_sessions gauge")
+        lines.append(
+            f"haus_active_sessions {len(self.sessions) if active_sessions is None else active_sessions}"
+        )
+        lines.append("# TYPE haus_sessions_total counter")
+        lines.append(f"haus_sessions_total {self.sessions_total}")
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide metrics shared by every session in this process
+worker_metrics = WorkerMetrics()
+
+
+def traced(stage: str) -> Callable:
+    """Decorate an async method of an object with a `trace` attribute to time each call"""
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            with self.trace.span(stage):
+                return await fn(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
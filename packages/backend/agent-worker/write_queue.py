@@ -0,0 +1,135 @@
+"""
+HAUS Voice Agent - Write-Behind Queue
+
+Fire-and-forget queue for Cortex memory writes. Tools enqueue a payload
+and return immediately; a background task coalesces pending writes into
+batches, sends them with retry and exponential backoff, and is drained on
+session shutdown so queued writes aren't lost when the client closes.
+"""
+
+import asyncio
+import random
+from typing import Any, Awaitable, Callable
+
+# Sends a batch and returns the items that failed and should be retried.
+# Raising means the whole batch failed.
+SendBatchFn = Callable[[list[dict[str, Any]]], Awaitable[list[dict[str, Any]]]]
+
+
+class WriteBehindQueue:
+    """Batched, retrying background writer"""
+
+    def __init__(
+        self,
+        send_batch: SendBatchFn,
+        max_batch_size: int = 25,
+        flush_interval: float = 0.2,
+        max_retries: int = 3,
+        retry_backoff: float = 0.25,
+        max_pending: int = 500,
+    ):
+        self._send_batch = send_batch
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_pending = max_pending
+
+        self._pending: list[dict[str, Any]] = []
+        # Writes in the batch being sent (or waiting to be retried)
+        self._inflight = 0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+
+        self.sent = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of writes waiting to be sent"""
+        return len(self._pending)
+
+    def enqueue(self, item: dict[str, Any]) -> None:
+        """Queue a write without waiting for it"""
+        if self._closing:
+            print("[WriteBehindQueue] Write enqueued after drain, dropping")
+            self.dropped += 1
+            return
+
+        self._pending.append(item)
+        if len(self._pending) > self.max_pending:
+            # Shed the oldest write rather than grow without bound while
+            # Cortex is unreachable
+            self._pending.pop(0)
+            self.dropped += 1
+
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def drain(self, timeout: float = 5.0) -> None:
+        """Flush every pending write and stop the background task"""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            if self._pending:
+                self._task = asyncio.create_task(self._run())
+            else:
+                return
+
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+            lost = len(self._pending) + self._inflight
+            self.dropped += lost
+            print(
+                f"[WriteBehindQueue] Drain timed out, dropped {lost} writes "
+                f"({self._inflight} in flight, {len(self._pending)} pending)"
+            )
+            self._pending.clear()
+            self._inflight = 0
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            if not self._closing:
+                # Give the rest of the tool call a moment to enqueue so the
+                # writes go out as one batch
+                await asyncio.sleep(self.flush_interval)
+
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+            if not self._pending:
+                self._wakeup.clear()
+
+            if batch:
+                await self._send_with_retry(batch)
+
+            if self._closing and not self._pending:
+                return
+
+    async def _send_with_retry(self, batch: list[dict[str, Any]]) -> None:
+        for attempt in range(self.max_retries + 1):
+            self._inflight = len(batch)
+            try:
+                failed = await self._send_batch(batch)
+            except Exception as e:
+                print(f"[WriteBehindQueue] Batch of {len(batch)} failed: {e}")
+                failed = batch
+
+            self.sent += len(batch) - len(failed)
+            if not failed:
+                self._inflight = 0
+                return
+            batch = failed
+            self._inflight = len(batch)
+
+            if attempt < self.max_retries:
+                delay = self.retry_backoff * (2**attempt)
+                await asyncio.sleep(delay * (0.5 + random.random()))
+
+        self._inflight = 0
+        self.dropped += len(batch)
+        print(f"[WriteBehindQueue] Giving up on {len(batch)} writes after {self.max_retries} retries")